@@ -22,7 +22,7 @@ if config.config_file_name is not None:
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 
-import_models_modules()  # Dynamically import all model modules to ensure they are registered with SQLModel.metadata
+import_models_modules()  # Import all registered model modules to ensure they are added to Base.metadata
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
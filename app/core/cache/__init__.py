@@ -0,0 +1,10 @@
+from app.core.cache import backend
+from app.core.cache import page
+
+CacheBackend = backend.CacheBackend
+LocalCacheBackend = backend.LocalCacheBackend
+CachedPage = page.CachedPage
+PageCache = page.PageCache
+page_cache = page.page_cache
+
+__all__ = ["CacheBackend", "LocalCacheBackend", "CachedPage", "PageCache", "page_cache"]
@@ -0,0 +1,75 @@
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+V = TypeVar("V")
+
+
+class CacheBackend(ABC, Generic[V]):
+    """
+    Storage of a response cache.
+
+    The methods are asynchronous so that a shared backend (e.g. Redis or Memcached, serializing the values)
+    can be plugged in for multi-process deployments; `LocalCacheBackend` is the in-process stand-in.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> V | None:
+        """Returns the value stored under the key, or None if it is missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: V, ttl: float) -> None:
+        """Stores a value under the key for `ttl` seconds."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Removes all stored values."""
+        pass
+
+
+@dataclass(slots=True)
+class _LocalCacheEntry(Generic[V]):
+    value: V
+    expires_at: float
+
+
+class LocalCacheBackend(CacheBackend[V]):
+    """An in-process LRU cache backend holding at most `max_size` values."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _LocalCacheEntry[V]] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.value
+
+    async def set(self, key: str, value: V, ttl: float) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = _LocalCacheEntry(value=value, expires_at=time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
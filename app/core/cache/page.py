@@ -0,0 +1,174 @@
+import hashlib
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterable
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.responses import StreamingResponse
+
+from app.core.cache.backend import CacheBackend
+from app.core.cache.backend import LocalCacheBackend
+from app.core.config.settings import app_config
+
+# Rendered pages differ for HTMX requests and their target, so shared caches must key them on these headers too
+PAGE_VARY_HEADER = "HX-Request, HX-Target"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """A rendered page as stored in the page cache."""
+
+    body: bytes
+    media_type: str
+    etag: str
+
+
+@dataclass(slots=True)
+class PageCacheStats:
+    """Counters describing how effective the page cache is."""
+
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PageCache:
+    """
+    A cache of rendered HTML pages for anonymous visitors.
+
+    - Pages are keyed by URL (with sorted query parameters) and, for HTMX requests, the targeted element,
+      so the fragments rendered for HTMX are cached separately from full pages.
+    - Every page gets a strong ETag, and a matching `If-None-Match` is answered with `304 Not Modified`.
+    - `invalidate()` drops every cached page; it is called whenever posts are added, deleted or published.
+      Keys carry a generation number, so a page rendered before an invalidation is never served after it.
+    - Requests of authenticated users are rendered fresh and never stored.
+    - Streamed pages are passed through as they are rendered and stored once completely sent; they get their
+      ETag from the cache on the next request.
+    """
+
+    def __init__(self, backend: CacheBackend[CachedPage], ttl: float) -> None:
+        self.backend = backend
+        self._ttl = ttl
+        self._generation = 0
+        self.stats = PageCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if pages are stored at all."""
+        return self._ttl > 0
+
+    async def fetch(self, request: Request, render: Callable[[], Awaitable[Response]]) -> Response:
+        """
+        Returns the cached page for the request, or renders it with `render` and caches it.
+
+        Args:
+            request (Request): The incoming page request.
+            render (Callable[[], Awaitable[Response]]): Renders the page; only `200` responses are cached.
+
+        Returns:
+            Response: The page with its ETag, or an empty `304` response if the client already has it.
+            Freshly rendered streaming responses are returned as they are.
+        """
+        cacheable = self.is_cacheable(request)
+        key = self.make_key(request, self._generation)
+
+        page = await self.backend.get(key) if cacheable else None
+        if page is not None:
+            self.stats.hits += 1
+            return self._respond(request, page)
+
+        response = await render()
+        if response.status_code != 200:  # noqa: PLR2004
+            return response
+
+        if isinstance(response, StreamingResponse):
+            if cacheable:
+                self.stats.misses += 1
+                response.body_iterator = self._store_streamed(key, response)
+            response.headers["vary"] = PAGE_VARY_HEADER
+            return response
+
+        page = self._make_page(bytes(response.body), response.media_type)
+        if cacheable:
+            self.stats.misses += 1
+            await self.backend.set(key, page, self._ttl)
+        return self._respond(request, page)
+
+    async def invalidate(self) -> None:
+        """Drops every cached page."""
+        self._generation += 1
+        self.stats.invalidations += 1
+        await self.backend.clear()
+
+    def is_cacheable(self, request: Request) -> bool:
+        """Returns True if the response to the request may be served from and stored in the cache."""
+        if not self.enabled or request.method != "GET":
+            return False
+        return not ("user" in request.scope and request.user.is_authenticated)
+
+    @staticmethod
+    def make_key(request: Request, generation: int = 0) -> str:
+        """Builds the cache key of a request from its URL, sorted query parameters and HTMX target."""
+        query = "&".join(f"{name}={value}" for name, value in sorted(request.query_params.multi_items()))
+        if getattr(request.state, "is_htmx_request", False):
+            variant = f"htmx#{getattr(request.state, 'htmx_target', None) or ''}"
+        else:
+            variant = "full"
+        url = request.url.replace(query="")
+        return f"page:{generation}:{variant}:{url}?{query}"
+
+    def _store_streamed(self, key: str, response: StreamingResponse) -> AsyncIterable[bytes]:
+        """Returns the streamed body of the response, storing the page once it was sent completely."""
+        body_iterator, charset, media_type = response.body_iterator, response.charset, response.media_type
+
+        async def pass_through() -> AsyncGenerator[bytes, None]:
+            chunks: list[bytes] = []
+            async for chunk in body_iterator:
+                data = chunk.encode(charset) if isinstance(chunk, str) else bytes(chunk)
+                chunks.append(data)
+                yield data
+            await self.backend.set(key, self._make_page(b"".join(chunks), media_type), self._ttl)
+
+        return pass_through()
+
+    @staticmethod
+    def _make_page(body: bytes, media_type: str | None) -> CachedPage:
+        """Builds a cached page with a strong ETag derived from its body."""
+        return CachedPage(
+            body=body, media_type=media_type or "text/html", etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        )
+
+    def _respond(self, request: Request, page: CachedPage) -> Response:
+        """Turns a cached page into a full response, or a `304` if the client's copy is current."""
+        headers = {"etag": page.etag, "vary": PAGE_VARY_HEADER}
+        if self._is_not_modified(request.headers, page.etag):
+            self.stats.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=page.body, media_type=page.media_type, headers=headers)
+
+    @staticmethod
+    def _is_not_modified(request_headers: Headers, etag: str) -> bool:
+        """Returns True if the request's `If-None-Match` header matches the ETag."""
+        if_none_match = request_headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags or "*" in tags
+
+
+# Create a global instance of the page cache that can be imported into other modules.
+page_cache = PageCache(
+    backend=LocalCacheBackend(max_size=app_config.PAGE_CACHE_SIZE),
+    ttl=app_config.PAGE_CACHE_TTL,
+)
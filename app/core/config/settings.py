@@ -30,7 +30,43 @@ class AppConfig:
             self.DB_ECHO = config("DB_ECHO", cast=bool, default=False)
             self.LOG_FILE = config("LOG_FILE", default="logs/app_{time}.log")
             self.LOG_LEVEL = config("LOG_LEVEL", default="INFO")
+            self.LOG_FORMAT = config("LOG_FORMAT", default="text")  # "text" or "json" (one JSON object per line)
+            self.LOG_INTERCEPT_CALLER = config("LOG_INTERCEPT_CALLER", default="record")  # Or "frame" (stack walk)
+            self.LOG_REQUESTS = config("LOG_REQUESTS", cast=bool, default=True)  # Log every completed request
+            self.LOG_QUEUE = config("LOG_QUEUE", cast=bool, default=True)  # Write logs from a background thread
+            self.LOG_QUEUE_SIZE = config("LOG_QUEUE_SIZE", cast=int, default=10000)  # Messages waiting per sink
+            self.LOG_QUEUE_BATCH_SIZE = config("LOG_QUEUE_BATCH_SIZE", cast=int, default=256)  # Messages per write
+            self.LOG_QUEUE_POLICY = config("LOG_QUEUE_POLICY", default="block")  # "block" or "drop" when full
             self.DATABASE_URL = config("DATABASE_URL")
+            self.DATABASE_REPLICA_URLS = config("DATABASE_REPLICA_URLS", cast=CommaSeparatedStrings, default="")
+            # "round_robin" or "least_connections"
+            self.DATABASE_REPLICA_STRATEGY = config("DATABASE_REPLICA_STRATEGY", default="round_robin")
+            self.DB_POOL_SIZE = config("DB_POOL_SIZE", cast=int, default=15)  # Connections kept open per worker
+            self.DB_MAX_OVERFLOW = config("DB_MAX_OVERFLOW", cast=int, default=5)  # Extra temporary connections
+            self.DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", cast=float, default=30)  # Seconds to wait for a connection
+            self.DB_POOL_RECYCLE = config("DB_POOL_RECYCLE", cast=int, default=1800)  # Seconds, -1 never recycles
+            self.DB_POOL_PRE_PING = config("DB_POOL_PRE_PING", cast=bool, default=False)
+            self.DB_POOL_USE_LIFO = config("DB_POOL_USE_LIFO", cast=bool, default=False)
+            self.DB_BULK_BATCH_SIZE = config("DB_BULK_BATCH_SIZE", cast=int, default=1000)  # Rows per bulk statement
+            self.SQLITE_TUNING = config("SQLITE_TUNING", cast=bool, default=True)  # WAL, one writer and a reader pool
+            self.SQLITE_BUSY_TIMEOUT = config("SQLITE_BUSY_TIMEOUT", cast=int, default=5000)  # Milliseconds
+            self.SQLITE_CACHE_SIZE = config("SQLITE_CACHE_SIZE", cast=int, default=-64000)  # KiB if negative
+            self.SQLITE_MMAP_SIZE = config("SQLITE_MMAP_SIZE", cast=int, default=268435456)  # Bytes, 0 disables mmap
+            self.REQUEST_METRICS = config("REQUEST_METRICS", cast=bool, default=True)  # Per-route latency and DB time
+            self.QUERY_PROFILING = config("QUERY_PROFILING", cast=bool, default=False)  # Server-Timing, N+1 warnings
+            self.QUERY_REPEAT_THRESHOLD = config("QUERY_REPEAT_THRESHOLD", cast=int, default=5)  # Same statement, N+1
+            self.AUTH_CACHE_TTL = config("AUTH_CACHE_TTL", cast=int, default=60)  # Seconds, 0 disables the cache
+            self.AUTH_CACHE_SIZE = config("AUTH_CACHE_SIZE", cast=int, default=1024)
+            self.TEMPLATE_CACHE_DIR = config("TEMPLATE_CACHE_DIR", default=".cache/templates")  # Empty disables it
+            self.TEMPLATE_PRECOMPILE = config("TEMPLATE_PRECOMPILE", cast=bool, default=True)
+            self.PAGE_CACHE_TTL = config("PAGE_CACHE_TTL", cast=int, default=300)  # Seconds, 0 disables the cache
+            self.PAGE_CACHE_SIZE = config("PAGE_CACHE_SIZE", cast=int, default=256)
+            self.ACCESS_TOKEN_EXPIRE_MINUTES = config("ACCESS_TOKEN_EXPIRE_MINUTES", cast=int, default=15)
+            self.PASSWORD_HASH_EXECUTOR = config("PASSWORD_HASH_EXECUTOR", default="thread")  # "thread" or "process"
+            self.PASSWORD_HASH_WORKERS = config("PASSWORD_HASH_WORKERS", cast=int, default=2)
+            self.PASSWORD_HASH_MAX_CONCURRENCY = config("PASSWORD_HASH_MAX_CONCURRENCY", cast=int, default=4)
+            self.BUILD_REVISION = config("BUILD_REVISION", default="")  # Empty reads it from the git working tree
+            self.BUILD_TIMESTAMP = config("BUILD_TIMESTAMP", default="")  # ISO 8601, empty uses the startup time
         except KeyError as e:
             missing_key = str(e).strip('"')
             raise AppError.MissingConfigurationError(
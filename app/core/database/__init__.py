@@ -1,28 +1,50 @@
 from importlib import import_module
-from pathlib import Path
 
 from app.core.database import base
 from app.core.database import health
+from app.core.database import pagination
 from app.core.database import repository
+from app.core.database import routing
 from app.core.database import session
 
 Base = base.Base
 Repository = repository.Repository
+LoaderOptions = repository.LoaderOptions
 get_session = session.get_session
+pin_to_primary = routing.pin_to_primary
 check_db_ready = health.check_db_ready
+CursorPage = pagination.CursorPage
+CursorStream = pagination.CursorStream
+encode_cursor = pagination.encode_cursor
+decode_cursor = pagination.decode_cursor
+
+
+# Modules defining ORM models, in dependency order. Register new model modules here so that Alembic and the tests
+# see their tables; an explicit list imports only what is needed instead of scanning the filesystem.
+MODEL_MODULES: tuple[str, ...] = (
+    "app.domain.user.model",
+    "app.domain.permission.model",
+    "app.domain.post.model",
+)
 
 
-# Automatically imports all model files to ensure Alembic can detect ORM models for migrations.
 def import_models_modules() -> None:
-    """Imports all Python modules with 'model' in their filename."""
-    # TODO: Improve the base path calculation. Using parent.parent.parent is not ideal.
-    for file in Path(__file__).parent.parent.parent.rglob("*model*.py"):
-        try:
-            import_module(
-                f"app.{'.'.join(file.relative_to(Path(__file__).parent.parent.parent).with_suffix('').parts)}"
-            )
-        except ModuleNotFoundError as e:
-            raise ModuleNotFoundError(f"Failed to import {file}. Error: {e}") from e
-
-
-__all__ = ["Base", "Repository", "get_session", "import_models_modules", "check_db_ready"]
+    """Imports all registered model modules, so that their tables are added to `Base.metadata`."""
+    for module in MODEL_MODULES:
+        import_module(module)
+
+
+__all__ = [
+    "Base",
+    "Repository",
+    "LoaderOptions",
+    "get_session",
+    "pin_to_primary",
+    "MODEL_MODULES",
+    "import_models_modules",
+    "check_db_ready",
+    "CursorPage",
+    "CursorStream",
+    "encode_cursor",
+    "decode_cursor",
+]
@@ -1,43 +1,96 @@
+from typing import Any
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.core.config.settings import app_config
+from app.core.database.pool import InstrumentedAsyncQueuePool
+from app.core.database.sqlite import register_sqlite_pragmas
+from app.core.database.sqlite import sqlite_pragmas
 
 
 class DatabaseEngineFactory:
     """Factory to create a database engine with appropriate settings based on the database type."""
 
     @staticmethod
-    def get_engine(database_url: str) -> AsyncEngine:
-        """Creates and returns an asynchronous database engine based on the database URL."""
+    def get_engine(database_url: str, read_only: bool = False) -> AsyncEngine:
+        """
+        Creates and returns an asynchronous database engine based on the database URL.
+
+        Args:
+            database_url (str): The URL of the database.
+            read_only (bool): Whether the engine only serves reads (e.g. for a read replica).
+        """
         if database_url.startswith("sqlite"):
-            return DatabaseEngineFactory._create_sqlite_engine()
+            return DatabaseEngineFactory._create_sqlite_engine(database_url, read_only)
         elif database_url.startswith("postgres"):
-            return DatabaseEngineFactory._create_postgres_engine()
+            return DatabaseEngineFactory._create_postgres_engine(database_url)
         else:
             raise NotImplementedError(f"Unsupported database URL: {database_url}")
 
     @staticmethod
-    def _create_sqlite_engine() -> AsyncEngine:
-        """Create an SQLite database engine."""
-        return create_async_engine(
-            url=app_config.DATABASE_URL,
+    def pool_options() -> dict[str, Any]:
+        """Return the connection pool settings from the configuration."""
+        return {
+            "poolclass": InstrumentedAsyncQueuePool,  # Records checkout wait times and timeouts
+            "pool_size": app_config.DB_POOL_SIZE,  # Number of connections to keep open
+            "max_overflow": app_config.DB_MAX_OVERFLOW,  # Additional temporary connections
+            "pool_timeout": app_config.DB_POOL_TIMEOUT,  # Seconds to wait for a connection
+            "pool_recycle": app_config.DB_POOL_RECYCLE,  # Seconds after which connections are replaced
+            "pool_pre_ping": app_config.DB_POOL_PRE_PING,  # Test connections on checkout
+            "pool_use_lifo": app_config.DB_POOL_USE_LIFO,  # Reuse the most recent connection, so idle ones expire
+        }
+
+    @staticmethod
+    def is_tuned_sqlite(database_url: str) -> bool:
+        """Return True if the URL is an SQLite file database using the tuning profile (`SQLITE_TUNING`)."""
+        return (
+            app_config.SQLITE_TUNING
+            and database_url.startswith("sqlite")
+            and make_url(database_url).database not in (None, "", ":memory:")
+        )
+
+    @staticmethod
+    def _create_sqlite_engine(database_url: str, read_only: bool = False) -> AsyncEngine:
+        """
+        Create an SQLite database engine; file databases use the configured connection pool.
+
+        With the tuning profile, connections get the WAL pragmas and a read-write engine keeps a single connection:
+        SQLite allows one writer at a time, so writes queue in the pool instead of failing on a locked database,
+        while reads go to a separate read-only engine (`replica_engines` below).
+        """
+        in_memory = make_url(database_url).database in (None, "", ":memory:")
+        # An in-memory database lives in a single connection, which SQLAlchemy keeps in a `StaticPool`
+        pool_options = {} if in_memory else DatabaseEngineFactory.pool_options()
+        tuned = DatabaseEngineFactory.is_tuned_sqlite(database_url)
+        if tuned and not read_only:
+            pool_options.update(pool_size=1, max_overflow=0)  # The single, serialized writer connection
+        engine = create_async_engine(
+            url=database_url,
             echo=app_config.DB_ECHO,  # Configurable SQL logging
             connect_args={"check_same_thread": False},  # Required for async SQLite
+            **pool_options,
         )
+        if tuned:
+            register_sqlite_pragmas(engine, sqlite_pragmas(read_only=read_only))
+        return engine
 
     @staticmethod
-    def _create_postgres_engine() -> AsyncEngine:
+    def _create_postgres_engine(database_url: str) -> AsyncEngine:
         """Create a PostgreSQL database engine with connection pooling."""
         return create_async_engine(
-            url=app_config.DATABASE_URL,
+            url=database_url,
             echo=app_config.DB_ECHO,  # Configurable SQL logging
-            pool_recycle=1800,  # Recycle connections every 30 minutes
-            pool_size=15,  # Number of connections to keep open
-            max_overflow=5,  # Allow 5 additional temporary connections
-            pool_timeout=30,  # Wait up to 30 seconds for a connection
+            **DatabaseEngineFactory.pool_options(),
         )
 
 
 # Create the engine dynamically based on the database URL
 engine = DatabaseEngineFactory.get_engine(app_config.DATABASE_URL)
+
+# Engines of the read replicas (each with its own pool), empty when none are configured
+replica_engines = [DatabaseEngineFactory.get_engine(url, read_only=True) for url in app_config.DATABASE_REPLICA_URLS]
+if not replica_engines and DatabaseEngineFactory.is_tuned_sqlite(app_config.DATABASE_URL):
+    # A tuned SQLite database is read through a pool of read-only connections, next to the single writer
+    replica_engines = [DatabaseEngineFactory.get_engine(app_config.DATABASE_URL, read_only=True)]
@@ -0,0 +1,80 @@
+import base64
+import binascii
+import json
+from collections.abc import AsyncGenerator
+from collections.abc import Callable
+from contextlib import aclosing
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from app.core.typedefs.exceptions import AppError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class CursorPage(Generic[T]):
+    """A single page of a keyset-paginated result, with the cursor pointing at the next page (if any)."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    @property
+    def has_more(self) -> bool:
+        """Returns True if there is another page after this one."""
+        return self.next_cursor is not None
+
+
+class CursorStream(Generic[T]):
+    """
+    A single page of a keyset-paginated result whose rows are fetched while it is iterated (once).
+
+    The rows must include one look-ahead row past the page, like the queries behind `CursorPage`;
+    `next_cursor` is known once iteration has finished, so templates can render it after looping over the rows.
+    """
+
+    def __init__(self, rows: AsyncGenerator[T, None], limit: int, cursor_of: Callable[[T], str]) -> None:
+        self._rows = rows
+        self._limit = limit
+        self._cursor_of = cursor_of
+        self.next_cursor: str | None = None
+
+    async def __aiter__(self) -> AsyncGenerator[T, None]:
+        count = 0
+        last_row: T | None = None
+        async with aclosing(self._rows) as rows:  # Closes the database cursor even if iteration stops early
+            async for row in rows:
+                if last_row is not None and count == self._limit:  # The look-ahead row: another page follows
+                    self.next_cursor = self._cursor_of(last_row)
+                    break
+                count += 1
+                last_row = row
+                yield row
+
+    @property
+    def has_more(self) -> bool:
+        """Returns True if there is another page after this one (only known after iterating)."""
+        return self.next_cursor is not None
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encodes the keyset values of the last row of a page into an opaque, URL-safe cursor token."""
+    payload = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> list[Any]:
+    """Decodes a cursor token created by `encode_cursor` back into its list of keyset values."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise AppError.InvalidCursorError(f"Malformed pagination cursor: {token!r}") from e
+
+    if not isinstance(values, list):
+        raise AppError.InvalidCursorError(f"Malformed pagination cursor: {token!r}")
+    return values
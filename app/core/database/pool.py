@@ -0,0 +1,75 @@
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import PoolProxiedConnection
+from sqlalchemy.pool import QueuePool
+
+from app.core.metrics import Histogram
+
+
+@dataclass
+class PoolMetrics:
+    """Counters of a connection pool that the pool itself does not keep."""
+
+    checkout_wait: Histogram = field(default_factory=Histogram)  # Seconds spent acquiring a connection
+    timeouts: int = 0  # Checkouts that gave up after `pool_timeout`
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    The default pool of async engines, recording how long checkouts wait for a connection and how often they
+    time out.
+
+    The wait includes opening a new connection (and the pre-ping, if enabled), which is what a request waits for.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started_at)
+
+    def recreate(self) -> QueuePool:
+        """Recreate the pool (e.g. after `engine.dispose()`), keeping the metrics collected so far."""
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedAsyncQueuePool):
+            pool.metrics = self.metrics
+        return pool
+
+
+def get_pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    """
+    Return the state of the connection pool of an engine.
+
+    Args:
+        engine (AsyncEngine): The engine whose pool is reported.
+
+    Returns:
+        dict[str, Any]: The pool class, its size, checked-out and overflow connections and, for instrumented pools,
+            the checkout wait histogram and timeout count.
+    """
+    pool = engine.pool
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),  # Negative while the pool has unopened capacity
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        status.update(timeouts=pool.metrics.timeouts, checkout_wait=pool.metrics.checkout_wait.snapshot())
+    return status
@@ -1,27 +1,171 @@
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncGenerator
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from itertools import batched
+from typing import Any
 from typing import Generic
 from typing import TypeVar
 
+from sqlalchemy import Insert
+from sqlalchemy import Select
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.core.config import app_config
+
 T = TypeVar("T")
+R = TypeVar("R")
+
+# Loader options (e.g. `joinedload`, `load_only`, `selectinload`) applied to a repository query.
+# Relationships are configured with `lazy="raise_on_sql"`, so anything a caller needs must be requested explicitly.
+LoaderOptions = Sequence[ExecutableOption]
 
 
 class Repository(ABC, Generic[T]):
     """Abstract base class for a generic repository pattern."""
 
+    session: AsyncSession
+    model: type[T]  # The mapped class, used by the bulk operations
+
+    async def add_many(self, rows: Sequence[Mapping[str, Any]], batch_size: int | None = None) -> list[int]:
+        """
+        Inserts many rows in batches and commits the transaction.
+
+        Each batch is sent as a multi-row `INSERT ... RETURNING`, without creating ORM objects, so
+        importing thousands of rows takes a few round-trips instead of one commit and refresh per entity.
+        Column defaults of the model apply to omitted keys.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): The column values of each row.
+            batch_size (int | None): Rows per statement; defaults to `DB_BULK_BATCH_SIZE`.
+
+        Returns:
+            list[int]: The primary keys of the inserted rows, in no particular order.
+        """
+        return await self._execute_bulk(insert(self.model), rows, batch_size)
+
+    async def upsert_many(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> list[int]:
+        """
+        Inserts many rows in batches, updating the rows they conflict with, and commits the transaction.
+
+        Uses the dialect's native `INSERT ... ON CONFLICT` (SQLite and PostgreSQL).
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): The column values of each row.
+            conflict_columns (Sequence[str]): The columns of the unique constraint or index that detects conflicts.
+            update_columns (Sequence[str] | None): The columns overwritten on conflict; None overwrites all the
+                columns given in the first row except the conflict columns, an empty sequence keeps existing rows.
+            batch_size (int | None): Rows per statement; defaults to `DB_BULK_BATCH_SIZE`.
+
+        Returns:
+            list[int]: The primary keys of the inserted and updated rows (not of the rows left unchanged on
+                conflict), in no particular order.
+
+        Raises:
+            NotImplementedError: If the database has no supported `ON CONFLICT` clause.
+        """
+        if not rows:
+            return []
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "sqlite":
+            statement: sqlite.Insert | postgresql.Insert = sqlite.insert(self.model)
+        elif dialect == "postgresql":
+            statement = postgresql.insert(self.model)
+        else:
+            raise NotImplementedError(f"Upserts are not supported for the '{dialect}' dialect")
+
+        if update_columns is None:
+            update_columns = [column for column in rows[0] if column not in conflict_columns]
+        if update_columns:
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=conflict_columns, set_={column: excluded[column] for column in update_columns}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=conflict_columns)
+        return await self._execute_bulk(statement, rows, batch_size)
+
+    async def _execute_bulk(
+        self, statement: Insert, rows: Sequence[Mapping[str, Any]], batch_size: int | None
+    ) -> list[int]:
+        """Executes an insert for the rows in batches, returning the primary keys, and commits the transaction."""
+        primary_key = class_mapper(self.model).primary_key[0]
+        ids: list[int] = []
+        for batch in batched(rows, batch_size or app_config.DB_BULK_BATCH_SIZE):
+            result = await self.session.execute(statement.returning(primary_key), list(batch))
+            ids.extend(result.scalars())
+        await self.session.commit()
+        return ids
+
+    async def _fetch_projection(self, query: Select[Any], row_factory: Callable[..., R]) -> list[R]:
+        """
+        Executes a column-projected query and builds one lightweight object per row.
+
+        Rows are read straight from `Result.mappings()` and passed to `row_factory` as keyword arguments,
+        so no ORM entities are hydrated and nothing is added to the session's identity map.
+
+        Args:
+            query (Select[Any]): A select of labelled columns (not ORM entities).
+            row_factory (Callable[..., R]): Called with each row's columns as keyword arguments, e.g. a slots dataclass.
+
+        Returns:
+            list[R]: One object per result row.
+        """
+        result = await self.session.execute(query)
+        return [row_factory(**row) for row in result.mappings()]
+
+    async def _stream_projection(
+        self, query: Select[Any], row_factory: Callable[..., R], close_session: bool = False
+    ) -> AsyncGenerator[R, None]:
+        """
+        Streams a column-projected query like `_fetch_projection`, yielding each object as its row arrives.
+
+        Rows are read through a server-side cursor (`AsyncSession.stream`), so the whole result is never
+        held in memory; the cursor is closed when the generator finishes or is closed early.
+
+        Args:
+            query (Select[Any]): A select of labelled columns (not ORM entities).
+            row_factory (Callable[..., R]): Called with each row's columns as keyword arguments.
+            close_session (bool): Also close the repository's session when the generator ends, for streams
+                that outlive the request scope owning the session (e.g. streamed responses).
+        """
+        try:
+            result = await self.session.stream(query)
+            try:
+                async for row in result.mappings():
+                    yield row_factory(**row)
+            finally:
+                await result.close()
+        finally:
+            if close_session:
+                await self.session.close()
+
     @abstractmethod
     async def add(self, entity: T) -> None:
         """Adds a new entity to the database and commits the transaction."""
         pass
 
     @abstractmethod
-    async def get(self, entity_id: int) -> T | None:
-        """Retrieves an entity by its ID from the database."""
+    async def get(self, entity_id: int, options: LoaderOptions = ()) -> T | None:
+        """Retrieves an entity by its ID from the database, applying the given loader options."""
         pass
 
     @abstractmethod
-    async def list(self) -> list[T]:
-        """Returns a list of entities from the database."""
+    async def list(self, options: LoaderOptions = ()) -> list[T]:
+        """Returns a list of entities from the database, applying the given loader options."""
         pass
 
     @abstractmethod
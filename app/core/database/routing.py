@@ -0,0 +1,112 @@
+import itertools
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy import Select
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import UOWTransaction
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import ClauseElement
+
+from app.core.typedefs.exceptions import AppError
+
+REPLICA_STRATEGIES = ("round_robin", "least_connections")
+
+
+class ReplicaSet:
+    """
+    The read replicas of a database and the strategy choosing one of them for a session.
+
+    - `round_robin` cycles through the replicas.
+    - `least_connections` picks the replica with the fewest checked-out connections in this worker.
+    """
+
+    def __init__(self, engines: Sequence[AsyncEngine], strategy: str = "round_robin") -> None:
+        """
+        Initialize the replica set.
+
+        Args:
+            engines (Sequence[AsyncEngine]): The engines of the replicas; empty disables replica routing.
+            strategy (str): "round_robin" or "least_connections".
+
+        Raises:
+            AppError.InvalidConfigurationError: If the strategy is unknown.
+        """
+        if strategy not in REPLICA_STRATEGIES:
+            raise AppError.InvalidConfigurationError(
+                f"Unknown replica strategy '{strategy}', expected one of: {', '.join(REPLICA_STRATEGIES)}."
+            )
+        self.engines = tuple(engines)
+        self.strategy = strategy
+        self._cycle = itertools.cycle(self.engines)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> AsyncEngine:
+        """Return the replica to read from."""
+        if self.strategy == "least_connections":
+            return min(self.engines, key=self._checked_out)
+        return next(self._cycle)
+
+    @staticmethod
+    def _checked_out(engine: AsyncEngine) -> int:
+        """Return the number of connections of the engine in use; pools without a size do not count them."""
+        pool = engine.pool
+        return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class RoutingSession(Session):
+    """
+    A session sending reads to a read replica and everything else to the primary database.
+
+    - `SELECT` statements (repository `get`, `list`, `get_by_username`, listings...) go to a replica, chosen once
+      per session so that its reads are consistent with each other.
+    - Flushes and other statements go to the primary. Once the session has written, it is pinned to the primary
+      until it is closed, so that it reads its own writes despite the replication lag.
+    - `SELECT ... FOR UPDATE` and sessions pinned with `pin_to_primary` read from the primary as well.
+    Without replicas, everything goes to the primary.
+
+    Use it as the `sync_session_class` of an `AsyncSession`.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.pinned_to_primary = False
+        self._replica: AsyncEngine | None = None
+
+    def get_bind(
+        self, mapper: Any = None, *, clause: ClauseElement | None = None, **kwargs: Any
+    ) -> Engine | Connection:
+        if self.replicas and not self.pinned_to_primary:
+            if isinstance(clause, Select) and clause._for_update_arg is None:
+                if self._replica is None:
+                    self._replica = self.replicas.choose()
+                return self._replica.sync_engine
+            if clause is not None:
+                self.pinned_to_primary = True  # e.g. an `update()` executed by the session
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        self.pinned_to_primary = False
+        self._replica = None
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_after_write(session: Session, flush_context: UOWTransaction) -> None:
+    """Read the session's own writes back from the primary."""
+    if isinstance(session, RoutingSession):
+        session.pinned_to_primary = True
+
+
+def pin_to_primary(session: AsyncSession) -> None:
+    """Send all further statements of a session to the primary, e.g. checks guarding a write."""
+    if isinstance(session.sync_session, RoutingSession):
+        session.sync_session.pinned_to_primary = True
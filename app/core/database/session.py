@@ -3,13 +3,19 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from app.core.config import app_config
 from app.core.database.engine import engine
+from app.core.database.engine import replica_engines
+from app.core.database.routing import ReplicaSet
+from app.core.database.routing import RoutingSession
 from app.core.logging import main_logger
 
-# Create an async session factory
+# Create an async session factory; reads are routed to the replicas, if any are configured
 async_session_maker = sessionmaker(  # type: ignore
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=ReplicaSet(replica_engines, strategy=app_config.DATABASE_REPLICA_STRATEGY),
     expire_on_commit=False,
 )
 
@@ -0,0 +1,53 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry
+
+from app.core.config.settings import app_config
+
+
+def sqlite_pragmas(read_only: bool = False) -> dict[str, Any]:
+    """
+    Return the pragmas of the SQLite tuning profile, in the order they must be applied.
+
+    - WAL lets readers run concurrently with the writer; it is persisted in the database file, so only the writer
+      sets it.
+    - `synchronous=NORMAL` is durable in WAL mode except for the last transactions on power loss.
+    - The busy timeout makes a connection wait for a lock instead of failing with "database is locked".
+
+    Args:
+        read_only (bool): Whether the connections only read; they refuse writes (`query_only`).
+
+    Returns:
+        dict[str, Any]: The pragma values by name.
+    """
+    pragmas: dict[str, Any] = {} if read_only else {"journal_mode": "WAL"}
+    pragmas.update(
+        synchronous="NORMAL",
+        busy_timeout=app_config.SQLITE_BUSY_TIMEOUT,
+        cache_size=app_config.SQLITE_CACHE_SIZE,
+        mmap_size=app_config.SQLITE_MMAP_SIZE,
+    )
+    if read_only:
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def register_sqlite_pragmas(engine: AsyncEngine, pragmas: dict[str, Any]) -> None:
+    """
+    Apply pragmas to every new connection of an SQLite engine.
+
+    Args:
+        engine (AsyncEngine): The engine whose connections are configured.
+        pragmas (dict[str, Any]): The pragma values by name, e.g. from `sqlite_pragmas`.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def apply_pragmas(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
@@ -5,6 +5,7 @@ from fastapi.responses import JSONResponse
 from starlette.datastructures import Headers
 from starlette.responses import Response
 
+from app.core.logging import main_logger
 from app.core.templates import renderer
 from app.core.typedefs.enums import ErrorResponseType
 
@@ -66,3 +67,22 @@ def prepare_log_message(message: str, exc: Exception, request: Request) -> str:
     error_name = type(exc).__name__
     error_message = str(exc)
     return f" {message} | Path: {request.url.path} | {error_name}: {error_message}"
+
+
+def log_error(level: str, message: str, exc: Exception, request: Request) -> None:
+    """
+    Log an error handled by an exception handler, with structured fields for the JSON log format.
+
+    The record carries the request context (handlers of unexpected errors run outside `RequestContextMiddleware`,
+    so it is bound again from `request.state`) and the error type and detail as `error`.
+
+    Args:
+        level (str): The log level, e.g. "WARNING".
+        message (str): A short description of the error, e.g. "Client error".
+        exc (Exception): The handled exception.
+        request (Request): The request that failed.
+    """
+    error = {"type": type(exc).__name__, "detail": str(exc)}
+    context = getattr(request.state, "log_context", None)
+    log = main_logger.bind(error=error, request=context) if context else main_logger.bind(error=error)
+    log.opt(depth=1).log(level, prepare_log_message(message, exc, request))  # Reported from the handler
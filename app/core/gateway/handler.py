@@ -4,13 +4,12 @@ from starlette.exceptions import HTTPException
 from starlette.responses import Response
 
 from app.core.gateway.error_response import create_error_response
-from app.core.gateway.error_response import prepare_log_message
-from app.core.logging import main_logger
+from app.core.gateway.error_response import log_error
 
 
 async def handle_internal_server_error(request: Request, exc: Exception) -> Response:
     """Handle unexpected internal server errors (HTTP 500)."""
-    main_logger.critical(prepare_log_message("Internal server error", exc, request))
+    log_error("CRITICAL", "Internal server error", exc, request)
 
     from sqlalchemy.exc import OperationalError
 
@@ -31,7 +30,7 @@ async def handle_validation_exceptions(request: Request, exc: Exception) -> Resp
     if not isinstance(exc, RequestValidationError):  # This should never happen but ensures type safety at runtime
         raise TypeError(f"Unexpected exception type: {type(exc)}. Expected RequestValidationError.") from exc
 
-    main_logger.info(prepare_log_message("Client error - validation exception", exc, request))
+    log_error("INFO", "Client error - validation exception", exc, request)
     return create_error_response(
         request,
         status_code=400,
@@ -46,21 +45,21 @@ async def handle_http_exceptions(request: Request, exc: Exception) -> Response:
         raise TypeError(f"Unexpected exception type: {type(exc)}. Expected HTTPException.") from exc
 
     if 400 <= exc.status_code < 500:  # Client error  # noqa: PLR2004
-        main_logger.warning(prepare_log_message("Client error", exc, request))
+        log_error("WARNING", "Client error", exc, request)
         return create_error_response(
             request,
             status_code=exc.status_code,
             detail=exc.detail or "A client error occurred.",
         )
     elif 500 <= exc.status_code < 600:  # Server error  # noqa: PLR2004
-        main_logger.error(prepare_log_message("Server error", exc, request))
+        log_error("ERROR", "Server error", exc, request)
         return create_error_response(
             request,
             status_code=exc.status_code,
             detail=exc.detail or "A server error occurred.",
         )
     else:  # Unhandled status codes
-        main_logger.critical(prepare_log_message("Unhandled status code", exc, request))
+        log_error("CRITICAL", "Unhandled status code", exc, request)
         return create_error_response(
             request,
             status_code=exc.status_code,
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+class LazyASGIApp:
+    """
+    An ASGI app that is only built when it is first needed, e.g. `app.mount("/admin", LazyASGIApp(build_admin))`.
+
+    Mounting it keeps heavy sub-applications (and their imports) out of worker startup.
+    - The app is built on the first request, or when its routes are first looked up (`url_for('admin:index')`);
+      `url_for('admin', path='/')` links to the mount without building it.
+    - Building is synchronous, so concurrent first requests cannot build the app twice.
+    """
+
+    def __init__(self, factory: Callable[[], ASGIApp]) -> None:
+        self.factory = factory
+        self._app: ASGIApp | None = None
+
+    @property
+    def is_built(self) -> bool:
+        """Return True if the app has been built."""
+        return self._app is not None
+
+    @property
+    def app(self) -> ASGIApp:
+        """Return the app, building it on first access."""
+        if self._app is None:
+            self._app = self.factory()
+        return self._app
+
+    @property
+    def routes(self) -> list[BaseRoute]:
+        """Return the routes of the app, so that `Mount` can resolve the URLs of named routes."""
+        routes: list[BaseRoute] = getattr(self.app, "routes", [])
+        return routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
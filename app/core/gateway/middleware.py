@@ -1,20 +1,42 @@
-from collections.abc import Awaitable
-from collections.abc import Callable
+import gzip
+import io
+import time
+from collections import Counter
+from collections.abc import Buffer
+from collections.abc import Sequence
+from http.cookies import SimpleCookie
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import GZipResponder
+from starlette.requests import HTTPConnection
 from starlette.requests import Request
-from starlette.responses import JSONResponse
-from starlette.responses import Response
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 
+from app.core.config.settings import app_config
 from app.core.gateway.error_response import create_error_response
 from app.core.logging import main_logger
+from app.core.logging.context import REQUEST_ID_HEADER
+from app.core.logging.context import RequestContext
+from app.core.logging.context import route_template
+from app.core.metrics.database import QueryStats
+from app.core.metrics.database import current_query_stats
+from app.core.metrics.requests import RequestMetrics
 
-# === TYPE ALIASES ===
-NextCallable = Callable[[Request], Awaitable[Response]]
+# NOTE: The middlewares below are pure ASGI middlewares rather than `BaseHTTPMiddleware` subclasses.
+# They only read the request scope and patch the `http.response.start` message, so they add no extra task,
+# no memory stream and no response body buffering to the request path.
 
 
 # === MIDDLEWARES ===
-class BasicCSRFMiddleware(BaseHTTPMiddleware):
+class BasicCSRFMiddleware:
     """Middleware to handle Cross-Site Request Forgery (CSRF) protection by checking for a CSRF flag in cookies."""
 
     # NOTE: Same-site cookies help prevent CSRF attacks, but additional protection is recommended.
@@ -23,50 +45,288 @@ class BasicCSRFMiddleware(BaseHTTPMiddleware):
     CSRF_COOKIE_VALUE = "1"  # Value of the cookie
     CSRF_MAX_AGE = 24 * 60 * 60  # Cookie expires in 24 hours
 
-    async def dispatch(self, request: Request, call_next: NextCallable) -> Response | JSONResponse:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.set_cookie_header = self._build_set_cookie_header()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Middleware behavior:
         - For non-GET requests, it verifies the presence of the CSRF flag in cookies.
         - If missing, responds with 403 Forbidden.
         - Adds the CSRF flag to outgoing responses if it was not previously set.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        csrf_flag = HTTPConnection(scope).cookies.get(self.CSRF_COOKIE_NAME)
+
         # Reject non-GET requests if the CSRF flag is not present in the cookies
-        if request.method != "GET" and not request.cookies.get("csrf_flag"):
+        if scope["method"] != "GET" and not csrf_flag:
+            request = Request(scope, receive)
             main_logger.warning(f"CSRF token missing or invalid for {request.method} request to {request.url.path}")
-            return create_error_response(request, status_code=403, detail="CSRF flag is missing or invalid.")
+            response = create_error_response(request, status_code=403, detail="CSRF flag is missing or invalid.")
+            await response(scope, receive, send)
+            return
 
         # Store the CSRF flag in the `request.state` object for further use downstream
-        request.state.csrf_flag = request.cookies.get("csrf_flag", None)
-        response: Response = await call_next(request)  # Pass the request to the next middleware or route handler
+        scope.setdefault("state", {})["csrf_flag"] = csrf_flag
+
+        if csrf_flag:
+            await self.app(scope, receive, send)
+            return
 
         # If the CSRF flag was not previously set, set it on the response
-        if not request.state.csrf_flag:
-            response.set_cookie(
-                key=self.CSRF_COOKIE_NAME,
-                value=self.CSRF_COOKIE_VALUE,
-                max_age=self.CSRF_MAX_AGE,
-                path="/",  # Cookie is valid for the entire domain
-                samesite="strict",  # Enforce strict SameSite policy to prevent CSRF attacks
-                secure=True,  # Ensure the cookie is only sent over HTTPS
-                httponly=True,  # Prevent JavaScript access to the cookie
-            )
-        return response
+        async def send_with_csrf_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("set-cookie", self.set_cookie_header)
+            await send(message)
+
+        await self.app(scope, receive, send_with_csrf_cookie)
 
+    def _build_set_cookie_header(self) -> str:
+        """Builds the `Set-Cookie` header value for the CSRF flag once, instead of on every response."""
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[self.CSRF_COOKIE_NAME] = self.CSRF_COOKIE_VALUE
+        cookie[self.CSRF_COOKIE_NAME]["max-age"] = self.CSRF_MAX_AGE
+        cookie[self.CSRF_COOKIE_NAME]["path"] = "/"  # Cookie is valid for the entire domain
+        cookie[self.CSRF_COOKIE_NAME]["samesite"] = "strict"  # Enforce strict SameSite policy to prevent CSRF attacks
+        cookie[self.CSRF_COOKIE_NAME]["secure"] = True  # Ensure the cookie is only sent over HTTPS
+        cookie[self.CSRF_COOKIE_NAME]["httponly"] = True  # Prevent JavaScript access to the cookie
+        return cookie.output(header="").strip()
 
-class AdvancedCSRFMiddleware(BaseHTTPMiddleware):
+
+class AdvancedCSRFMiddleware:
     """Middleware for handling advanced CSRF protection in HTTP requests."""
 
     ...
 
 
-class HtmxStateMiddleware(BaseHTTPMiddleware):
+class HtmxStateMiddleware:
     """
     Middleware to check if a request is an HTMX request and set `request.state.is_htmx_request` accordingly.
     - If the request contains the header "hx-request" with value "true", it is marked as an HTMX request.
-    - Adds `is_htmx_request` (bool) to `request.state` for downstream usage.
+    - History restore requests ("hx-history-restore-request") need the full page, so they are not marked.
+    - Adds `is_htmx_request` (bool) and `htmx_target` (the id of the targeted element, or None) to `request.state`
+      for downstream usage.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            is_htmx_request = (
+                headers.get("hx-request") == "true" and headers.get("hx-history-restore-request") != "true"
+            )
+            state = scope.setdefault("state", {})
+            state["is_htmx_request"] = is_htmx_request
+            state["htmx_target"] = (headers.get("hx-target") or None) if is_htmx_request else None
+        await self.app(scope, receive, send)
+
+
+class RequestContextMiddleware:
+    """
+    Middleware attaching the context of the request (`RequestContext`) to every log record emitted while handling it.
+
+    - The context is bound once with `contextualize`, so records of the application, the database layer and stdlib
+      loggers routed to Loguru all carry it (the JSON log format writes it as `request`).
+    - It is also stored as `request.state.log_context`, for the exception handlers, which run outside this middleware.
+    - The request id is taken from an incoming `X-Request-ID` header or generated, and sent back in the response,
+      so that a request can be followed across proxies and workers.
+    - With `LOG_REQUESTS`, each completed request is logged with its status code and latency.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = RequestContext(scope)
+        scope.setdefault("state", {})["log_context"] = context
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                context.status_code = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, context.request_id)
+            await send(message)
+
+        with main_logger.contextualize(request=context):
+            try:
+                await self.app(scope, receive, send_with_request_id)
+            finally:
+                if app_config.LOG_REQUESTS:
+                    status_code = context.status_code or 500  # No response started: the error is answered outside
+                    main_logger.info(
+                        "{} {} {} ({:.1f} ms)", context.method, context.path, status_code, context.latency_ms
+                    )
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware recording each request in `RequestMetrics`: its status class, latency and database time, by route
+    template and method.
+
+    - The latency runs until the response is fully sent.
+    - The database time and statement count come from the engines instrumented with `instrument_engine`, which
+      add to the `QueryStats` of the request set here.
+    - A request failing without a response is recorded as a 500, the status the client receives.
     """
 
-    async def dispatch(self, request: Request, call_next: NextCallable) -> Response:
-        request.state.is_htmx_request = request.headers.get("hx-request") == "true"
-        response = await call_next(request)
-        return response
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = QueryStats(parent=current_query_stats.get())
+        token = current_query_stats.set(stats)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            latency = time.perf_counter() - started_at
+            current_query_stats.reset(token)
+            self.metrics.observe(route_template(scope), scope["method"], status_code, latency, stats)
+
+
+class QueryProfilerMiddleware:
+    """
+    Middleware profiling the statements executed by each request, for development (`QUERY_PROFILING`).
+
+    - The response gets a `Server-Timing` header with the database time and statement count (`db`) and the time
+      until the response started (`app`), which the browsers' developer tools display.
+    - Statements of the same shape executed `repeat_threshold` times or more are logged as possible N+1 queries,
+      e.g. a relationship loaded once per listed item.
+    Statements come from the engines instrumented with `instrument_engine`.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 5) -> None:
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(statements=Counter(), parent=current_query_stats.get())
+        token = current_query_stats.set(stats)
+        started_at = time.perf_counter()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                server_timing = self.server_timing(stats, time.perf_counter() - started_at)
+                MutableHeaders(scope=message).append("server-timing", server_timing)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_query_stats.reset(token)
+            route = route_template(scope) or scope["path"]
+            main_logger.debug(
+                "{} {}: {} queries in {:.1f} ms", scope["method"], route, stats.queries, stats.duration * 1000
+            )
+            for shape, count in stats.repeated_statements(self.repeat_threshold):
+                main_logger.warning(
+                    "Possible N+1 query in {} {}: {} executions of: {}", scope["method"], route, count, shape
+                )
+
+    @staticmethod
+    def server_timing(stats: QueryStats, elapsed: float) -> str:
+        """Return the `Server-Timing` header value of the database time so far and the elapsed time, in ms."""
+        return f'db;dur={stats.duration * 1000:.3f};desc="{stats.queries} queries", app;dur={elapsed * 1000:.3f}'
+
+
+class StreamingGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that sends each chunk of a streamed response as soon as it is produced.
+
+    Starlette's `GZipMiddleware` keeps streamed chunks in the compressor until it has gathered enough data,
+    so a streamed `<head>` reaches the client only with the rest of the page. Here each chunk of a streamed
+    response is sync-flushed out of the compressor; single-message responses are compressed as before.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _StreamingGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class _FlushingGzipFile(gzip.GzipFile):
+    """A GzipFile that, once `flush_writes` is set, pushes every write through the compressor (Z_SYNC_FLUSH)."""
+
+    flush_writes = False
+
+    def write(self, data: Buffer) -> int:
+        written = super().write(data)
+        if self.flush_writes:
+            self.flush()
+        return written
+
+
+class _StreamingGZipResponder(GZipResponder):
+    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int = 9) -> None:
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        # Replace the compressor (and the buffer it already wrote the gzip header to)
+        self.gzip_buffer = io.BytesIO()
+        self.flushing_gzip_file = _FlushingGzipFile(mode="wb", fileobj=self.gzip_buffer, compresslevel=compresslevel)
+        self.gzip_file = self.flushing_gzip_file
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.body" and message.get("more_body", False):
+            self.flushing_gzip_file.flush_writes = True
+        await super().send_with_gzip(message)
+
+
+class PathBypassMiddleware:
+    """
+    Middleware that sends requests for the given path prefixes straight to the application's router.
+
+    Every middleware added before this one (i.e. wrapped by it) is skipped for those paths, so static assets
+    and health checks are served without session decoding, authentication or compression.
+    - Exception handlers still apply: bypassed requests pass through an `ExceptionMiddleware`.
+    - A prefix matches the path itself and everything below it (`/health` matches `/health/db`, not `/healthy`).
+    """
+
+    def __init__(self, app: ASGIApp, prefixes: Sequence[str]) -> None:
+        self.app = app
+        self.prefixes = tuple(prefix.rstrip("/") for prefix in prefixes)
+        self._bypass_app: ASGIApp | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.is_bypassed(scope["path"]):
+            await self._get_bypass_app(scope["app"])(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def is_bypassed(self, path: str) -> bool:
+        """Return True if the path is one of the prefixes or lies below one of them."""
+        return any(path == prefix or path.startswith(f"{prefix}/") for prefix in self.prefixes)
+
+    def _get_bypass_app(self, app: Starlette) -> ASGIApp:
+        """Build the router wrapped in the application's exception handlers once, on the first bypassed request."""
+        if self._bypass_app is None:
+            # 500/Exception handlers belong to the outermost ServerErrorMiddleware, which still wraps this middleware
+            handlers = {key: handler for key, handler in app.exception_handlers.items() if key not in (500, Exception)}
+            self._bypass_app = ExceptionMiddleware(app.router, handlers=handlers, debug=app.debug)
+        return self._bypass_app
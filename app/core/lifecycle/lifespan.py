@@ -1,22 +1,36 @@
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.core.config import app_config
 from app.core.database import check_db_ready
 from app.core.database.engine import engine
+from app.core.database.engine import replica_engines
 from app.core.logging import main_logger
+from app.core.logging.logger import setup_logging
+from app.core.templates import template_manager
 from app.core.utils import log_route_details
+from app.services.auth.security import password_hasher
 
 
 @asynccontextmanager
 async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manages application startup and shutdown lifecycle."""
+    setup_logging()  # Console and file handlers, queued with `LOG_QUEUE`
     try:
         main_logger.info("Starting application...")
+        started_at = time.perf_counter()
         await check_db_ready()
-        main_logger.info("Database is ready.")
+        main_logger.info(f"Database is ready ({(time.perf_counter() - started_at) * 1000:.1f} ms).")
+        if app_config.TEMPLATE_PRECOMPILE:
+            precompile_started_at = time.perf_counter()
+            template_count = template_manager.precompile()
+            precompile_ms = (time.perf_counter() - precompile_started_at) * 1000
+            main_logger.info(f"Precompiled {template_count} templates ({precompile_ms:.1f} ms).")
         log_route_details(app.routes)  # Log registered routes
+        main_logger.info(f"Application started in {(time.perf_counter() - started_at) * 1000:.1f} ms.")
         yield  # Application successfully started
     except Exception as e:
         main_logger.critical(f"Application startup failed: {type(e).__name__}: {str(e)}")
@@ -25,6 +39,9 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         try:
             main_logger.info("Shutting down application...")
             await engine.dispose()  # Close database connections
+            for replica_engine in replica_engines:
+                await replica_engine.dispose()
             main_logger.info("Database connections closed successfully.")
+            password_hasher.shutdown()  # Stop the password hashing worker pool
         except Exception as e:
             main_logger.error(f"Shutdown cleanup failed: {type(e).__name__}: {str(e)}")
@@ -0,0 +1,77 @@
+import time
+import uuid
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.types import Scope
+
+REQUEST_ID_HEADER = "x-request-id"
+
+
+def route_template(scope: Scope) -> str | None:
+    """
+    Return the path template of the route matched for a request (e.g. `/api/blog/{post_id}`), if any.
+
+    Requests handled by a mounted application (static files, the admin interface) get the mount's template,
+    e.g. `/static/{path:path}`.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return str(route.path)
+    if "app_root_path" in scope:  # Set by the `Mount` that matched
+        return f"{scope['root_path'].removeprefix(scope['app_root_path'])}/{{path:path}}"
+    return None
+
+
+class RequestContext:
+    """
+    The context of the request being handled, attached to its log records by `RequestContextMiddleware`.
+
+    It keeps a reference to the request scope rather than copies, so the route (known once the request is routed),
+    the user (once authenticated) and the latency are read when a record is formatted.
+    """
+
+    __slots__ = ("request_id", "method", "path", "status_code", "started_at", "_scope")
+
+    def __init__(self, scope: Scope) -> None:
+        """
+        Initialize the context of an HTTP request.
+
+        Args:
+            scope (Scope): The ASGI scope of the request; an incoming `X-Request-ID` header is reused as the id.
+        """
+        self.request_id: str = Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.status_code: int | None = None
+        self.started_at = time.perf_counter()
+        self._scope = scope
+
+    @property
+    def route(self) -> str | None:
+        return route_template(self._scope)
+
+    @property
+    def user(self) -> str | None:
+        """The name of the authenticated user, if any."""
+        user = self._scope.get("user")
+        return user.display_name if user is not None and user.is_authenticated else None
+
+    @property
+    def latency_ms(self) -> float:
+        """Milliseconds since the request was received."""
+        return round((time.perf_counter() - self.started_at) * 1000, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "user": self.user,
+            "status_code": self.status_code,
+            "latency_ms": self.latency_ms,
+        }
+
+    def __str__(self) -> str:
+        return self.request_id
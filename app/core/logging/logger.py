@@ -1,75 +1,247 @@
 import inspect
+import json
 import logging
 import sys
+import threading
+import traceback
+from typing import TYPE_CHECKING
+from typing import Any
 
 from loguru import logger
 
 from app.core.config.settings import app_config
+from app.core.logging.context import RequestContext
+from app.core.logging.sinks import QueuedSink
+from app.core.typedefs.exceptions import AppError
+
+if TYPE_CHECKING:
+    from loguru import Record
+
+
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}"
+LOG_FORMATS = ("text", "json")
+INTERCEPT_CALLERS = ("record", "frame")
+
+# The `extra` key holding the JSON line of a record, see `format_json`
+SERIALIZED_KEY = "serialized"
+
+# The `extra` key marking the batches written by the file queue's writer thread
+QUEUED_BATCH_KEY = "queued_batch"
 
 
 def configure_loguru() -> None:
-    """Configure Loguru's logger to handle both console and file logging."""
-    logger.remove()
+    """
+    Configure Loguru's logger to handle both console and file logging.
+
+    `LOG_FORMAT=json` writes one JSON object per line (see `format_json`) to both, instead of text lines.
+
+    With `LOG_QUEUE` enabled, records are formatted on the calling thread and handed to `QueuedSink`s, whose
+    writer threads do the console and file I/O in batches. The batches of the file queue go through a raw file
+    handler, which keeps Loguru's rotation, retention and compression.
+    Every handler uses `LOG_LEVEL`, so records below it are discarded by Loguru before any processing;
+    pass arguments instead of f-strings (`logger.debug("Token rejected: {}", e)`) to skip formatting as well.
+    """
+    if app_config.LOG_FORMAT not in LOG_FORMATS:
+        raise AppError.InvalidConfigurationError(
+            f"Unknown log format '{app_config.LOG_FORMAT}', expected one of: {', '.join(LOG_FORMATS)}."
+        )
+    json_lines = app_config.LOG_FORMAT == "json"
+    console_format = format_json if json_lines else CONSOLE_FORMAT
+    file_format = format_json if json_lines else FILE_FORMAT
 
-    # Log to stdout (console)
+    logger.remove()
+    file_options: dict[str, Any] = {
+        "rotation": "00:00",  # New file is created each day at 00:00
+        # "rotation": "10 MB",  # Automatically rotate the file when it exceeds 10 MB
+        "retention": "7 days",  # Keep log files for 7 days before deleting them
+        "compression": "zip",  # Compress old log files to save space
+        "level": app_config.LOG_LEVEL,
+    }
+
+    if not app_config.LOG_QUEUE:
+        logger.add(sys.stdout, format=console_format, level=app_config.LOG_LEVEL, colorize=not json_lines)  # Stdout
+        logger.add(app_config.LOG_FILE, format=file_format, **file_options)  # Log to a file
+        return
+
+    def write_console(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def write_file(text: str) -> None:
+        logger.bind(**{QUEUED_BATCH_KEY: True}).opt(raw=True).log(app_config.LOG_LEVEL, text)
+
+    queue_options: dict[str, Any] = {
+        "max_size": app_config.LOG_QUEUE_SIZE,
+        "batch_size": app_config.LOG_QUEUE_BATCH_SIZE,
+        "policy": app_config.LOG_QUEUE_POLICY,
+    }
     logger.add(
-        sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>",
+        QueuedSink(write_console, **queue_options),
+        format=console_format,
         level=app_config.LOG_LEVEL,
-        colorize=True,
+        colorize=not json_lines,
+        filter=_is_not_queued_batch,
     )
-
-    # Log to a file
     logger.add(
-        app_config.LOG_FILE,  # Path to the log file
-        rotation="00:00",  # New file is created each day at 00:00
-        # rotation="10 MB",  # Automatically rotate the file when it exceeds 10 MB
-        retention="7 days",  # Keep log files for 7 days before deleting them
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}",
-        compression="zip",  # Compress old log files to save space
+        QueuedSink(write_file, **queue_options),
+        format=file_format,
         level=app_config.LOG_LEVEL,
+        filter=_is_not_queued_batch,
     )
+    # Added last so that it is removed last: stopping the queues above writes their pending batches through it
+    logger.add(app_config.LOG_FILE, format="{message}", filter=_is_queued_batch, **file_options)
+
+
+def format_json(record: "Record") -> str:
+    """
+    Serialize a record into a JSON line, the format of `LOG_FORMAT=json`.
+
+    The line holds the time, level, message and origin of the record, the context of the request being handled
+    (`request`: id, method, path, route template, user identity, status code and latency so far), the other bound
+    values (`extra`) and the traceback of the exception, if any.
+
+    Args:
+        record (Record): The Loguru record.
+
+    Returns:
+        str: The Loguru format string of the line; the JSON itself is stored in the record's `extra`.
+    """
+    extra = record["extra"]
+    entry: dict[str, Any] = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "process": record["process"].id,
+    }
+    context = extra.get("request")
+    if isinstance(context, RequestContext):
+        entry["request"] = context.as_dict()
+    fields = {key: value for key, value in extra.items() if key not in ("request", SERIALIZED_KEY)}
+    if fields:
+        entry["extra"] = fields
+    if record["exception"] is not None:
+        exc_type, exc_value, exc_traceback = record["exception"]
+        entry["exception"] = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+    # Returned through `extra` since Loguru parses the returned string as a format (braces in the JSON would break it)
+    extra[SERIALIZED_KEY] = json.dumps(entry, default=str)
+    return "{extra[" + SERIALIZED_KEY + "]}\n"
+
+
+def _is_queued_batch(record: "Record") -> bool:
+    return QUEUED_BATCH_KEY in record["extra"]
+
+
+def _is_not_queued_batch(record: "Record") -> bool:
+    return QUEUED_BATCH_KEY not in record["extra"]
 
 
 class InterceptHandler(logging.Handler):
-    """A handler that routes Python's standard logging messages to Loguru."""
+    """
+    A handler that routes Python's standard logging messages to Loguru.
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """Emit a log message by forwarding it to Loguru.
-        This implementation is based on the Loguru documentation on integrating
-        Loguru with the standard logging module. For details, refer to:
-        https://github.com/Delgan/loguru#entirely-compatible-with-standard-logging
+    - Standard level names are resolved to Loguru levels once and cached.
+    - The origin of a message (logger name, function and line) is taken from the stdlib record with
+      `caller="record"`; the logging module has already resolved it, so nothing is looked up again.
+      `caller="frame"` walks the stack for the calling frame instead, like Loguru's documented recipe:
+      https://github.com/Delgan/loguru#entirely-compatible-with-standard-logging
+    """
+
+    def __init__(self, caller: str = "record", level: int = logging.NOTSET) -> None:
         """
+        Initialize the handler.
+
+        Args:
+            caller (str): "record" or "frame", how the origin of a message is resolved.
+            level (int): The minimum level of the records handled.
+
+        Raises:
+            AppError.InvalidConfigurationError: If the caller strategy is unknown.
+        """
+        if caller not in INTERCEPT_CALLERS:
+            raise AppError.InvalidConfigurationError(
+                f"Unknown caller strategy '{caller}', expected one of: {', '.join(INTERCEPT_CALLERS)}."
+            )
+        super().__init__(level)
+        self.walk_frames = caller == "frame"
+        self._levels: dict[str, str | int] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a log message by forwarding it to Loguru."""
+        level = self._levels.get(record.levelname)
+        if level is None:
+            level = self._levels[record.levelname] = self._resolve_level(record)
+
+        if self.walk_frames:
+            # Find the caller's frame (the first one outside the logging module) to preserve the logging context
+            frame, depth = inspect.currentframe(), 0
+            while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+                frame = frame.f_back
+                depth += 1
+            logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+            return
+
+        _bridged.record = record  # Read back by `_apply_stdlib_origin` while Loguru creates its record
+        bridge = _bridge_logger.opt(exception=record.exc_info) if record.exc_info else _bridge_logger
+        bridge.log(level, record.getMessage())
+
+    @staticmethod
+    def _resolve_level(record: logging.LogRecord) -> str | int:
+        """Map a standard logging level to the Loguru level of the same name, or its number for unknown levels."""
         try:
-            level: str | int = logger.level(record.levelname).name  # Map standard logging level to Loguru level
+            return logger.level(record.levelname).name
         except ValueError:
-            level = record.levelno  # Fallback for unknown levels
+            return record.levelno
 
-        # Find the caller’s frame to preserve accurate logging context
-        frame, depth = inspect.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
-            frame = frame.f_back
-            depth += 1
 
-        # Log the message with depth and exception info if any
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+def _apply_stdlib_origin(record: "Record") -> None:
+    """Give a Loguru record the origin of the stdlib record being bridged on this thread."""
+    stdlib_record: logging.LogRecord = _bridged.record
+    record["name"] = stdlib_record.name
+    record["module"] = stdlib_record.module
+    record["function"] = stdlib_record.funcName
+    record["line"] = stdlib_record.lineno
+
+
+def skip_stdlib_record_details() -> None:
+    """Stop the logging module from looking up the thread, process and asyncio task of each record (Loguru's own)."""
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # type: ignore[attr-defined]  # Python 3.12+, missing from the stubs
+
+
+# The stdlib record being bridged on each thread, and the Loguru logger taking its origin from it
+_bridged = threading.local()
+_bridge_logger = logger.patch(_apply_stdlib_origin)
 
 
 def setup_logging() -> None:
-    """Sets up application-wide logging configuration using Loguru."""
+    """
+    Sets up application-wide logging configuration using Loguru.
+
+    Standard loggers are set to `LOG_LEVEL`, so that records below it are discarded before they are created.
+    """
     configure_loguru()
 
     # Redirect standard logging to Loguru
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
-    logging.root.handlers = [InterceptHandler()]  # Replace existing root handlers with the custom handler
+    skip_stdlib_record_details()
+    levelno = logger.level(app_config.LOG_LEVEL).no
+    handler = InterceptHandler(caller=app_config.LOG_INTERCEPT_CALLER, level=levelno)
+    logging.basicConfig(handlers=[handler], level=levelno, force=True)
     logger.info("Loguru configured and handling all logs.")
 
     # Update all existing loggers in the application to use Loguru
     for name in logging.root.manager.loggerDict:
         logger_obj = logging.getLogger(name)
-        logger_obj.handlers = [InterceptHandler()]
+        logger_obj.handlers = [handler]
         logger_obj.propagate = False
 
 
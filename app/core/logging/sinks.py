@@ -0,0 +1,88 @@
+import queue
+import sys
+import threading
+import traceback
+from collections.abc import Callable
+
+from app.core.typedefs.exceptions import AppError
+
+QUEUE_POLICIES = ("block", "drop")
+
+
+class QueuedSink:
+    """
+    A Loguru sink handing formatted messages to a background thread, which writes them in batches.
+
+    Logging a message costs an enqueue on the calling thread (e.g. the event loop); the I/O of the wrapped
+    sink (console writes, file writes and rotation) happens on the writer thread, one call per batch.
+    - The queue is bounded. When it is full, the `block` policy makes callers wait for the writer
+      (backpressure, nothing is lost) and the `drop` policy discards the message; the number of dropped
+      messages is written with the next batch.
+    - `stop()` (called by Loguru when the handler is removed, e.g. at exit) writes the queued messages first.
+    """
+
+    def __init__(
+        self, write: Callable[[str], None], max_size: int = 10000, batch_size: int = 256, policy: str = "block"
+    ) -> None:
+        """
+        Initialize the sink and start its writer thread.
+
+        Args:
+            write (Callable[[str], None]): Writes a batch of formatted messages, joined into one string.
+            max_size (int): The maximum number of queued messages.
+            batch_size (int): The maximum number of messages per write.
+            policy (str): "block" or "drop", what to do when the queue is full.
+
+        Raises:
+            AppError.InvalidConfigurationError: If the policy is unknown.
+        """
+        if policy not in QUEUE_POLICIES:
+            raise AppError.InvalidConfigurationError(
+                f"Unknown log queue policy '{policy}', expected one of: {', '.join(QUEUE_POLICIES)}."
+            )
+        self._write = write
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_size)
+        self._batch_size = batch_size
+        self._block = policy == "block"
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Queue a formatted message (called by Loguru for every record accepted by the handler)."""
+        if self._block:
+            self._queue.put(message)
+            return
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def stop(self) -> None:
+        """Write the queued messages and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Write the queued messages in batches until `stop()` is called."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            messages = [message for message in batch if message is not None]
+            with self._dropped_lock:
+                dropped, self._dropped = self._dropped, 0
+            if dropped:
+                messages.append(f"{dropped} log messages were dropped: the log queue was full.\n")
+            if messages:
+                try:
+                    self._write("".join(messages))
+                except Exception:  # A failing sink must not stop the writer thread
+                    traceback.print_exc(file=sys.stderr)
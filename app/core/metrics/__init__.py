@@ -0,0 +1,23 @@
+from app.core.metrics import database
+from app.core.metrics import histogram
+from app.core.metrics import requests
+
+Histogram = histogram.Histogram
+DEFAULT_LATENCY_BUCKETS = histogram.DEFAULT_LATENCY_BUCKETS
+QueryStats = database.QueryStats
+current_query_stats = database.current_query_stats
+instrument_engine = database.instrument_engine
+statement_shape = database.statement_shape
+RequestMetrics = requests.RequestMetrics
+request_metrics = requests.request_metrics
+
+__all__ = [
+    "Histogram",
+    "DEFAULT_LATENCY_BUCKETS",
+    "QueryStats",
+    "current_query_stats",
+    "instrument_engine",
+    "statement_shape",
+    "RequestMetrics",
+    "request_metrics",
+]
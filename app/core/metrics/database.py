@@ -0,0 +1,107 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# The `Connection.info` key of the start times of the statements being executed
+_STARTED_AT_KEY = "query_started_at"
+
+
+# Lists of bound parameters (`IN (?, ?, ?)`, multi-row `VALUES (?, ?), (?, ?)`) collapse to one, so that statements
+# differing only by the number of values have the same shape
+_PARAMETER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+))*\s*\)")
+_REPEATED_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """
+    The statements executed while handling one request (or any other unit of work) and the time the database took
+    to run them.
+
+    - With `statements` set (query profiling), executions are also counted by statement shape (see
+      `statement_shape`), which reveals N+1 queries: the same statement repeated for each item of a list.
+    - Statements are also recorded in the `parent` stats, e.g. a test's query budget around several requests.
+    """
+
+    queries: int = 0
+    duration: float = 0.0  # Seconds
+    statements: Counter[str] | None = None  # Executions by statement shape, when profiled
+    parent: "QueryStats | None" = None
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Return the statement shapes executed at least `threshold` times, most repeated first."""
+        if self.statements is None:
+            return []
+        return [(shape, count) for shape, count in self.statements.most_common() if count >= threshold]
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Return the shape of an SQL statement: its text with whitespace normalized and lists of parameters collapsed.
+
+    Statements are sent with bound parameters, so executions of the same query with other values have the same shape.
+    """
+    shape = _PARAMETER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+    return _REPEATED_LIST.sub("(?)", shape)
+
+
+# The stats of the request being handled; set by `RequestMetricsMiddleware` and `QueryProfilerMiddleware`,
+# None outside requests
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Record the statements executed by an engine, and their duration, in the stats of the current request.
+
+    Listeners are attached once per engine, so calling this again (e.g. for each new application) has no effect.
+    They run in the task of the request, where `current_query_stats` is visible.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+    """
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+# The cursor listeners also receive the parameters, execution context and `executemany` flag
+def _before_cursor_execute(conn: Connection, *args: Any) -> None:
+    conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, cursor: Any, statement: str, *args: Any) -> None:
+    _record_statement(conn, statement)
+
+
+def _handle_error(exception_context: ExceptionContext) -> None:
+    """Record a statement that failed (`after_cursor_execute` is not called for it)."""
+    if exception_context.execution_context is not None and exception_context.connection is not None:
+        _record_statement(exception_context.connection, exception_context.statement or "")
+
+
+def _record_statement(conn: Connection, statement: str) -> None:
+    started_at_stack = conn.info.get(_STARTED_AT_KEY)
+    if not started_at_stack:  # e.g. an error raised before the statement was sent
+        return
+    duration = time.perf_counter() - started_at_stack.pop()
+    stats = current_query_stats.get()
+    shape: str | None = None
+    while stats is not None:
+        stats.queries += 1
+        stats.duration += duration
+        if stats.statements is not None:
+            shape = shape or statement_shape(statement)
+            stats.statements[shape] += 1
+        stats = stats.parent
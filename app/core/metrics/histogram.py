@@ -0,0 +1,47 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+
+# Upper bounds (in seconds) suited to latencies from sub-millisecond lookups to slow requests
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Histogram:
+    """
+    A bucketed histogram of observed values, e.g. latencies in seconds.
+
+    Observing a value is a binary search and an increment, so it is cheap enough for every request.
+    Not thread-safe: observe values from the event loop thread only.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets (Sequence[float]): The upper bounds of the buckets; values above the largest one are only
+                counted in the implicit `+Inf` bucket.
+        """
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.bucket_counts: list[int] = [0] * (len(self.buckets) + 1)  # The last one is the `+Inf` bucket
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[tuple[str, int]]:
+        """Return the number of values at or below each bucket bound, ending with the `+Inf` bucket."""
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        counts: list[tuple[str, int]] = []
+        total = 0
+        for bound, bucket_count in zip(bounds, self.bucket_counts, strict=True):
+            total += bucket_count
+            counts.append((bound, total))
+        return counts
+
+    def snapshot(self) -> dict[str, object]:
+        """Return the histogram as a JSON-serializable dictionary with cumulative bucket counts."""
+        return {"buckets": dict(self.cumulative_counts()), "count": self.count, "sum": self.sum}
@@ -0,0 +1,127 @@
+from collections.abc import Iterable
+from collections.abc import Mapping
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core.database.pool import InstrumentedAsyncQueuePool
+from app.core.metrics.histogram import Histogram
+from app.core.metrics.requests import RequestMetrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Mapping[str, str]
+
+
+class PrometheusText:
+    """Builds a page of metrics in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def counter(self, name: str, help_text: str, samples: Iterable[tuple[Labels, float]]) -> None:
+        """Add a counter (`name` should end with `_total`) with one sample per label set."""
+        self._add_samples(name, "counter", help_text, samples)
+
+    def gauge(self, name: str, help_text: str, samples: Iterable[tuple[Labels, float]]) -> None:
+        """Add a gauge with one sample per label set."""
+        self._add_samples(name, "gauge", help_text, samples)
+
+    def histogram(self, name: str, help_text: str, samples: Iterable[tuple[Labels, Histogram]]) -> None:
+        """Add a histogram: cumulative `_bucket` counts, `_sum` and `_count` per label set."""
+        self._add_header(name, "histogram", help_text)
+        for labels, histogram in samples:
+            for bound, count in histogram.cumulative_counts():
+                self.lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+            self.lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+            self.lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+    def _add_samples(
+        self, name: str, metric_type: str, help_text: str, samples: Iterable[tuple[Labels, float]]
+    ) -> None:
+        self._add_header(name, metric_type, help_text)
+        self.lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples)
+
+    def _add_header(self, name: str, metric_type: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+
+def _format_value(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for key, value in labels.items()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def render_prometheus(metrics: RequestMetrics, engines: Mapping[str, AsyncEngine]) -> str:
+    """
+    Render the request metrics and the connection pools of this worker in the Prometheus text format.
+
+    Args:
+        metrics (RequestMetrics): The request metrics, by route template and method.
+        engines (Mapping[str, AsyncEngine]): The engines whose pools are reported, by `database` label.
+
+    Returns:
+        str: The metrics page.
+    """
+    page = PrometheusText()
+    routes = [
+        ({"route": route, "method": method}, route_metrics) for (route, method), route_metrics in metrics.routes.items()
+    ]
+    page.counter(
+        "http_requests_total",
+        "Requests handled, by route template, method and status class.",
+        (
+            ({**labels, "status": status_class}, count)
+            for labels, route_metrics in routes
+            for status_class, count in sorted(route_metrics.status_classes.items())
+        ),
+    )
+    page.histogram(
+        "http_request_duration_seconds",
+        "Time from the request to the end of the response.",
+        ((labels, route_metrics.latency) for labels, route_metrics in routes),
+    )
+    page.histogram(
+        "http_request_db_duration_seconds",
+        "Time spent running database statements while handling a request.",
+        ((labels, route_metrics.db_time) for labels, route_metrics in routes),
+    )
+    page.counter(
+        "http_request_db_queries_total",
+        "Database statements executed while handling requests.",
+        ((labels, route_metrics.queries) for labels, route_metrics in routes),
+    )
+
+    pools = [({"database": name}, engine.pool) for name, engine in engines.items()]
+    queue_pools = [(labels, pool) for labels, pool in pools if isinstance(pool, QueuePool)]
+    page.gauge(
+        "db_pool_checked_out_connections",
+        "Connections of the pool in use.",
+        ((labels, pool.checkedout()) for labels, pool in queue_pools),
+    )
+    page.gauge(
+        "db_pool_size", "Connections the pool keeps open.", ((labels, pool.size()) for labels, pool in queue_pools)
+    )
+    instrumented = [(labels, pool.metrics) for labels, pool in pools if isinstance(pool, InstrumentedAsyncQueuePool)]
+    page.histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent acquiring a connection from the pool.",
+        ((labels, pool_metrics.checkout_wait) for labels, pool_metrics in instrumented),
+    )
+    page.counter(
+        "db_pool_timeouts_total",
+        "Checkouts that gave up waiting for a connection.",
+        ((labels, pool_metrics.timeouts) for labels, pool_metrics in instrumented),
+    )
+    return page.render()
@@ -0,0 +1,61 @@
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
+
+from app.core.metrics.database import QueryStats
+from app.core.metrics.histogram import Histogram
+
+# The route label of requests matching no route, so that unknown paths do not each create a series
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RouteMetrics:
+    """The requests handled by one route and method."""
+
+    status_classes: Counter[str] = field(default_factory=Counter)  # Requests by status class, e.g. "2xx"
+    latency: Histogram = field(default_factory=Histogram)  # Seconds from the request to the end of the response
+    db_time: Histogram = field(default_factory=Histogram)  # Seconds spent running statements during the request
+    queries: int = 0  # Statements executed
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+
+class RequestMetrics:
+    """
+    The request metrics of this worker process, by route template (e.g. `/blog/{slug}`, never the raw path) and
+    method. Like `Histogram`, it is updated from the event loop thread only.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def observe(self, route: str | None, method: str, status_code: int, latency: float, queries: QueryStats) -> None:
+        """
+        Record a handled request.
+
+        Args:
+            route (str | None): The matched route template, or None if no route matched.
+            method (str): The HTTP method.
+            status_code (int): The status code of the response.
+            latency (float): Seconds from the request to the end of the response.
+            queries (QueryStats): The statements executed while handling the request.
+        """
+        key = (route or UNMATCHED_ROUTE, method)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.status_classes[f"{status_code // 100}xx"] += 1
+        metrics.latency.observe(latency)
+        metrics.db_time.observe(queries.duration)
+        metrics.queries += queries.queries
+
+    def reset(self) -> None:
+        """Forget the requests recorded so far."""
+        self.routes.clear()
+
+
+# Create a global instance of the request metrics that can be imported into other modules.
+request_metrics = RequestMetrics()
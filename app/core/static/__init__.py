@@ -0,0 +1,13 @@
+from app.core.static import assets
+from app.core.static import files
+
+STATIC_DIR = "app/static"
+
+StaticAssetManifest = assets.StaticAssetManifest
+PrecompressedStaticFiles = files.PrecompressedStaticFiles
+build_static_assets = assets.build_static_assets
+
+# Load the manifest once at import; it is read by templates (`static()`) and the static files handler
+static_manifest = StaticAssetManifest.load(STATIC_DIR)
+
+__all__ = ["STATIC_DIR", "StaticAssetManifest", "PrecompressedStaticFiles", "build_static_assets", "static_manifest"]
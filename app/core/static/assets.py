@@ -0,0 +1,105 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from app.core.logging import main_logger
+
+try:
+    import brotli  # type: ignore[import-untyped]
+except ImportError:  # Optional dependency, install with `uv sync --extra static`
+    brotli = None
+
+# Directory (inside the static directory) that receives fingerprinted assets and their manifest
+DIST_DIR_NAME = "dist"
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Only text-based assets are worth precompressing; images and fonts are already compressed formats
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".svg", ".json", ".txt", ".html", ".map", ".xml", ".ico"}
+FINGERPRINT_LENGTH = 12
+
+
+@dataclass
+class StaticAssetManifest:
+    """
+    Maps logical static paths (e.g. `css/styles.css`) to fingerprinted copies (e.g. `css/styles.1a2b3c4d5e6f.css`).
+
+    The manifest is produced by `build_static_assets` and loaded once at startup; when it does not exist
+    (e.g. in development), logical paths are served as they are.
+    """
+
+    static_dir: Path
+    url_prefix: str = "/static"
+    assets: dict[str, str] = field(default_factory=dict)  # Logical path -> fingerprinted path (relative to dist)
+    digests: dict[str, str] = field(default_factory=dict)  # Fingerprinted path -> content digest
+
+    @classmethod
+    def load(cls, static_dir: str | Path, url_prefix: str = "/static") -> "StaticAssetManifest":
+        """Load the manifest of a static directory, or return an empty manifest if the assets are not built."""
+        manifest = cls(static_dir=Path(static_dir), url_prefix=url_prefix)
+        manifest_path = manifest.dist_dir / MANIFEST_FILE_NAME
+        if not manifest_path.exists():
+            main_logger.debug("No static asset manifest at {}; serving unhashed assets.", manifest_path)
+            return manifest
+
+        data = json.loads(manifest_path.read_text())
+        manifest.assets = data["assets"]
+        manifest.digests = dict(data["digests"])
+        main_logger.debug("Loaded static asset manifest with {} assets.", len(manifest.assets))
+        return manifest
+
+    @property
+    def dist_dir(self) -> Path:
+        """Directory holding the fingerprinted assets."""
+        return self.static_dir / DIST_DIR_NAME
+
+    def url(self, path: str) -> str | None:
+        """Return the URL of the fingerprinted copy of a logical path, or None if it is not in the manifest."""
+        hashed_path = self.assets.get(path.lstrip("/"))
+        return f"{self.url_prefix}/{DIST_DIR_NAME}/{hashed_path}" if hashed_path else None
+
+    def digest(self, static_path: str) -> str | None:
+        """Return the content digest of a fingerprinted file, given its path relative to the static directory."""
+        dist_prefix = f"{DIST_DIR_NAME}/"
+        if not static_path.startswith(dist_prefix):
+            return None
+        return self.digests.get(static_path.removeprefix(dist_prefix))
+
+
+def build_static_assets(static_dir: str | Path) -> StaticAssetManifest:
+    """
+    Fingerprint every static asset and write precompressed variants next to the copies.
+
+    For each file in `static_dir` (outside `dist/`), writes `dist/<name>.<content hash>.<suffix>` plus `.gz`
+    and, if `brotli` is installed, `.br` variants of compressible files, and finally `dist/manifest.json`.
+    """
+    static_dir = Path(static_dir)
+    manifest = StaticAssetManifest(static_dir=static_dir)
+    manifest.dist_dir.mkdir(parents=True, exist_ok=True)
+
+    for source in sorted(static_dir.rglob("*")):
+        relative_path = source.relative_to(static_dir)
+        if not source.is_file() or relative_path.parts[0] == DIST_DIR_NAME:
+            continue
+
+        content = source.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()[:FINGERPRINT_LENGTH]
+        hashed_path = relative_path.with_name(f"{source.stem}.{digest}{source.suffix}")
+        target = manifest.dist_dir / hashed_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+
+        if source.suffix in COMPRESSIBLE_SUFFIXES:
+            # mtime=0 keeps the gzip output (and its ETag) identical across builds of the same content
+            target.with_name(f"{target.name}.gz").write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+            if brotli is not None:
+                target.with_name(f"{target.name}.br").write_bytes(brotli.compress(content, quality=11))
+
+        manifest.assets[relative_path.as_posix()] = hashed_path.as_posix()
+        manifest.digests[hashed_path.as_posix()] = digest
+
+    manifest_path = manifest.dist_dir / MANIFEST_FILE_NAME
+    manifest_path.write_text(json.dumps({"assets": manifest.assets, "digests": manifest.digests}, indent=2))
+    return manifest
@@ -0,0 +1,79 @@
+import mimetypes
+import os
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.staticfiles import PathLike
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.core.static.assets import StaticAssetManifest
+
+# Fingerprinted files never change under the same URL, so browsers and CDNs may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Supported precompressed variants, in order of preference
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serve precompressed variants and cache fingerprinted assets forever.
+
+    - If the client accepts it and a `.br`/`.gz` file exists next to the requested one, that file is sent as is,
+      so nothing is compressed per request.
+    - Fingerprinted assets (listed in the manifest) get `Cache-Control: immutable` and a strong ETag derived from
+      their content hash and encoding.
+    """
+
+    def __init__(self, *, directory: str, manifest: StaticAssetManifest) -> None:
+        super().__init__(directory=directory)
+        self.manifest = manifest
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        response = self._precompressed_response(full_path, request_headers, status_code)
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+
+        digest = self.manifest.digest(self.get_path(scope))
+        if digest is not None:
+            encoding = response.headers.get("content-encoding", "identity")
+            response.headers["etag"] = f'"{digest}-{encoding}"'
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    @staticmethod
+    def _precompressed_response(full_path: PathLike, request_headers: Headers, status_code: int) -> Response | None:
+        """Return a response for the preferred precompressed variant the client accepts, if one exists."""
+        accepted = {value.split(";")[0].strip() for value in request_headers.get("accept-encoding", "").split(",")}
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            variant = Path(f"{full_path}{suffix}")
+            try:
+                variant_stat = variant.stat()
+            except FileNotFoundError:
+                continue
+            return FileResponse(
+                variant,
+                status_code=status_code,
+                stat_result=variant_stat,
+                media_type=media_type,
+                headers={"content-encoding": encoding, "vary": "Accept-Encoding"},
+            )
+        return None
@@ -1,5 +1,9 @@
 # Instantiate the TemplateManager and expose it for application-wide use
+from app.core.config import app_config
 from app.core.templates.templating import TemplateManager
 
-template_manager = TemplateManager()
+template_manager = TemplateManager(
+    bytecode_cache_dir=app_config.TEMPLATE_CACHE_DIR or None,
+    auto_reload=app_config.DEBUG,  # Templates do not change in production; skip the per-render mtime checks
+)
 renderer = template_manager.templates
@@ -0,0 +1,59 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from jinja2 import Template
+from markupsafe import Markup
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+# Emitted by `stream_flush()` in templates: everything rendered so far is sent to the client at this point
+STREAM_FLUSH_MARKER = Markup("<!-- stream-flush -->")
+
+# Rendered output is sent in chunks of (at least) this many characters, unless a flush marker comes first
+STREAM_CHUNK_SIZE = 8192
+
+
+class TemplateStreamingResponse(StreamingResponse):
+    """
+    A response that sends a template while it is rendered, instead of rendering the whole document first.
+
+    The template must come from an async environment (see `TemplateManager.stream_response`), so loops
+    can iterate async row iterators (e.g. `PostRepository.stream_summaries_page`) as rows arrive.
+    Output is buffered into chunks of `chunk_size` characters, and sent early wherever the template calls
+    `stream_flush()`, e.g. right after `</head>` so the browser starts fetching styles and scripts.
+    """
+
+    chunk_size = STREAM_CHUNK_SIZE
+
+    def __init__(
+        self,
+        template: Template,
+        context: dict[str, Any],
+        status_code: int = 200,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        self.template = template
+        self.context = context
+        super().__init__(self._render_chunks(), status_code=status_code, media_type="text/html", background=background)
+
+    async def _render_chunks(self) -> AsyncGenerator[str, None]:
+        """Renders the template, yielding the output in chunks."""
+        buffer: list[str] = []
+        buffered_size = 0
+        async for text in self.template.generate_async(self.context):
+            if text == STREAM_FLUSH_MARKER:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_size = 0
+                continue
+
+            buffer.append(text)
+            buffered_size += len(text)
+            if buffered_size >= self.chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_size = 0
+
+        if buffer:
+            yield "".join(buffer)
@@ -1,24 +1,111 @@
 from datetime import UTC
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import pass_context
+from jinja2.runtime import Context
+from markupsafe import Markup
+from starlette.background import BackgroundTask
+from starlette.requests import Request
 
-from app.core.utils.versioning import get_version_from_pyproject
+from app.core.static import static_manifest
+from app.core.templates.streaming import STREAM_FLUSH_MARKER
+from app.core.templates.streaming import TemplateStreamingResponse
+from app.core.utils.versioning import build_info
 
 
 class TemplateManager:
     """Manages a Jinja2 template environment for the application."""
 
-    def __init__(self, template_dir: str = "app/templates") -> None:
-        """Initialize the TemplateManager with the specified template directory."""
-        self.templates = Jinja2Templates(directory=template_dir)
+    # Templates rendered by another environment (Starlette Admin extends its own layouts with them)
+    PRECOMPILE_EXCLUDED_PREFIXES = ("admin/",)
+
+    def __init__(
+        self, template_dir: str = "app/templates", bytecode_cache_dir: str | None = None, auto_reload: bool = True
+    ) -> None:
+        """
+        Initialize the TemplateManager with the specified template directory.
+
+        Args:
+            template_dir (str): The directory holding the templates.
+            bytecode_cache_dir (str | None): A directory where compiled templates are persisted, so that new
+                workers load bytecode instead of compiling the sources; None disables the cache.
+            auto_reload (bool): Whether template files are checked for changes before each render.
+        """
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=True,
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
+        )
+        self.templates = Jinja2Templates(env=env)
         self._register_globals()
         self._register_filters()
 
+        # Async twin of the environment for streamed rendering; it shares loader, globals and filters.
+        # Async templates compile to different code, so they must not share the bytecode cache.
+        self.streaming_env = env.overlay(enable_async=True, bytecode_cache=None)
+        self.streaming_env.globals = {**env.globals, "stream_flush": lambda: STREAM_FLUSH_MARKER}
+
+    def stream_response(
+        self,
+        request: Request,
+        name: str,
+        context: dict[str, Any],
+        status_code: int = 200,
+        background: BackgroundTask | None = None,
+    ) -> TemplateStreamingResponse:
+        """
+        Render a template while it is being sent, see `TemplateStreamingResponse`.
+
+        Args:
+            request (Request): The request the template is rendered for (available as `request` in the template).
+            name (str): The template name.
+            context (dict[str, Any]): The template context; it may hold async iterables to loop over.
+            status_code (int): The response status code.
+            background (BackgroundTask | None): A task run once the response is sent, e.g. closing a session.
+
+        Returns:
+            TemplateStreamingResponse: The streaming response.
+        """
+        template = self.streaming_env.get_template(name)
+        return TemplateStreamingResponse(
+            template, {**context, "request": request}, status_code=status_code, background=background
+        )
+
+    def precompile(self) -> int:
+        """
+        Compile every template of the application up front, so the first requests do not pay for it.
+
+        Compiled templates are kept by the environments for regular and streamed rendering (and written to the
+        bytecode cache, if enabled).
+
+        Returns:
+            int: The number of compiled templates.
+        """
+        env = self.templates.env
+        names = [name for name in env.list_templates() if not name.startswith(self.PRECOMPILE_EXCLUDED_PREFIXES)]
+        for name in names:
+            env.get_template(name)
+            self.streaming_env.get_template(name)
+        return len(names)
+
     def _register_globals(self) -> None:
         """Register global functions and variables to be used in Jinja2 templates."""
         self.templates.env.globals["static"] = self.static
         self.templates.env.globals["get_version"] = self.get_version
+        self.templates.env.globals["fragment_block"] = self.fragment_block
+        self.templates.env.globals["stream_flush"] = lambda: Markup("")  # Only flushes in streamed rendering
         # Additional globals can be registered here.
 
     def _register_filters(self) -> None:
@@ -28,14 +115,37 @@ class TemplateManager:
 
     @staticmethod
     def static(path: str) -> str:
-        # TODO: Custom logic for getting static files will be introduced later.
-        return path
+        """
+        Return the URL of a static asset, e.g. `static('css/styles.css')`.
+
+        Resolves to the fingerprinted (immutable) copy when the assets are built, otherwise to the plain file
+        with a version query parameter for cache busting.
+        """
+        hashed_url = static_manifest.url(path)
+        if hashed_url is not None:
+            return hashed_url
+        return f"{static_manifest.url_prefix}/{path.lstrip('/')}?v={build_info.version}"
+
+    @staticmethod
+    @pass_context
+    def fragment_block(context: Context) -> str | None:
+        """
+        Return the block to render on its own for an HTMX request, or None to render the whole page content.
+
+        The block is the one named after the id of the element targeted by the request (`hx-target="#load-more"`
+        selects the block `load_more`), if the rendered template defines it.
+        """
+        request = context.get("request")
+        target = getattr(request.state, "htmx_target", None) if request is not None else None
+        if not target:
+            return None
+        block_name = target.replace("-", "_")
+        return block_name if block_name in context.blocks else None
 
     @staticmethod
     def get_version(prefix: str = "") -> str:
-        """Return a dynamic version string with an optional prefix."""
-        version = get_version_from_pyproject()
-        return f"{prefix}{version}"
+        """Return the application version with an optional prefix."""
+        return f"{prefix}{build_info.version}"
 
     @staticmethod
     def days_ago(value: datetime) -> str:
@@ -4,8 +4,18 @@ class AppError:
 
         pass
 
+    class InvalidConfigurationError(ValueError):
+        """Raised when a configuration value is not supported."""
+
+        pass
+
     class SecretValidationError(Exception):
         """Custom exception for errors related to ProtectedSecret validation."""
 
         def __init__(self, message: str):
             super().__init__(message)
+
+    class InvalidCursorError(ValueError):
+        """Raised when a pagination cursor token cannot be decoded."""
+
+        pass
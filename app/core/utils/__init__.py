@@ -2,7 +2,9 @@ from app.core.utils import log_routes
 from app.core.utils import versioning
 
 # Expose key components for direct import from core
+BuildInfo = versioning.BuildInfo
+build_info = versioning.build_info
 get_version_from_pyproject = versioning.get_version_from_pyproject
 log_route_details = log_routes.log_route_details
 
-__all__ = ["get_version_from_pyproject", "log_route_details"]
+__all__ = ["BuildInfo", "build_info", "get_version_from_pyproject", "log_route_details"]
@@ -1,8 +1,30 @@
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from importlib import metadata
 from pathlib import Path
 from typing import Any
 
 import toml
 
+from app.core.config import app_config
+
+# The distribution name under which the project is installed (the `name` in `pyproject.toml`)
+DISTRIBUTION_NAME = "fastapi-starterpack"
+
+
+@dataclass(frozen=True, slots=True)
+class BuildInfo:
+    """Describes the running build; resolved once at import time so requests never touch the disk for it."""
+
+    version: str
+    revision: str
+    built_at: datetime
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the build info as a JSON-serializable dictionary."""
+        return {"version": self.version, "revision": self.revision, "built_at": self.built_at.isoformat()}
+
 
 def get_version_from_pyproject() -> str:
     """Retrieve the version value from the 'pyproject.toml' file."""
@@ -14,3 +36,66 @@ def get_version_from_pyproject() -> str:
         return version
     except (FileNotFoundError, KeyError, toml.TomlDecodeError) as err:
         raise ValueError(f"Error reading version from 'pyproject.toml': {err}") from err
+
+
+def get_version() -> str:
+    """Return the installed package version, falling back to 'pyproject.toml' when the project is not installed."""
+    try:
+        return metadata.version(DISTRIBUTION_NAME)
+    except metadata.PackageNotFoundError:
+        return get_version_from_pyproject()
+
+
+def get_git_revision(repo_dir: Path = Path()) -> str | None:
+    """
+    Return the commit checked out in a git working tree, or None when it cannot be determined.
+
+    The `.git` directory is read directly, so neither a `git` executable nor a subprocess is needed.
+
+    Args:
+        repo_dir (Path): The root of the working tree.
+
+    Returns:
+        str | None: The full commit hash.
+    """
+    git_dir = repo_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head or None  # Detached HEAD
+        ref = head.removeprefix("ref: ")
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip() or None
+        # The ref may only exist in `packed-refs` (e.g. after `git gc`)
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            commit, _, name = line.partition(" ")
+            if name == ref:
+                return commit
+    except OSError:
+        return None
+    return None
+
+
+def resolve_build_info(revision: str = "", built_at: str = "", repo_dir: Path = Path()) -> BuildInfo:
+    """
+    Resolve the build info of the application.
+
+    Args:
+        revision (str): The commit the build was made from; read from the git working tree when empty.
+        built_at (str): The ISO 8601 build timestamp; the resolution time is used when empty.
+        repo_dir (Path): The root of the git working tree.
+
+    Returns:
+        BuildInfo: The resolved build info.
+    """
+    timestamp = datetime.fromisoformat(built_at) if built_at else datetime.now(UTC)
+    return BuildInfo(
+        version=get_version(),
+        revision=revision or get_git_revision(repo_dir) or "unknown",
+        built_at=timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=UTC),
+    )
+
+
+# Create a global instance of the build info that can be imported into other modules.
+build_info = resolve_build_info(revision=app_config.BUILD_REVISION, built_at=app_config.BUILD_TIMESTAMP)
@@ -1,13 +1,44 @@
+from collections.abc import Mapping
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from typing import TypeVar
+
+from sqlalchemy import Select
+from sqlalchemy import and_
+from sqlalchemy import func
+from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.core.cache import page_cache
+from app.core.database import CursorPage
+from app.core.database import CursorStream
+from app.core.database import LoaderOptions
 from app.core.database import Repository
+from app.core.database import decode_cursor
+from app.core.database import encode_cursor
+from app.core.typedefs.exceptions import AppError
 from app.domain.post.model import Post
+from app.domain.post.schema import PostSchema
+from app.domain.user.model import User
+
+# Maximum number of characters of a Post's content included in listing excerpts
+EXCERPT_LENGTH = 300
+
+# Row types that can be keyset-paginated: Post entities and projections exposing `post_date` and `id`
+P = TypeVar("P", Post, PostSchema.Summary)
 
 
 class PostRepository(Repository[Post]):
     """Repository class for handling Post database operations."""
 
+    # Loader options for post listings: pulls only the author's username in the same query.
+    WITH_AUTHOR_USERNAME: LoaderOptions = (joinedload(Post.user).load_only(User.username),)
+
+    model = Post
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -16,18 +47,160 @@ class PostRepository(Repository[Post]):
         self.session.add(post)
         await self.session.commit()
         await self.session.refresh(post)
+        await page_cache.invalidate()
+
+    async def add_many(self, rows: Sequence[Mapping[str, Any]], batch_size: int | None = None) -> list[int]:
+        """Inserts many Posts in batches (see `Repository.add_many`) and commits the transaction."""
+        ids = await super().add_many(rows, batch_size)
+        await page_cache.invalidate()
+        return ids
 
-    async def get(self, post_id: int) -> Post | None:
+    async def upsert_many(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> list[int]:
+        """Inserts or updates many Posts in batches (see `Repository.upsert_many`) and commits the transaction."""
+        ids = await super().upsert_many(rows, conflict_columns, update_columns, batch_size)
+        await page_cache.invalidate()
+        return ids
+
+    async def publish(self, post: Post) -> None:
+        """Publishes a Post and commits the transaction."""
+        post.publish()
+        await self.session.commit()
+        await page_cache.invalidate()
+
+    async def get(self, post_id: int, options: LoaderOptions = ()) -> Post | None:
         """Retrieves a Post by its ID from the database."""
-        result = await self.session.execute(select(Post).filter_by(id=post_id))
+        result = await self.session.execute(select(Post).filter_by(id=post_id).options(*options))
         return result.scalars().first()
 
-    async def list(self) -> list[Post]:
+    async def list(self, options: LoaderOptions = ()) -> list[Post]:
         """Returns a list of all Posts from the database."""
-        result = await self.session.execute(select(Post))
+        result = await self.session.execute(select(Post).options(*options))
         return list(result.scalars().all())
 
+    async def list_page(self, limit: int, cursor: str | None = None, options: LoaderOptions = ()) -> CursorPage[Post]:
+        """
+        Returns one page of Posts, newest first, using keyset pagination on (`post_date`, `id`).
+
+        Args:
+            limit (int): The maximum number of Posts to return.
+            cursor (str | None): The `next_cursor` of the previous page, or None for the first page.
+            options (LoaderOptions): Loader options for the query, e.g. `PostRepository.WITH_AUTHOR_USERNAME`.
+
+        Returns:
+            CursorPage[Post]: The Posts of the page and the cursor of the following page (None on the last page).
+
+        Raises:
+            AppError.InvalidCursorError: If the cursor cannot be decoded.
+        """
+        query = self._keyset_page_query(select(Post).options(*options), limit, cursor)
+        result = await self.session.execute(query)
+        return self._build_page(result.scalars().all(), limit)
+
+    async def list_summaries_page(
+        self, limit: int, cursor: str | None = None, excerpt_length: int = EXCERPT_LENGTH
+    ) -> CursorPage[PostSchema.Summary]:
+        """
+        Returns one page of Post summaries, newest first, paginated exactly like `list_page`.
+
+        Only the listed columns are selected: the excerpt is cut from `content` by the database,
+        and the author's username comes from an outer join, so no ORM objects are created.
+
+        Args:
+            limit (int): The maximum number of summaries to return.
+            cursor (str | None): The `next_cursor` of the previous page, or None for the first page.
+            excerpt_length (int): The maximum number of characters of `content` included in the excerpt.
+
+        Returns:
+            CursorPage[PostSchema.Summary]: The summaries of the page and the cursor of the following page.
+
+        Raises:
+            AppError.InvalidCursorError: If the cursor cannot be decoded.
+        """
+        query = self._keyset_page_query(self._summary_query(excerpt_length), limit, cursor)
+        summaries = await self._fetch_projection(query, PostSchema.Summary)
+        return self._build_page(summaries, limit)
+
+    def stream_summaries_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        excerpt_length: int = EXCERPT_LENGTH,
+        close_session: bool = False,
+    ) -> CursorStream[PostSchema.Summary]:
+        """
+        Returns the same page as `list_summaries_page`, but fetches the summaries while they are iterated.
+
+        Meant for streamed rendering: the first posts can be sent before the last ones are read.
+        The cursor is decoded right away, so an invalid cursor raises before anything is streamed.
+
+        Args:
+            limit (int): The maximum number of summaries to return.
+            cursor (str | None): The `next_cursor` of the previous page, or None for the first page.
+            excerpt_length (int): The maximum number of characters of `content` included in the excerpt.
+            close_session (bool): Close the repository's session once the summaries are consumed (or the
+                stream is closed), for streams that outlive the request handler.
+
+        Returns:
+            CursorStream[PostSchema.Summary]: The summaries of the page; `next_cursor` is set once it is consumed.
+
+        Raises:
+            AppError.InvalidCursorError: If the cursor cannot be decoded.
+        """
+        query = self._keyset_page_query(self._summary_query(excerpt_length), limit, cursor)
+        rows = self._stream_projection(query, PostSchema.Summary, close_session=close_session)
+        return CursorStream(rows, limit, cursor_of=lambda summary: encode_cursor(summary.post_date, summary.id))
+
     async def delete(self, post: Post) -> None:
         """Deletes a specified Post from the database and commits the transaction."""
         await self.session.delete(post)
         await self.session.commit()
+        await page_cache.invalidate()
+
+    @staticmethod
+    def _summary_query(excerpt_length: int) -> Select[Any]:
+        """Selects the columns of `PostSchema.Summary`: the excerpt is cut by the database, the author is joined."""
+        return select(
+            Post.id.label("id"),
+            Post.title.label("title"),
+            func.substr(Post.content, 1, excerpt_length).label("excerpt"),
+            Post.post_date.label("post_date"),
+            User.username.label("author_username"),
+        ).outerjoin(User, Post.user_id == User.id)
+
+    def _keyset_page_query(self, query: Select[Any], limit: int, cursor: str | None) -> Select[Any]:
+        """Orders a Post query newest first, skips past the cursor and limits it to one page (plus one row)."""
+        query = query.order_by(Post.post_date.desc(), Post.id.desc())
+
+        if cursor is not None:
+            last_post_date, last_id = self._decode_post_cursor(cursor)
+            query = query.where(
+                or_(Post.post_date < last_post_date, and_(Post.post_date == last_post_date, Post.id < last_id))
+            )
+
+        # Fetch one extra row to find out whether another page follows without issuing a COUNT query
+        return query.limit(limit + 1)
+
+    @staticmethod
+    def _build_page(rows: Sequence[P], limit: int) -> CursorPage[P]:
+        """Trims the extra look-ahead row and derives the next cursor from the last row of the page."""
+        if len(rows) <= limit:
+            return CursorPage(items=list(rows))
+
+        items = list(rows[:limit])
+        return CursorPage(items=items, next_cursor=encode_cursor(items[-1].post_date, items[-1].id))
+
+    @staticmethod
+    def _decode_post_cursor(cursor: str) -> tuple[datetime, int]:
+        """Decodes a Post cursor into its (`post_date`, `id`) keyset values."""
+        values = decode_cursor(cursor)
+        try:
+            post_date, post_id = values
+            return datetime.fromisoformat(post_date), int(post_id)
+        except (TypeError, ValueError) as e:
+            raise AppError.InvalidCursorError(f"Invalid Post cursor: {cursor!r}") from e
@@ -5,6 +5,7 @@ from sqlalchemy import JSON
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy.orm import mapped_column
@@ -16,6 +17,10 @@ from app.domain.post.enums import PostStatus
 
 class Post(Base):
     __tablename__ = "post"
+    __table_args__ = (
+        # Supports keyset pagination ordered by (post_date, id), see `PostRepository.list_page`
+        Index("ix_post_post_date_id", "post_date", "id"),
+    )
 
     id = mapped_column(Integer, primary_key=True, autoincrement=True)
     title = mapped_column(String(100), nullable=False)
@@ -27,7 +32,7 @@ class Post(Base):
     post_metadata = mapped_column(JSON, default=None)
 
     # Relationships
-    user = relationship("User", back_populates="posts", lazy="selectin")
+    user = relationship("User", back_populates="posts", lazy="raise_on_sql")
 
     def publish(self) -> None:
         """Publishes the post by setting its status and updating the modified timestamp."""
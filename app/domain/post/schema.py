@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -30,5 +31,22 @@ class PostSchema:
         class Config:
             from_attributes = True
 
+    @dataclass(frozen=True, slots=True)
+    class Summary:
+        """Lightweight, read-only projection of a Post for listings (built without ORM or Pydantic overhead)."""
+
+        id: int
+        title: str
+        excerpt: str
+        post_date: datetime
+        author_username: str | None
+
+    class Page(BaseModel):
+        items: list["PostSchema.Read"]
+        next_cursor: str | None = Field(None, description="Cursor of the next page, or null on the last page")
+
+    class ImportResult(BaseModel):
+        imported: int = Field(..., description="Number of posts created")
+
     class Delete(BaseModel):
         message: str
@@ -5,34 +5,40 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import LoaderOptions
 from app.core.database import Repository
+from app.core.database import pin_to_primary
 from app.domain.user.exception import UsernameAlreadyExistsError
 from app.domain.user.model import User
+from app.services.auth.cache import auth_cache
 
 
 class UserRepository(Repository[User]):
     """Repository class for handling User database operations."""
 
+    model = User
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def list(self) -> list[User]:
+    async def list(self, options: LoaderOptions = ()) -> list[User]:
         """Returns a list of all Users from the database."""
-        result = await self.session.execute(select(User).order_by(User.created_at.desc()))
+        result = await self.session.execute(select(User).order_by(User.created_at.desc()).options(*options))
         return list(result.scalars().all())
 
-    async def get(self, user_id: int) -> User | None:
+    async def get(self, user_id: int, options: LoaderOptions = ()) -> User | None:
         """Fetches a user by ID."""
-        result = await self.session.execute(select(User).filter_by(id=user_id))
+        result = await self.session.execute(select(User).filter_by(id=user_id).options(*options))
         return result.scalars().first()
 
-    async def get_by_username(self, username: str) -> User | None:
+    async def get_by_username(self, username: str, options: LoaderOptions = ()) -> User | None:
         """Fetches a user by their username."""
-        result = await self.session.execute(select(User).filter_by(username=username))
+        result = await self.session.execute(select(User).filter_by(username=username).options(*options))
         return result.scalars().first()
 
     async def add(self, user: User) -> None:
         """Adds a new user to the database."""
+        pin_to_primary(self.session)  # A replica may not have the latest users yet
         existing_user = await self.get_by_username(user.username)
         if existing_user:
             raise UsernameAlreadyExistsError(user.username)
@@ -48,8 +54,10 @@ class UserRepository(Repository[User]):
         user.updated_at = datetime.now(UTC)
         await self.session.commit()
         await self.session.refresh(user)
+        auth_cache.invalidate_user(user.id)  # Cached logins may carry an outdated password or privileges
 
     async def delete(self, user: User) -> None:
         """Deletes a user from the database."""
         await self.session.delete(user)
         await self.session.commit()
+        auth_cache.invalidate_user(user.id)
@@ -25,6 +25,11 @@ class AuthError:
 
         pass
 
+    class InvalidTokenError(Exception):
+        """Exception raised when an authentication token is malformed, wrongly signed or revoked."""
+
+        pass
+
 
 class UsernameAlreadyExistsError(HTTPException):
     """Exception raised when trying to create a user with an existing username."""
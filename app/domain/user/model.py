@@ -27,7 +27,7 @@ class User(Base):
     last_login = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    posts = relationship("Post", back_populates="user", lazy="selectin")
+    posts = relationship("Post", back_populates="user", lazy="raise_on_sql")
     user_permissions = relationship(
-        "Permission", secondary=user_permission_table, back_populates="users", lazy="selectin"
+        "Permission", secondary=user_permission_table, back_populates="users", lazy="raise_on_sql"
     )
@@ -1,8 +1,13 @@
+import time
+from typing import cast
+
 from fastapi import FastAPI
+from starlette.types import ASGIApp
 
 from app.core.config import app_config
 from app.core.lifecycle import app_lifespan
-from app.core.utils import get_version_from_pyproject
+from app.core.logging import main_logger
+from app.core.utils import build_info
 
 
 class AppManager:
@@ -27,57 +32,87 @@ class AppManager:
         """
         self.app: FastAPI = app
         self.is_production: bool = not app_config.DEBUG
+        self.step_timings: dict[str, float] = {}  # Seconds spent in each setup step
         self.setup_application()
 
     def setup_application(self) -> None:
-        """Apply all configurations to the FastAPI application."""
-        self.register_routes()
-        self.setup_middlewares()
-        self.register_exception_handlers()
-        self.setup_admin_interface()
+        """Apply all configurations to the FastAPI application, recording how long each step takes."""
+        steps = (
+            self.register_routes,
+            self.setup_middlewares,
+            self.register_exception_handlers,
+            self.setup_admin_interface,
+        )
+        for step in steps:
+            started_at = time.perf_counter()
+            step()
+            self.step_timings[step.__name__] = time.perf_counter() - started_at
+        details = ", ".join(f"{name}: {seconds * 1000:.1f} ms" for name, seconds in self.step_timings.items())
+        main_logger.debug(f"Application assembled ({details}).")
 
     def register_routes(self) -> None:
         """Mount static files and register all application routes."""
 
         from fastapi import APIRouter
-        from fastapi.staticfiles import StaticFiles
 
+        from app.core.static import STATIC_DIR
+        from app.core.static import PrecompressedStaticFiles
+        from app.core.static import static_manifest
+        from app.routes.api.auth.token import router as api_token_router
         from app.routes.api.auth.user import router as api_users_router
         from app.routes.api.blog.blog import router as api_blog_router
+        from app.routes.api.health.health import router as health_router
+        from app.routes.api.metrics.metrics import router as metrics_router
         from app.routes.pages.blog import router as blog_router
         from app.routes.pages.home import router as home_router
 
-        routers: list[APIRouter] = [home_router, blog_router, api_blog_router, api_users_router]
+        routers: list[APIRouter] = [
+            home_router,
+            blog_router,
+            api_blog_router,
+            api_users_router,
+            api_token_router,
+            health_router,
+            metrics_router,
+        ]
 
         # Register routers
         for router in routers:
             self.app.include_router(router)
 
-        # Mount static files
-        self.app.mount("/static", StaticFiles(directory="app/static"), name="static")
+        # Mount static files (serves precompressed variants and caches fingerprinted assets as immutable)
+        static_files = PrecompressedStaticFiles(directory=STATIC_DIR, manifest=static_manifest)
+        self.app.mount("/static", static_files, name="static")
 
     def setup_middlewares(self) -> None:
         """Configures middleware for the FastAPI application."""
         from fastapi.middleware.cors import CORSMiddleware
         from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
         from starlette.middleware.authentication import AuthenticationMiddleware
-        from starlette.middleware.gzip import GZipMiddleware
         from starlette.middleware.sessions import SessionMiddleware
         from starlette.middleware.trustedhost import TrustedHostMiddleware
 
+        from app.core.database.engine import engine
+        from app.core.database.engine import replica_engines
         from app.core.gateway.middleware import BasicCSRFMiddleware
         from app.core.gateway.middleware import HtmxStateMiddleware
+        from app.core.gateway.middleware import PathBypassMiddleware
+        from app.core.gateway.middleware import QueryProfilerMiddleware
+        from app.core.gateway.middleware import RequestContextMiddleware
+        from app.core.gateway.middleware import RequestMetricsMiddleware
+        from app.core.gateway.middleware import StreamingGZipMiddleware
+        from app.core.metrics.database import instrument_engine
+        from app.core.metrics.requests import request_metrics
         from app.services.auth.backend import BasicAuthBackend
+        from app.services.auth.backend import on_auth_error
 
         # Add common middleware
-        self.app.add_middleware(GZipMiddleware, minimum_size=1000)
-        self.app.add_middleware(
-            AuthenticationMiddleware,
-            backend=BasicAuthBackend(),
-            # TODO , on_error=on_auth_error
-        )
+        self.app.add_middleware(StreamingGZipMiddleware, minimum_size=1000)
+        self.app.add_middleware(AuthenticationMiddleware, backend=BasicAuthBackend(), on_error=on_auth_error)
         self.app.add_middleware(SessionMiddleware, secret_key=app_config.SECRET_KEY)
         self.app.add_middleware(HtmxStateMiddleware)
+        # Static assets and health checks skip all of the middleware above (added last = runs first)
+        self.app.add_middleware(PathBypassMiddleware, prefixes=["/static", "/health"])
 
         # Add production-specific middleware
         if self.is_production:
@@ -92,6 +127,18 @@ class AppManager:
                 allow_headers=["*"],
             )
 
+        if app_config.REQUEST_METRICS or app_config.QUERY_PROFILING:
+            instrument_engine(engine)
+            for replica_engine in replica_engines:
+                instrument_engine(replica_engine)
+        if app_config.QUERY_PROFILING:
+            self.app.add_middleware(QueryProfilerMiddleware, repeat_threshold=app_config.QUERY_REPEAT_THRESHOLD)
+        if app_config.REQUEST_METRICS:
+            self.app.add_middleware(RequestMetricsMiddleware, metrics=request_metrics)
+
+        # Outermost, so that the request context is attached to every log record of the request
+        self.app.add_middleware(RequestContextMiddleware)
+
     def register_exception_handlers(self) -> None:
         """Register custom exception handlers for the application."""
         from fastapi.exceptions import RequestValidationError
@@ -113,17 +160,25 @@ class AppManager:
             self.app.openapi_url = None
 
     def setup_admin_interface(self) -> None:
-        """Sets up the admin interface."""
+        """Mounts the admin interface, which is only built (and its dependencies imported) on the first `/admin` hit."""
+        from app.core.gateway.lazy import LazyASGIApp
+
+        self.app.mount("/admin", LazyASGIApp(self.build_admin_interface), name="admin")
 
-        # from starlette.middleware.sessions import SessionMiddleware
+    @staticmethod
+    def build_admin_interface() -> ASGIApp:
+        """Builds the admin interface."""
+        from starlette.applications import Starlette
         from starlette.middleware import Middleware
         from starlette.middleware.sessions import SessionMiddleware
+        from starlette.routing import Mount
         from starlette_admin.contrib.sqla import Admin
 
         from app.core.database.engine import engine
         from app.services.admin_portal.provider import StarletteAdminAuthProvider
         from app.services.admin_portal.views import attach_admin_views
 
+        main_logger.info("Building the admin interface...")
         admin_interface: Admin = Admin(
             engine,
             title="Admin Interface",
@@ -139,15 +194,18 @@ class AppManager:
         )
 
         attach_admin_views(admin_interface)
-        admin_interface.mount_to(self.app)
+        # `mount_to` assembles the admin app (routes, middlewares, error handlers); take it from a bare holder
+        holder = Starlette()
+        admin_interface.mount_to(holder)
+        return cast(Mount, holder.routes[0]).app
 
 
 # Create FastAPI application instance
 app = FastAPI(
     title="FastAPI StarterPack",
-    version=get_version_from_pyproject(),
+    version=build_info.version,
     lifespan=app_lifespan,
 )
 
 # Initialize and configure the application using AppManager
-AppManager(app)
+app_manager = AppManager(app)
@@ -0,0 +1,53 @@
+from fastapi import APIRouter
+from fastapi import HTTPException
+from fastapi import Request
+from starlette.authentication import requires
+
+from app.domain.user.exception import AuthError
+from app.services.auth.backend import verify_user_pw_from_db
+from app.services.auth.schema import TokenSchema
+from app.services.auth.security import ACCESS_TOKEN_EXPIRE
+from app.services.auth.security import create_access_token
+from app.services.auth.security import revoked_tokens
+from app.services.auth.security import verify_jwt
+
+router = APIRouter(prefix="/api/auth")
+
+
+@router.post("/token", response_model=TokenSchema.Read)
+async def issue_token(credentials: TokenSchema.Create) -> TokenSchema.Read:
+    """
+    Exchange a username and password for a bearer access token.
+
+    The password is verified once here; requests sent with `Authorization: Bearer <token>` are then
+    authenticated from the token's signed claims alone, without a database query or bcrypt check.
+    """
+    try:
+        user = await verify_user_pw_from_db(credentials.username, credentials.password)
+    except AuthError.InvalidCredentialsError as e:
+        raise HTTPException(status_code=401, detail="Invalid username or password") from e
+
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid username or password")
+
+    scopes = ["authenticated", "admin"] if user.is_superuser else ["authenticated"]
+    access_token = create_access_token(subject=str(user.id), name=user.username, scopes=scopes)
+    return TokenSchema.Read(access_token=access_token, expires_in=int(ACCESS_TOKEN_EXPIRE.total_seconds()))
+
+
+@router.post("/token/revoke", response_model=TokenSchema.Revoke)
+@requires(["authenticated"])
+async def revoke_token(request: Request) -> TokenSchema.Revoke:
+    """
+    Revoke the bearer token used to authenticate this request (e.g. on logout).
+
+    Revocations are kept per worker process (see `TokenRevocationList`): in a multi-worker deployment the token
+    is only guaranteed to be rejected everywhere once it expires, after at most ACCESS_TOKEN_EXPIRE_MINUTES.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=400, detail="No bearer token provided")
+
+    claims = verify_jwt(token)
+    revoked_tokens.revoke(claims["jti"], claims["exp"])
+    return TokenSchema.Revoke(message="Token revoked successfully")
@@ -9,6 +9,7 @@ from app.core.database import get_session
 from app.domain.user.crud import UserRepository
 from app.domain.user.model import User
 from app.domain.user.schema import UserSchema
+from app.services.auth.security import password_hasher
 
 router = APIRouter(prefix="/api/auth")
 
@@ -22,7 +23,8 @@ async def create_user(
     Create a new user in the database.
     """
     repository = UserRepository(session)
-    user = User(**user_data.model_dump())  # Convert Pydantic model to SQLAlchemy model
+    hashed_password = await password_hasher.hash(user_data.password)
+    user = User(**user_data.model_dump(exclude={"password"}), password=hashed_password)
     await repository.add(user)  # Use repository to add user
     return UserSchema.Read.model_validate(user)
 
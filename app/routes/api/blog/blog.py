@@ -1,16 +1,61 @@
+from typing import Any
+
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Query
 from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.authentication import requires
 
 from app.core.database import get_session
+from app.core.typedefs.exceptions import AppError
 from app.domain.post.crud import PostRepository
 from app.domain.post.model import Post
 from app.domain.post.schema import PostSchema
 
-router = APIRouter(prefix="/blog")
+router = APIRouter(prefix="/api/blog")
+
+# Page size bounds for the cursor-paginated post listing
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Media types of newline-delimited JSON (one object per line) accepted by the post import
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+POST_LIST_ADAPTER = TypeAdapter(list[PostSchema.Create])
+
+
+@router.get("/", response_model=PostSchema.Page)
+async def list_posts(
+    cursor: str | None = Query(None, description="The `next_cursor` returned by the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_session),
+) -> PostSchema.Page:
+    """
+    Returns one page of blog posts, newest first.
+
+    Args:
+        cursor (str | None): Opaque cursor of the page to fetch; omit it to get the first page.
+        limit (int): The maximum number of posts in the page.
+        session (AsyncSession): Database session dependency.
+
+    Returns:
+        PostSchema.Page: The posts of the page and the cursor of the next page.
+    """
+    repository = PostRepository(session)
+    try:
+        page = await repository.list_page(limit=limit, cursor=cursor)
+    except AppError.InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+
+    return PostSchema.Page(
+        items=[PostSchema.Read.model_validate(post) for post in page.items],
+        next_cursor=page.next_cursor,
+    )
 
 
 @router.post("/", response_model=PostSchema.Read)
@@ -35,6 +80,65 @@ async def create_post(
     return PostSchema.Read.model_validate(post)
 
 
+@router.post("/import", response_model=PostSchema.ImportResult)
+@requires(["admin"])
+async def import_posts(request: Request, session: AsyncSession = Depends(get_session)) -> PostSchema.ImportResult:
+    """
+    Create many posts at once from a JSON array or NDJSON (one post per line, e.g. `application/x-ndjson`).
+
+    The posts are validated first, then inserted in batches in a single transaction: either all of them are
+    created or none.
+
+    Args:
+        request (Request): The request whose body holds the posts in the `PostSchema.Create` format.
+        session (AsyncSession): Database session dependency.
+
+    Returns:
+        PostSchema.ImportResult: The number of created posts.
+
+    Raises:
+        RequestValidationError: If a post is invalid; the error location holds its index (or line number).
+    """
+    posts = parse_post_import(await request.body(), request.headers.get("content-type", ""))
+    repository = PostRepository(session)
+    ids = await repository.add_many([post.model_dump(exclude_none=True) for post in posts])
+    return PostSchema.ImportResult(imported=len(ids))
+
+
+def parse_post_import(body: bytes, content_type: str) -> list[PostSchema.Create]:
+    """
+    Parse the posts of an import request body.
+
+    Args:
+        body (bytes): A JSON array of posts, or NDJSON with one post per line.
+        content_type (str): The `Content-Type` header of the request, selecting the format.
+
+    Returns:
+        list[PostSchema.Create]: The validated posts.
+
+    Raises:
+        RequestValidationError: If the body or a post is invalid.
+    """
+    if content_type.split(";")[0].strip().lower() not in NDJSON_MEDIA_TYPES:
+        try:
+            return POST_LIST_ADAPTER.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()]) from e
+
+    posts: list[PostSchema.Create] = []
+    errors: list[dict[str, Any]] = []
+    for line_number, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            posts.append(PostSchema.Create.model_validate_json(line))
+        except ValidationError as e:
+            errors.extend({**error, "loc": ("body", line_number, *error["loc"])} for error in e.errors())
+    if errors:
+        raise RequestValidationError(errors)
+    return posts
+
+
 @router.delete("/{post_id}", response_model=PostSchema.Delete)
 @requires(["admin"])
 async def delete_post(
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+
+from app.core.utils import build_info
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health")
+async def health() -> dict[str, str]:
+    """
+    Liveness probe. Served through `PathBypassMiddleware`, so it never touches sessions, auth or the database.
+
+    The build info is resolved at startup, so reporting it costs no disk access either.
+    """
+    return {"status": "ok", **build_info.as_dict()}
@@ -0,0 +1,55 @@
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+from starlette.authentication import requires
+
+from app.core.database.engine import engine
+from app.core.database.engine import replica_engines
+from app.core.database.pool import get_pool_status
+from app.core.metrics.prometheus import CONTENT_TYPE
+from app.core.metrics.prometheus import render_prometheus
+from app.core.metrics.requests import request_metrics
+
+# Internal metrics for operators; not part of the public API documentation
+router = APIRouter(prefix="/api/metrics", tags=["metrics"], include_in_schema=False)
+
+
+@router.get("/pool")
+@requires(["admin"])
+async def pool_metrics(request: Request) -> dict[str, Any]:
+    """
+    Report the state of this worker's database connection pools.
+
+    Args:
+        request (Request): Required by the `@requires` decorator for authorization.
+
+    Returns:
+        dict[str, Any]: Checked-out and overflow connections, timeouts and the checkout wait histogram.
+    """
+    return {
+        "database": get_pool_status(engine),
+        "replicas": [get_pool_status(replica_engine) for replica_engine in replica_engines],
+    }
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+@requires(["admin"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """
+    Report this worker's request and connection pool metrics in the Prometheus text format.
+
+    Each worker process keeps its own metrics; scrape every worker (e.g. one port each) to see them all.
+    Prometheus authenticates as an admin with the `Authorization-Username`/`Authorization-Password` headers
+    (`http_headers` of the scrape config).
+
+    Args:
+        request (Request): Required by the `@requires` decorator for authorization.
+
+    Returns:
+        PlainTextResponse: Per-route request counts by status class, latency and database time histograms,
+            and the pools' connections, checkout wait histogram and timeouts.
+    """
+    engines = {"primary": engine} | {f"replica_{index}": replica for index, replica in enumerate(replica_engines)}
+    return PlainTextResponse(render_prometheus(request_metrics, engines), media_type=CONTENT_TYPE)
@@ -1,43 +1,73 @@
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Query
 from fastapi import Request
 from fastapi.responses import HTMLResponse
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import page_cache
 from app.core.database import get_session
+from app.core.database.session import async_session_maker
 from app.core.templates import renderer
+from app.core.templates import template_manager
+from app.core.typedefs.exceptions import AppError
 from app.domain.post.crud import PostRepository
 from app.domain.post.schema import PostSchema
 
 router = APIRouter(prefix="/blog", tags=["blog"])
 
+# Number of posts rendered per page / per "load more" fragment
+BLOG_PAGE_SIZE = 10
+
 
 @router.get("/", response_class=HTMLResponse)
-async def blog_page(request: Request, session: AsyncSession = Depends(get_session)) -> HTMLResponse:
+async def blog_page(request: Request, cursor: str | None = Query(None)) -> Response:
     """
-    Fetches all blog posts from the database and renders the blog page.
+    Fetches one page of blog posts from the database and streams the rendered blog page.
+
+    The page head is sent before the posts are read, and posts are sent in chunks as they are fetched.
+    HTMX "load more" requests (targeting `#load-more`) only receive the `load_more` block with the next batch of posts,
+    and boosted navigations only the page content, without the layout.
+    Rendered pages are served from the page cache until posts change.
     """
-    repository = PostRepository(session)
-    posts = await repository.list()
-    context = {"request": request, "posts": posts}
-    return renderer.TemplateResponse("pages/blog/blog.html", context)
+
+    async def render() -> Response:
+        # Dependencies with `yield` are closed before a streamed body is sent, so the stream owns its session:
+        # it is closed once the posts are consumed, or when rendering stops early.
+        session = async_session_maker()
+        try:
+            posts = PostRepository(session).stream_summaries_page(
+                limit=BLOG_PAGE_SIZE, cursor=cursor, close_session=True
+            )
+        except AppError.InvalidCursorError as e:
+            await session.close()
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+
+        return template_manager.stream_response(request, "pages/blog/blog.html", {"posts": posts})
+
+    return await page_cache.fetch(request, render)
 
 
 @router.get("/{post_id}", response_class=HTMLResponse, name="blog")
-async def blog_page_single(
-    post_id: int, request: Request, session: AsyncSession = Depends(get_session)
-) -> HTMLResponse:
+async def blog_page_single(post_id: int, request: Request, session: AsyncSession = Depends(get_session)) -> Response:
     """
     Fetches a single blog post from the database based on the post_id and renders the single blog HTML template.
+
+    Rendered pages are served from the page cache until posts change.
     """
-    repository = PostRepository(session)
-    post = await repository.get(post_id)
 
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+    async def render() -> Response:
+        repository = PostRepository(session)
+        post = await repository.get(post_id)
+
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+
+        post_schema = PostSchema.Read.model_validate(post)
 
-    post_schema = PostSchema.Read.model_validate(post)
+        context = {"request": request, "post": post_schema}
+        return renderer.TemplateResponse("pages/blog/single_blog.html", context)
 
-    context = {"request": request, "post": post_schema}
-    return renderer.TemplateResponse("pages/blog/single_blog.html", context)
+    return await page_cache.fetch(request, render)
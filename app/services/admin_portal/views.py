@@ -1,14 +1,21 @@
+from typing import Any
+
+from starlette.requests import Request
 from starlette_admin import CustomView
 from starlette_admin.contrib.sqla import Admin
 from starlette_admin.contrib.sqla.ext.pydantic import ModelView
 from starlette_admin.views import Link
 
+from app.core.cache import page_cache
 from app.domain.permission.model import Permission
 from app.domain.permission.schema import PermissionSchema
 from app.domain.post.model import Post
 from app.domain.post.schema import PostSchema
 from app.domain.user.model import User
 from app.domain.user.schema import UserSchema
+from app.services.auth.cache import auth_cache
+from app.services.auth.security import is_password_hash
+from app.services.auth.security import password_hasher
 
 
 # TODO: Find a better way to implement this
@@ -23,6 +30,37 @@ class UserView(ModelView):
     ]
     exclude_fields_from_list = [User.password]  # type: ignore
 
+    async def before_create(self, request: Request, data: dict[str, Any], user: Any) -> None:
+        """Hash the submitted password in the hashing worker pool before the user is stored."""
+        user.password = await password_hasher.hash(user.password)
+
+    async def before_edit(self, request: Request, data: dict[str, Any], user: Any) -> None:
+        """Hash the password if it was changed; an unchanged field still holds the stored hash."""
+        if not is_password_hash(user.password):
+            user.password = await password_hasher.hash(user.password)
+
+    async def after_edit(self, request: Request, user: Any) -> None:
+        """Drop cached logins, which may carry the old password or privileges."""
+        auth_cache.invalidate_user(user.id)
+
+    async def after_delete(self, request: Request, user: Any) -> None:
+        """Drop cached logins so the deleted user cannot authenticate anymore."""
+        auth_cache.invalidate_user(user.id)
+
+
+class PostView(ModelView):
+    async def after_create(self, request: Request, obj: Any) -> None:
+        """Drop the cached blog pages so the new post shows up."""
+        await page_cache.invalidate()
+
+    async def after_edit(self, request: Request, obj: Any) -> None:
+        """Drop the cached blog pages so edits (e.g. publishing the post) show up."""
+        await page_cache.invalidate()
+
+    async def after_delete(self, request: Request, obj: Any) -> None:
+        """Drop the cached blog pages so the deleted post disappears."""
+        await page_cache.invalidate()
+
 
 def attach_admin_views(admin_interface: Admin) -> None:
     """Adds views to the admin interface."""
@@ -33,7 +71,7 @@ def attach_admin_views(admin_interface: Admin) -> None:
     # Add model views to admin panel
     admin_interface.add_view(UserView(User, pydantic_model=UserSchema.Create, icon="fa fa-users"))
     admin_interface.add_view(ModelView(Permission, pydantic_model=PermissionSchema.Create, icon="fa fa-lock"))
-    admin_interface.add_view(ModelView(Post, pydantic_model=PostSchema.Create, icon="fa fa-pen-to-square"))
+    admin_interface.add_view(PostView(Post, pydantic_model=PostSchema.Create, icon="fa fa-pen-to-square"))
 
     # Add links to admin panel
     admin_interface.add_view(Link(label="Go to frontend", icon="fa fa-link", url="/"))
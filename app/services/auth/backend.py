@@ -2,14 +2,19 @@ from loguru import logger
 from sqlalchemy.future import select
 from starlette.authentication import AuthCredentials
 from starlette.authentication import AuthenticationBackend
+from starlette.authentication import AuthenticationError
 from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from app.core.config.settings import app_config
 from app.core.database.session import get_session
 from app.domain.user.exception import AuthError
 from app.domain.user.model import User
+from app.services.auth.cache import auth_cache
 from app.services.auth.models import AuthUser
-from app.services.auth.security import pwd_context
+from app.services.auth.security import password_hasher
+from app.services.auth.security import verify_jwt
 
 
 async def verify_user_pw_from_db(username: str, password: str) -> User | None:
@@ -32,25 +37,57 @@ async def verify_user_pw_from_db(username: str, password: str) -> User | None:
         query = select(User).where(User.username == username)
         result = await session.execute(query)
         user = result.scalar_one_or_none()
-        # Verify the password using the password hashing context
-        if not user or not pwd_context.verify(password, str(user.password)):
+        # Verify the password in the hashing worker pool, keeping bcrypt off the event loop
+        if not user or not await password_hasher.verify(password, str(user.password)):
             raise AuthError.InvalidCredentialsError("Invalid username or password")
         return user  # Return the user object if authentication is successful
 
     return None  # Ensure function always returns something
 
 
+def on_auth_error(conn: HTTPConnection, exc: AuthenticationError) -> Response:
+    """
+    Respond to rejected credentials (e.g. an expired, tampered or revoked bearer token) with a 401.
+
+    The `WWW-Authenticate` header tells the client to obtain a new token from `/api/auth/token`.
+    """
+    return JSONResponse(
+        {"detail": str(exc)},
+        status_code=401,
+        headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+    )
+
+
 class BasicAuthBackend(AuthenticationBackend):
     """
     A basic authentication backend for verifying username and password.
 
     This implementation supports:
     - 1. Session-based authentication (via the session cookie)
-    - 2. Authentication via headers using username and password
+    - 2. Authentication via headers using username and password (successful checks are cached, see `AuthCache`)
     - 3. Special authentication via headers using "SECRET_KEY" as username and SECRET_KEY value as password
-    - 4. TODO: Add support for token-based authentication
+    - 4. Token-based authentication via an "Authorization: Bearer <token>" header (no database access)
     """
 
+    @staticmethod
+    def authenticate_bearer(token: str) -> tuple[AuthCredentials, AuthUser]:
+        """
+        Resolve identity and scopes purely from the claims of a signed access token.
+
+        Raises:
+            AuthenticationError: If the token is invalid, expired or revoked.
+        """
+        try:
+            claims = verify_jwt(token)
+        except (AuthError.InvalidTokenError, AuthError.TokenExpiredError) as e:
+            logger.debug("Bearer token rejected: {}", e)
+            raise AuthenticationError(str(e)) from e
+
+        logger.debug("Authenticated via bearer token.")
+        return AuthCredentials(claims.get("scopes", [])), AuthUser(
+            display_name=claims.get("name"), identity=claims["sub"]
+        )
+
     # TODO: Simplify function
     async def authenticate(self, conn: HTTPConnection) -> tuple[AuthCredentials, AuthUser] | None:  # noqa: PLR0911
         # 1. Session-based authentication
@@ -68,6 +105,12 @@ class BasicAuthBackend(AuthenticationBackend):
                 logger.debug("Authenticated via session without superuser privileges.")
                 return AuthCredentials(["authenticated"]), authenticated_user
 
+        # 4. Token-based authentication
+        # Checked before the credential headers as it never needs the database or bcrypt
+        scheme, _, token = conn.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            return self.authenticate_bearer(token)
+
         # 2. Authentication via headers using username and password
         # Check for Authorization-Username and Authorization-Password in the headers
         if "Authorization-Username" in conn.headers and "Authorization-Password" in conn.headers:
@@ -80,7 +123,13 @@ class BasicAuthBackend(AuthenticationBackend):
                 logger.debug("Authenticated via env variable SECRET_KEY.")
                 return AuthCredentials(["authenticated", "admin"]), AuthUser(display_name="secret_admin")
 
-            user = await verify_user_pw_from_db(auth_username, auth_password)
+            # Serve repeated requests with the same credentials from the cache to skip the DB query and bcrypt
+            user = auth_cache.get(auth_username, auth_password)
+            if user is None:
+                user = await verify_user_pw_from_db(auth_username, auth_password)
+                if user:
+                    auth_cache.set(auth_username, auth_password, user)
+
             if not user:
                 # Invalid username or password
                 logger.debug("Invalid username or password.")
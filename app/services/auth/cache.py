@@ -0,0 +1,127 @@
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.core.config.settings import app_config
+from app.domain.user.model import User
+
+
+@dataclass(slots=True)
+class AuthCacheStats:
+    """Counters describing how effective the authentication cache is."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class _AuthCacheEntry:
+    user: User
+    expires_at: float
+
+
+class AuthCache:
+    """
+    A bounded, in-process TTL cache of successful username/password verifications.
+
+    Verifying header credentials costs a database query plus a bcrypt check, so clients that send credentials
+    on every request are served from this cache while an entry is fresh.
+
+    - Keys are an HMAC of (username, password) under the application's SECRET_KEY; plain passwords are never stored.
+    - Only successful verifications are cached, so wrong passwords always reach the database and bcrypt.
+    - The least recently used entry is evicted when the cache is full.
+    - Entries of a user are dropped when `UserRepository.update`/`delete` or the admin interface changes that user.
+    """
+
+    def __init__(self, secret_key: str, ttl: float, max_size: int) -> None:
+        self._secret_key = secret_key.encode()
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, _AuthCacheEntry] = OrderedDict()
+        self._keys_by_user_id: dict[int, set[bytes]] = {}
+        self.stats = AuthCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if the cache stores anything at all."""
+        return self._ttl > 0 and self._max_size > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, username: str, password: str) -> User | None:
+        """Returns the cached user for these credentials, or None if they are not cached (or expired)."""
+        if not self.enabled:
+            return None
+
+        key = self._make_key(username, password)
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.user
+
+    def set(self, username: str, password: str, user: User) -> None:
+        """Caches a successful verification of these credentials."""
+        if not self.enabled:
+            return
+
+        key = self._make_key(username, password)
+        self._remove(key)
+        self._entries[key] = _AuthCacheEntry(user=user, expires_at=time.monotonic() + self._ttl)
+        self._keys_by_user_id.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > self._max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.stats.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drops every cached verification of the given user."""
+        for key in self._keys_by_user_id.pop(user_id, set()):
+            self._entries.pop(key, None)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drops all cached verifications."""
+        self._entries.clear()
+        self._keys_by_user_id.clear()
+
+    def _make_key(self, username: str, password: str) -> bytes:
+        """Derives the cache key from the credentials with a keyed hash (NUL cannot appear in header values)."""
+        return hmac.new(self._secret_key, f"{username}\0{password}".encode(), hashlib.sha256).digest()
+
+    def _remove(self, key: bytes) -> None:
+        """Removes an entry and its reverse-index reference."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        user_keys = self._keys_by_user_id.get(entry.user.id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user_id[entry.user.id]
+
+
+# Create a global instance of the authentication cache that can be imported into other modules.
+auth_cache = AuthCache(
+    secret_key=str(app_config.SECRET_KEY),
+    ttl=app_config.AUTH_CACHE_TTL,
+    max_size=app_config.AUTH_CACHE_SIZE,
+)
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class TokenSchema:
+    class Create(BaseModel):
+        username: str = Field(..., max_length=50, description="Username of the user")
+        password: str = Field(..., description="Password of the user")
+
+    class Read(BaseModel):
+        access_token: str
+        token_type: str = "bearer"
+        expires_in: int = Field(..., description="Lifetime of the access token in seconds")
+
+    class Revoke(BaseModel):
+        message: str
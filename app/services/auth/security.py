@@ -1,10 +1,34 @@
+import asyncio
+import hashlib
+import hmac
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+from typing import TypeVar
+
+import jwt
 from passlib.context import CryptContext
 
 from app.core.config.settings import app_config
+from app.domain.user.exception import AuthError
 
 # === CONSTANTS ===
 SECRET_KEY = str(app_config.SECRET_KEY)
 ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=app_config.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# Signing key for access tokens, derived from SECRET_KEY once at import instead of on every request
+JWT_SIGNING_KEY = hmac.new(SECRET_KEY.encode(), b"access-token", hashlib.sha256).digest()
+
+R = TypeVar("R")
 
 
 # === PW HASSHING CONTEXT ===
@@ -17,39 +41,186 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
-# from datetime import UTC
-# from datetime import datetime
-# from datetime import timedelta
-# import jwt
-# from fastapi import HTTPException
-# from fastapi import status
-
-# TODO: needs to be integrated
-# def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
-#     """Create a JWT token with optional expiration."""
-#     to_encode = data.copy()
-#     expire = datetime.now(UTC) + (expires_delta or timedelta(minutes=15))
-#     to_encode.update({"exp": expire})
-#     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-#     return encoded_jwt
-
-
-# TODO: needs to be integrated
-# def verify_jwt(token: str) -> dict:
-#     """Verify the validity of a JWT token."""
-#     try:
-#         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-#         exp = payload.get("exp")
-#         if exp and datetime.fromtimestamp(exp, UTC) < datetime.now(UTC):
-#             raise HTTPException(
-#                 status_code=status.HTTP_401_UNAUTHORIZED,
-#                 detail="Token has expired",
-#                 headers={"WWW-Authenticate": "Bearer"},
-#             )
-#         return payload
-#     except jwt.PyJWTError as e:
-#         raise HTTPException(
-#             status_code=status.HTTP_401_UNAUTHORIZED,
-#             detail="Invalid token",
-#             headers={"WWW-Authenticate": "Bearer"},
-#         ) from e
+def verify_password(password: str, hashed_password: str) -> bool:
+    """Verify a plain-text password against a bcrypt hash."""
+    return pwd_context.verify(password, hashed_password)
+
+
+def is_password_hash(value: str) -> bool:
+    """Return True if the value is already a hash recognised by the hashing context."""
+    return pwd_context.identify(value) is not None
+
+
+# === ASYNC PW HASHING SERVICE ===
+@dataclass(slots=True)
+class PasswordHasherStats:
+    """Gauges and counters describing the load on the password hashing pool."""
+
+    in_flight: int = 0  # Jobs currently running in the pool
+    queued: int = 0  # Jobs waiting for a free concurrency slot
+    max_queued: int = 0  # Highest queue depth observed
+    completed: int = 0
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification in a worker pool so they never block the event loop.
+
+    bcrypt is deliberately CPU-heavy (hundreds of milliseconds per call); executed inline it stalls every other
+    request served by the same worker. Jobs are bounded by a concurrency limit, and callers beyond it wait
+    in a queue whose depth is tracked in `stats`.
+    """
+
+    def __init__(self, executor_type: str, max_workers: int, max_concurrency: int) -> None:
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Unsupported password hash executor: {executor_type!r}. Use 'thread' or 'process'.")
+
+        self._executor_type = executor_type
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self.stats = PasswordHasherStats()
+
+    async def hash(self, password: str) -> str:
+        """Hash a plain-text password in the worker pool."""
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a plain-text password against a bcrypt hash in the worker pool."""
+        return await self._run(verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool; a new one is created on the next call."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., R], *args: str) -> R:
+        """Run a hashing function in the pool once a concurrency slot is free."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        if self._semaphore.locked():  # All slots are taken, so this job has to wait in the queue
+            self.stats.queued += 1
+            self.stats.max_queued = max(self.stats.max_queued, self.stats.queued)
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.stats.queued -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.stats.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.stats.in_flight -= 1
+            self.stats.completed += 1
+            self._semaphore.release()
+
+    def _get_executor(self) -> Executor:
+        """Create the worker pool lazily, so importing this module never spawns threads or processes."""
+        if self._executor is None:
+            if self._executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="pw-hash")
+        return self._executor
+
+
+# Create a global instance of the password hasher that can be imported into other modules.
+password_hasher = PasswordHasher(
+    executor_type=app_config.PASSWORD_HASH_EXECUTOR,
+    max_workers=app_config.PASSWORD_HASH_WORKERS,
+    max_concurrency=app_config.PASSWORD_HASH_MAX_CONCURRENCY,
+)
+
+
+# === JWT ACCESS TOKENS ===
+class TokenRevocationList:
+    """
+    A small in-process set of revoked token IDs (`jti` claims).
+
+    Entries are kept only until the revoked token would have expired anyway, so the list stays as small
+    as the number of tokens revoked within one token lifetime.
+
+    NOTE: The list lives in the memory of one worker process. With several workers, a token revoked on one
+    worker is still accepted by the others until it expires; keep ACCESS_TOKEN_EXPIRE_MINUTES short, or
+    replace this class with one backed by a shared store (e.g. Redis) exposing the same methods.
+    """
+
+    def __init__(self) -> None:
+        self._revoked: dict[str, float] = {}  # jti -> expiry timestamp of the revoked token
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """Revoke a token until its expiry timestamp."""
+        self._prune()
+        self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti: str) -> bool:
+        """Return True if the token ID has been revoked."""
+        return jti in self._revoked
+
+    def _prune(self) -> None:
+        """Forget revocations of tokens that have expired by now."""
+        now = time.time()
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+
+# Create a global revocation list that can be imported into other modules.
+revoked_tokens = TokenRevocationList()
+
+
+def create_access_token(subject: str, name: str, scopes: list[str], expires_delta: timedelta | None = None) -> str:
+    """
+    Create a signed access token carrying everything needed to authenticate a request.
+
+    Args:
+        subject (str): The unique identifier of the user (`sub` claim).
+        name (str): The display name of the user (`name` claim).
+        scopes (list[str]): The authorization scopes granted to the token holder (`scopes` claim).
+        expires_delta (timedelta | None): Token lifetime, defaults to ACCESS_TOKEN_EXPIRE_MINUTES.
+
+    Returns:
+        str: The encoded JWT.
+    """
+    issued_at = datetime.now(UTC)
+    claims = {
+        "sub": subject,
+        "name": name,
+        "scopes": scopes,
+        "iat": issued_at,
+        "exp": issued_at + (expires_delta or ACCESS_TOKEN_EXPIRE),
+        "jti": uuid.uuid4().hex,
+    }
+    return jwt.encode(claims, JWT_SIGNING_KEY, algorithm=ALGORITHM)
+
+
+def verify_jwt(token: str) -> dict[str, Any]:
+    """
+    Verify an access token and return its claims, without touching the database.
+
+    Raises:
+        AuthError.TokenExpiredError: If the token has expired.
+        AuthError.InvalidTokenError: If the token is malformed, wrongly signed, incomplete or revoked.
+    """
+    try:
+        claims: dict[str, Any] = jwt.decode(
+            token,
+            JWT_SIGNING_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": ["sub", "exp", "jti"]},
+        )
+    except jwt.ExpiredSignatureError as e:
+        raise AuthError.TokenExpiredError("Token has expired") from e
+    except jwt.PyJWTError as e:
+        raise AuthError.InvalidTokenError("Invalid token") from e
+
+    if revoked_tokens.is_revoked(claims["jti"]):
+        raise AuthError.InvalidTokenError("Token has been revoked")
+    return claims
@@ -0,0 +1,60 @@
+import statistics
+import sys
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from loguru import logger
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def add_project_to_path() -> None:
+    """Makes the `app` package importable when a benchmark is run as a standalone script."""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@dataclass
+class BenchmarkResult:
+    """Latencies (in seconds) of the operations of one benchmark run."""
+
+    label: str
+    latencies: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Returns the latency percentile in milliseconds."""
+        if len(self.latencies) < 2:  # noqa: PLR2004
+            return (self.latencies[0] if self.latencies else 0.0) * 1000
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[int(percent) - 1] * 1000
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of operations per second."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+
+async def measure(label: str, operation: Callable[[], Awaitable[object]], iterations: int) -> BenchmarkResult:
+    """Runs the operation sequentially and records the latency of every call."""
+    result = BenchmarkResult(label=label)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await operation()
+        result.latencies.append(time.perf_counter() - call_started)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def log_results(results: list[BenchmarkResult], unit: str = "req/s") -> None:
+    """Logs a comparison table of benchmark results."""
+    logger.info(f"{'benchmark':<40} {'p50 ms':>10} {'p99 ms':>10} {unit:>12}")
+    for result in results:
+        logger.info(
+            f"{result.label:<40} {result.percentile(50):>10.3f} {result.percentile(99):>10.3f} "
+            f"{result.throughput:>12.1f}"
+        )
@@ -0,0 +1,81 @@
+# Benchmarks the throughput (records/sec) of standard logging records bridged to Loguru by `InterceptHandler`
+# with each caller strategy, against the previous implementation, and the cost of records below the log level.
+# Loguru writes to a sink discarding the formatted messages, so only the bridge and the formatting are measured.
+# Run it from the project root inside the project environment, e.g.: `task bench-logging`
+import argparse
+import inspect
+import logging
+import time
+
+from _helpers import BenchmarkResult
+from _helpers import add_project_to_path
+from _helpers import log_results
+from loguru import logger
+
+add_project_to_path()
+
+from app.core.logging.logger import FILE_FORMAT  # noqa: E402
+from app.core.logging.logger import InterceptHandler  # noqa: E402
+from app.core.logging.logger import skip_stdlib_record_details  # noqa: E402
+
+ALL_LEVELS = 1  # A stdlib logger level letting every record through (NOTSET would inherit the root's WARNING)
+
+
+# === PREVIOUS IMPLEMENTATION (for comparison) ===
+class LegacyInterceptHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level: str | int = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+def run(label: str, handler: logging.Handler, logger_level: int, records: int, record_level: int) -> BenchmarkResult:
+    """Logs records through a stdlib logger using the handler and records the latency of every call."""
+    std_logger = logging.getLogger(f"bench.{label}")
+    std_logger.handlers = [handler]
+    std_logger.propagate = False
+    std_logger.setLevel(logger_level)
+
+    result = BenchmarkResult(label=label)
+    started = time.perf_counter()
+    for index in range(records):
+        call_started = time.perf_counter()
+        std_logger.log(record_level, "Record %d of the benchmark", index)
+        result.latencies.append(time.perf_counter() - call_started)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark stdlib logging records bridged to Loguru.")
+    parser.add_argument("--records", type=int, default=50_000, help="Number of records per configuration.")
+    args = parser.parse_args()
+
+    logger.remove()
+    handler_id = logger.add(lambda message: None, format=FILE_FORMAT, level="INFO")
+    run("warm-up", InterceptHandler(), ALL_LEVELS, args.records // 10, logging.INFO)
+    results = [
+        run("legacy (level lookup, frames)", LegacyInterceptHandler(), ALL_LEVELS, args.records, logging.INFO),
+        run("caller=frame", InterceptHandler(caller="frame"), ALL_LEVELS, args.records, logging.INFO),
+        run("caller=record", InterceptHandler(caller="record"), ALL_LEVELS, args.records, logging.INFO),
+    ]
+    skip_stdlib_record_details()  # As `setup_logging` does
+    results += [
+        run("caller=record, lean stdlib records", InterceptHandler(), ALL_LEVELS, args.records, logging.INFO),
+        # DEBUG records with LOG_LEVEL=INFO: dropped by Loguru, or by the stdlib logger's level (`setup_logging`)
+        run("debug, bridged then dropped", InterceptHandler(), ALL_LEVELS, args.records, logging.DEBUG),
+        run("debug, dropped by stdlib level", InterceptHandler(), logging.INFO, args.records, logging.DEBUG),
+    ]
+    logger.remove(handler_id)
+    logger.add(lambda message: print(message, end=""), format="{message}")
+    log_results(results, unit="records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Benchmarks the request latency of the application's middleware stack with the pure ASGI middlewares
+# against the previous `BaseHTTPMiddleware` implementations.
+# Run it from the project root inside the project environment, e.g.: `task bench-middleware`
+import argparse
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from _helpers import BenchmarkResult
+from _helpers import add_project_to_path
+from _helpers import log_results
+from _helpers import measure
+from loguru import logger
+
+add_project_to_path()
+
+from fastapi import FastAPI  # noqa: E402
+from httpx import ASGITransport  # noqa: E402
+from httpx import AsyncClient  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.core.database import import_models_modules  # noqa: E402
+from app.core.database.engine import engine  # noqa: E402
+from app.core.gateway.middleware import BasicCSRFMiddleware  # noqa: E402
+from app.core.gateway.middleware import HtmxStateMiddleware  # noqa: E402
+from app.main import AppManager  # noqa: E402
+
+ROUTES = ["/", "/blog/"]
+
+
+# === PREVIOUS IMPLEMENTATIONS (for comparison) ===
+class LegacyBasicCSRFMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        if request.method != "GET" and not request.cookies.get("csrf_flag"):
+            return Response(status_code=403)
+        request.state.csrf_flag = request.cookies.get("csrf_flag", None)
+        response = await call_next(request)
+        if not request.state.csrf_flag:
+            response.set_cookie(
+                key=BasicCSRFMiddleware.CSRF_COOKIE_NAME,
+                value=BasicCSRFMiddleware.CSRF_COOKIE_VALUE,
+                max_age=BasicCSRFMiddleware.CSRF_MAX_AGE,
+                path="/",
+                samesite="strict",
+                secure=True,
+                httponly=True,
+            )
+        return response
+
+
+class LegacyHtmxStateMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        request.state.is_htmx_request = request.headers.get("hx-request") == "true"
+        return await call_next(request)
+
+
+LEGACY_MIDDLEWARES = {BasicCSRFMiddleware: LegacyBasicCSRFMiddleware, HtmxStateMiddleware: LegacyHtmxStateMiddleware}
+
+
+def build_app(legacy: bool) -> FastAPI:
+    """Builds the application with its regular middleware stack (CSRF included), optionally with legacy classes."""
+    app = FastAPI()
+    AppManager(app)
+    if not any(middleware.cls is BasicCSRFMiddleware for middleware in app.user_middleware):
+        app.add_middleware(BasicCSRFMiddleware)  # Only added in production, benchmark it regardless
+    if legacy:
+        app.user_middleware = [
+            Middleware(LEGACY_MIDDLEWARES[middleware.cls]) if middleware.cls in LEGACY_MIDDLEWARES else middleware
+            for middleware in app.user_middleware
+        ]
+    return app
+
+
+async def run_benchmark(iterations: int, warmup: int) -> list[BenchmarkResult]:
+    """Measures every route against both middleware implementations."""
+    import_models_modules()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    results = []
+    for route in ROUTES:
+        for legacy in (True, False):
+            app = build_app(legacy)
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+
+                async def request(client: AsyncClient = client, route: str = route) -> None:
+                    response = await client.get(route)
+                    response.raise_for_status()
+
+                for _ in range(warmup):
+                    await request()
+                label = f"GET {route} ({'BaseHTTPMiddleware' if legacy else 'pure ASGI'})"
+                results.append(await measure(label, request, iterations))
+
+    await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare pure ASGI and BaseHTTPMiddleware latency.")
+    parser.add_argument("--iterations", type=int, default=2000, help="Measured requests per route and variant")
+    parser.add_argument("--warmup", type=int, default=200, help="Unmeasured requests per route and variant")
+    args = parser.parse_args()
+
+    logger.remove()  # Silence per-request application logs during measurement
+    benchmark_results = asyncio.run(run_benchmark(args.iterations, args.warmup))
+    logger.add(lambda message: print(message, end=""), format="{message}")
+    log_results(benchmark_results)
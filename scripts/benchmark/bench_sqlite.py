@@ -0,0 +1,87 @@
+# Benchmarks concurrent reads and writes against an SQLite file database with the default settings (rollback
+# journal, a pool of read-write connections) and with the tuning profile (WAL, a single writer, read-only readers).
+# Run it from the project root inside the project environment, e.g.: `task bench-sqlite`
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from _helpers import BenchmarkResult
+from _helpers import add_project_to_path
+from _helpers import log_results
+from loguru import logger
+
+add_project_to_path()
+
+from sqlalchemy import exc  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine  # noqa: E402
+
+from app.core.config import app_config  # noqa: E402
+from app.core.database.engine import DatabaseEngineFactory  # noqa: E402
+
+SEED_ROWS = 1000
+
+
+async def run_worker(engine: AsyncEngine, statement: str, result: BenchmarkResult, deadline: float) -> int:
+    """Runs the statement in its own transaction until the deadline; returns the number of failed attempts."""
+    errors = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(statement))
+        except exc.OperationalError:  # e.g. "database is locked"
+            errors += 1
+            continue
+        result.latencies.append(time.perf_counter() - started)
+    return errors
+
+
+async def run_mode(tuned: bool, readers: int, writers: int, duration: float, directory: Path) -> list[BenchmarkResult]:
+    """Runs concurrent readers and writers against a fresh database, with or without the tuning profile."""
+    label = "tuned" if tuned else "default"
+    app_config.SQLITE_TUNING = tuned
+    url = f"sqlite+aiosqlite:///{directory / f'{label}.db'}"
+    writer_engine = DatabaseEngineFactory.get_engine(url)
+    reader_engine = DatabaseEngineFactory.get_engine(url, read_only=True) if tuned else writer_engine
+
+    async with writer_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)"))
+        await conn.execute(text("INSERT INTO item (payload) VALUES (:payload)"), [{"payload": "seed"}] * SEED_ROWS)
+
+    reads = BenchmarkResult(f"{label}: reads ({readers} tasks)")
+    writes = BenchmarkResult(f"{label}: writes ({writers} tasks)")
+    read_sql = "SELECT id, payload FROM item ORDER BY id DESC LIMIT 20"
+    write_sql = "INSERT INTO item (payload) VALUES ('benchmark')"
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    errors = await asyncio.gather(
+        *(run_worker(reader_engine, read_sql, reads, deadline) for _ in range(readers)),
+        *(run_worker(writer_engine, write_sql, writes, deadline) for _ in range(writers)),
+    )
+    reads.elapsed = writes.elapsed = time.perf_counter() - started
+    logger.info(f"{label}: {sum(errors)} failed attempts (locked database)")
+
+    await writer_engine.dispose()
+    await reader_engine.dispose()
+    return [reads, writes]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent SQLite reads and writes.")
+    parser.add_argument("--readers", type=int, default=8, help="Number of concurrent reading tasks.")
+    parser.add_argument("--writers", type=int, default=4, help="Number of concurrent writing tasks.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds each configuration runs.")
+    args = parser.parse_args()
+
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for tuned in (False, True):
+            results += await run_mode(tuned, args.readers, args.writers, args.duration, Path(directory))
+    log_results(results, unit="ops/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
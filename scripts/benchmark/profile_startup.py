@@ -0,0 +1,87 @@
+# Profiles the startup of a worker: the import time of every module (`python -X importtime`) and the time spent
+# in each `AppManager` setup step. The application is imported in a fresh interpreter, as a worker would.
+# Run it from the project root inside the project environment, e.g.: `task profile-startup`
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from _helpers import PROJECT_ROOT
+from loguru import logger
+
+# Imports the application and prints the setup step timings as JSON on the last line of stdout
+STARTUP_SNIPPET = """
+import json, time
+started_at = time.perf_counter()
+from app.main import app_manager
+elapsed = time.perf_counter() - started_at
+print(json.dumps({"total": elapsed, "steps": app_manager.step_timings}))
+"""
+
+
+@dataclass
+class ModuleImport:
+    """Import time (in microseconds) of one module, as reported by `-X importtime`."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_import_times(stderr: str) -> list[ModuleImport]:
+    """Parses the `-X importtime` report, e.g. `import time:       412 |       1520 |   app.core.config`."""
+    imports: list[ModuleImport] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        if len(fields) != 3 or not fields[0].isdigit():  # noqa: PLR2004  (skips the header)
+            continue
+        imports.append(ModuleImport(name=fields[2], self_us=int(fields[0]), cumulative_us=int(fields[1])))
+    return imports
+
+
+def package_totals(imports: list[ModuleImport]) -> dict[str, int]:
+    """Sums the self import time of the modules of every top-level package."""
+    totals: dict[str, int] = {}
+    for module in imports:
+        package = module.name.split(".")[0]
+        totals[package] = totals.get(package, 0) + module.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile the import time and setup steps of the application.")
+    parser.add_argument("--top", type=int, default=20, help="Number of modules and packages to report.")
+    args = parser.parse_args()
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SNIPPET],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        logger.error(f"Importing the application failed:\n{completed.stderr[-2000:]}")
+        sys.exit(completed.returncode)
+    startup = json.loads(completed.stdout.strip().splitlines()[-1])
+    imports = parse_import_times(completed.stderr)
+
+    logger.info(f"{'slowest modules (cumulative)':<60} {'self ms':>10} {'total ms':>10}")
+    for module in sorted(imports, key=lambda module: module.cumulative_us, reverse=True)[: args.top]:
+        logger.info(f"{module.name:<60} {module.self_us / 1000:>10.1f} {module.cumulative_us / 1000:>10.1f}")
+
+    logger.info(f"{'packages (self time)':<60} {'ms':>10}")
+    for package, self_us in list(package_totals(imports).items())[: args.top]:
+        logger.info(f"{package:<60} {self_us / 1000:>10.1f}")
+
+    logger.info(f"{'AppManager steps':<60} {'ms':>10}")
+    for step, seconds in startup["steps"].items():
+        logger.info(f"{step:<60} {seconds * 1000:>10.1f}")
+    logger.info(f"Importing `app.main` took {startup['total'] * 1000:.1f} ms ({len(imports)} modules).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,15 @@
 # TODO: This file needs more work to be done.
+import sys
+from pathlib import Path
 
 API_BASE_URL = "http://127.0.0.1:8000"  # TODO: replace with a variable
 BLOG_URL = f"{API_BASE_URL}/api/blog"
 SUPERUSER_URL = f"{API_BASE_URL}/api/auth/users"
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def add_project_to_path() -> None:
+    """Makes the `app` package importable when a script writing to the database directly is run standalone."""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
@@ -0,0 +1,223 @@
+# Seeds the database with a synthetic dataset (users, permissions and posts) for development and load tests.
+# - `--target db` writes straight to the configured database with the repositories' bulk inserts.
+# - `--target api` goes through a running server's HTTP API with an async client and bounded concurrency
+#   (users one by one, posts through the NDJSON import endpoint); permissions have no API and are skipped.
+# Run it from the project root inside the project environment, e.g.: `task seed -- --posts 100000 --users 2000`
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+import httpx
+from _helpers import API_BASE_URL
+from _helpers import add_project_to_path
+from loguru import logger
+
+WORDS = (
+    "async api cache query index schema session worker pool latency stream render template route model "
+    "request response token user post blog draft publish feature release deploy metric trace log debug "
+    "python fastapi starlette sqlalchemy jinja htmx tailwind database replica batch commit migrate"
+).split()
+
+# The password of every seeded user (hashed once in `--target db`)
+SEED_PASSWORD = "seed-password"
+
+
+@dataclass
+class SeedReport:
+    """Rows written to one table and the time it took."""
+
+    table: str
+    rows: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+class DatasetGenerator:
+    """
+    Generates synthetic rows; the same seed always produces the same dataset.
+
+    - Post lengths follow a log-normal distribution of words around `--words-median`.
+    - Authors follow a Zipf distribution (`--author-skew`, 0 for uniform): a few users write most posts.
+    - Post dates are spread over the last `--days` days.
+    """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.now = datetime.now(UTC)
+
+    def users(self) -> list[dict[str, Any]]:
+        return [
+            {"username": f"{self.args.prefix}_user_{index:07d}", "full_name": f"Seed User {index}"}
+            for index in range(self.args.users)
+        ]
+
+    def permissions(self) -> list[dict[str, Any]]:
+        return [
+            {"name": f"{self.args.prefix}_permission_{index:03d}", "description": self.sentence(6)}
+            for index in range(self.args.permissions)
+        ]
+
+    def user_permissions(self, user_ids: list[int], permission_ids: list[int]) -> list[dict[str, int]]:
+        """Grants each user up to `--permissions-per-user` random permissions."""
+        links: list[dict[str, int]] = []
+        for user_id in user_ids:
+            count = self.rng.randint(0, min(self.args.permissions_per_user, len(permission_ids)))
+            links.extend({"user_id": user_id, "permission_id": pid} for pid in self.rng.sample(permission_ids, count))
+        return links
+
+    def posts(self, author_ids: list[int | None]) -> Iterator[dict[str, Any]]:
+        """Yields `--posts` posts, lazily, so that large datasets are never held in memory at once."""
+        ranks = range(1, len(author_ids) + 1)
+        cum_weights = list(itertools.accumulate(1 / rank**self.args.author_skew for rank in ranks))
+        mu = math.log(self.args.words_median)
+        for _ in range(self.args.posts):
+            post_date = self.now - timedelta(seconds=self.rng.uniform(0, self.args.days * 86400))
+            published = self.rng.random() < self.args.published_ratio
+            yield {
+                "title": self.sentence(self.rng.randint(3, 10))[:100],
+                "content": self.sentence(max(1, int(self.rng.lognormvariate(mu, self.args.words_sigma)))),
+                "post_status": "PUBLISHED" if published else "DRAFT",
+                "post_metadata": {"tags": self.rng.sample(WORDS, 3)} if self.rng.random() < 0.3 else None,  # noqa: PLR2004
+                "post_date": post_date,
+                "post_modified": post_date,
+                "user_id": self.rng.choices(author_ids, cum_weights=cum_weights)[0],
+            }
+
+    def sentence(self, words: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=words)).capitalize()
+
+
+async def seed_database(generator: DatasetGenerator, batch_size: int) -> list[SeedReport]:
+    """Writes the dataset to the configured database with bulk inserts."""
+    add_project_to_path()
+    from sqlalchemy import insert
+
+    from app.core.database import import_models_modules
+    from app.core.database.session import async_session_maker
+    from app.domain.permission.model import Permission
+    from app.domain.permission.model import user_permission_table
+    from app.domain.post.crud import PostRepository
+    from app.domain.user.crud import UserRepository
+    from app.services.auth.security import hash_password
+
+    import_models_modules()
+    reports: list[SeedReport] = []
+    async with async_session_maker() as session:
+        started = time.perf_counter()
+        password = hash_password(SEED_PASSWORD)  # bcrypt is slow by design: hash once, share it
+        users = [{**user, "password": password} for user in generator.users()]
+        user_ids = await UserRepository(session).add_many(users, batch_size)
+        reports.append(SeedReport("user", len(user_ids), time.perf_counter() - started))
+
+        started = time.perf_counter()
+        permission_ids = list(
+            (await session.execute(insert(Permission).returning(Permission.id), generator.permissions())).scalars()
+        )
+        links = generator.user_permissions(sorted(user_ids), permission_ids)
+        if links:
+            await session.execute(insert(user_permission_table), links)
+        await session.commit()
+        reports.append(SeedReport("permission", len(permission_ids) + len(links), time.perf_counter() - started))
+
+        report, started = SeedReport("post"), time.perf_counter()
+        repository = PostRepository(session)
+        posts = generator.posts(sorted(user_ids) or [None])
+        while batch := list(itertools.islice(posts, batch_size)):
+            report.rows += len(await repository.add_many(batch, batch_size))
+            logger.debug(f"{report.rows} posts written")
+        report.elapsed = time.perf_counter() - started
+        reports.append(report)
+    return reports
+
+
+async def seed_api(generator: DatasetGenerator, args: argparse.Namespace) -> list[SeedReport]:
+    """Sends the dataset to a running server, with at most `--concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+        response = await client.post("/api/auth/token", json={"username": args.username, "password": args.password})
+        response.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+        async def send(url: str, **kwargs: Any) -> None:
+            async with semaphore:
+                (await client.post(url, **kwargs)).raise_for_status()
+
+        users = SeedReport("user")
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(send("/api/auth/users", json={**user, "password": SEED_PASSWORD}) for user in generator.users())
+        )
+        users.rows, users.elapsed = args.users, time.perf_counter() - started
+
+        posts = SeedReport("post")
+        started = time.perf_counter()
+        columns = ("title", "content", "post_status", "post_metadata")  # The import API sets authors and dates
+        batches = itertools.batched(generator.posts([None]), args.batch_size)
+        await asyncio.gather(
+            *(
+                send(
+                    "/api/blog/import",
+                    content="\n".join(json.dumps({key: post[key] for key in columns}) for post in batch),
+                    headers={"Content-Type": "application/x-ndjson"},
+                )
+                for batch in batches
+            )
+        )
+        posts.rows, posts.elapsed = args.posts, time.perf_counter() - started
+    return [users, posts]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the database with synthetic users, permissions and posts.")
+    parser.add_argument("--target", choices=("db", "api"), default="db", help="Write to the database or the API.")
+    parser.add_argument("--users", type=int, default=1000, help="Number of users.")
+    parser.add_argument("--permissions", type=int, default=20, help="Number of permissions (db only).")
+    parser.add_argument("--permissions-per-user", type=int, default=3, help="Maximum permissions per user.")
+    parser.add_argument("--posts", type=int, default=100_000, help="Number of posts.")
+    parser.add_argument("--words-median", type=float, default=250, help="Median number of words of a post.")
+    parser.add_argument("--words-sigma", type=float, default=0.8, help="Spread of the post lengths (log-normal).")
+    parser.add_argument("--author-skew", type=float, default=1.1, help="Zipf exponent of authors, 0 for uniform.")
+    parser.add_argument("--published-ratio", type=float, default=0.8, help="Share of published posts.")
+    parser.add_argument("--days", type=int, default=365, help="Posts are dated over this many past days.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per insert or import request.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight (api only).")
+    parser.add_argument("--base-url", default=API_BASE_URL, help="Server to seed (api only).")
+    parser.add_argument("--username", help="Admin username used to get an access token (api only).")
+    parser.add_argument("--password", help="Admin password (api only).")
+    parser.add_argument("--prefix", default="seed", help="Prefix of the user and permission names (must be unique).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed, for reproducible datasets.")
+    args = parser.parse_args()
+    if args.target == "api" and not (args.username and args.password):
+        parser.error("--target api requires --username and --password of an admin user")
+
+    generator = DatasetGenerator(args)
+    started = time.perf_counter()
+    if args.target == "db":
+        reports = asyncio.run(seed_database(generator, args.batch_size))
+    else:
+        reports = asyncio.run(seed_api(generator, args))
+    elapsed = time.perf_counter() - started
+
+    logger.info(f"{'table':<20} {'rows':>10} {'seconds':>10} {'rows/s':>12}")
+    for report in reports:
+        logger.info(f"{report.table:<20} {report.rows:>10} {report.elapsed:>10.2f} {report.rows_per_second:>12.1f}")
+    total = sum(report.rows for report in reports)
+    logger.success(f"Seeded {total} rows in {elapsed:.2f} s ({total / elapsed:.1f} rows/s).")
+
+
+if __name__ == "__main__":
+    main()
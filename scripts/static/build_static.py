@@ -0,0 +1,23 @@
+# Fingerprints the static assets into `app/static/dist/`, writes their gzip/brotli variants and the manifest
+# that `static()` uses in templates to resolve hashed URLs.
+# Run it from the project root inside the project environment, e.g.: `task build-static`
+# Brotli variants are only written when `brotli` is installed (`uv sync --extra static`).
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.static import STATIC_DIR  # noqa: E402
+from app.core.static import build_static_assets  # noqa: E402
+from app.core.static.assets import brotli  # noqa: E402
+
+if __name__ == "__main__":
+    manifest = build_static_assets(PROJECT_ROOT / STATIC_DIR)
+    for path, hashed_path in manifest.assets.items():
+        logger.info(f"{path} -> {hashed_path}")
+    if brotli is None:
+        logger.warning("brotli is not installed; only gzip variants were written.")
+    logger.info(f"Built {len(manifest.assets)} static assets into '{manifest.dist_dir}'.")
@@ -0,0 +1,159 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from starlette.responses import HTMLResponse
+from starlette.responses import Response
+
+from app.core.cache import LocalCacheBackend
+from app.core.cache import PageCache
+from app.core.cache import page_cache
+from app.domain.post.crud import PostRepository
+from app.domain.post.model import Post
+
+
+def make_request(
+    query: str = "",
+    headers: dict[str, str] | None = None,
+    is_htmx_request: bool = False,
+    htmx_target: str | None = None,
+) -> Request:
+    """Builds a GET request for the blog page."""
+    raw_headers = [(b"host", b"testserver")] + [(k.encode(), v.encode()) for k, v in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/blog/",
+        "query_string": query.encode(),
+        "headers": raw_headers,
+        "state": {"is_htmx_request": is_htmx_request, "htmx_target": htmx_target},
+    }
+    return Request(scope)
+
+
+class Renderer:
+    """Counts renders of a page whose body changes with every render."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> Response:
+        self.calls += 1
+        return HTMLResponse(f"<p>render {self.calls}</p>")
+
+
+def make_cache(max_size: int = 16, ttl: float = 60) -> PageCache:
+    return PageCache(backend=LocalCacheBackend(max_size=max_size), ttl=ttl)
+
+
+async def test_second_request_is_served_from_cache() -> None:
+    """Test that a page is rendered once and then served from the cache with the same ETag."""
+    cache, render = make_cache(), Renderer()
+
+    first = await cache.fetch(make_request(), render)
+    second = await cache.fetch(make_request(), render)
+
+    assert render.calls == 1
+    assert second.body == first.body == b"<p>render 1</p>"
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["vary"] == "HX-Request, HX-Target"
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+
+async def test_key_depends_on_params_and_htmx_target() -> None:
+    """Test that query parameter order is ignored, but their values and the HTMX target are not."""
+    htmx_main, htmx_fragment = make_request(is_htmx_request=True), make_request(is_htmx_request=True, htmx_target="x")
+
+    assert PageCache.make_key(make_request("a=1&b=2")) == PageCache.make_key(make_request("b=2&a=1"))
+    assert PageCache.make_key(make_request("a=1")) != PageCache.make_key(make_request("a=2"))
+    assert len({PageCache.make_key(request) for request in (make_request(), htmx_main, htmx_fragment)}) == 3  # noqa: PLR2004
+
+
+async def test_matching_etag_returns_not_modified() -> None:
+    """Test that a request carrying the current ETag gets an empty 304."""
+    cache, render = make_cache(), Renderer()
+    etag = (await cache.fetch(make_request(), render)).headers["etag"]
+
+    response = await cache.fetch(make_request(headers={"if-none-match": f'"other", {etag}'}), render)
+
+    assert response.status_code == 304  # noqa: PLR2004
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_invalidate_drops_pages_rendered_before_it() -> None:
+    """Test that pages are re-rendered after an invalidation, even if the render started before it."""
+    cache = make_cache()
+
+    async def render_across_invalidation() -> Response:
+        await cache.invalidate()  # e.g. a post is published while this page is being rendered
+        return HTMLResponse("<p>stale</p>")
+
+    await cache.fetch(make_request(), render_across_invalidation)
+    render = Renderer()
+    response = await cache.fetch(make_request(), render)
+
+    assert render.calls == 1
+    assert response.body == b"<p>render 1</p>"
+
+
+async def test_error_responses_are_not_cached() -> None:
+    """Test that non-200 responses are passed through and not stored."""
+    cache = make_cache()
+
+    async def render_not_found() -> Response:
+        return HTMLResponse("missing", status_code=404)
+
+    response = await cache.fetch(make_request(), render_not_found)
+
+    assert response.status_code == 404  # noqa: PLR2004
+    assert await cache.backend.get(PageCache.make_key(make_request())) is None
+
+
+async def test_disabled_cache_renders_every_time_but_keeps_etags() -> None:
+    """Test that a zero TTL disables storage while conditional requests still work."""
+    cache, render = make_cache(ttl=0), Renderer()
+
+    first = await cache.fetch(make_request(), render)
+    await cache.fetch(make_request(), render)
+
+    assert render.calls == 2  # noqa: PLR2004
+    assert "etag" in first.headers
+
+
+async def test_local_backend_evicts_least_recently_used() -> None:
+    """Test that the local backend holds at most `max_size` pages."""
+    backend: LocalCacheBackend[str] = LocalCacheBackend(max_size=2)
+    await backend.set("a", "A", ttl=60)
+    await backend.set("b", "B", ttl=60)
+    await backend.get("a")
+    await backend.set("c", "C", ttl=60)
+
+    assert await backend.get("a") == "A"
+    assert await backend.get("b") is None
+    assert backend.evictions == 1
+
+
+async def test_local_backend_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that entries are dropped once their TTL has passed."""
+    backend: LocalCacheBackend[str] = LocalCacheBackend(max_size=2)
+    monkeypatch.setattr("app.core.cache.backend.time.monotonic", lambda: 100.0)
+    await backend.set("a", "A", ttl=10)
+
+    monkeypatch.setattr("app.core.cache.backend.time.monotonic", lambda: 110.0)
+
+    assert await backend.get("a") is None
+
+
+async def test_repository_writes_invalidate_the_page_cache(test_db_session: AsyncSession) -> None:
+    """Test that adding, publishing and deleting posts each drop the cached pages."""
+    repository = PostRepository(test_db_session)
+    invalidations = page_cache.stats.invalidations
+    post = Post(title="Cached", content="Content")
+
+    await repository.add(post)
+    await repository.publish(post)
+    await repository.delete(post)
+
+    assert page_cache.stats.invalidations == invalidations + 3
@@ -1,7 +1,12 @@
 import asyncio
 from asyncio import AbstractEventLoop
+from collections import Counter
 from collections.abc import AsyncGenerator
+from collections.abc import Callable
 from collections.abc import Generator
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
 from typing import Any
 
 import pytest
@@ -11,6 +16,9 @@ from app.core.database import Base
 from app.core.database import import_models_modules
 from app.core.database.engine import engine
 from app.core.database.session import async_session_maker
+from app.core.metrics import QueryStats
+from app.core.metrics import current_query_stats
+from app.core.metrics import instrument_engine
 
 
 @pytest.fixture(scope="session")
@@ -43,3 +51,31 @@ async def test_db_session() -> AsyncGenerator[Any, Any]:
 
     # Dispose the engine to close database connections
     await engine.dispose()
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., AbstractContextManager[QueryStats]]:
+    """
+    Fail the test if the code run in a block executes more statements than its budget, e.g.:
+    `with query_budget(2, max_repeats=1): await client.get("/api/blog/")`
+
+    `max_repeats` also limits how many times a statement of the same shape may run, which catches N+1 queries.
+    Statements of application requests are counted too (the request stats record them in the budget's stats).
+    """
+    instrument_engine(engine)
+
+    @contextmanager
+    def budget(max_queries: int, max_repeats: int | None = None) -> Iterator[QueryStats]:
+        stats = QueryStats(statements=Counter(), parent=current_query_stats.get())
+        token = current_query_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            current_query_stats.reset(token)
+        statements = "\n".join(f"{count} x {shape}" for shape, count in (stats.statements or {}).items())
+        assert stats.queries <= max_queries, f"{stats.queries} statements, budget {max_queries}:\n{statements}"
+        if max_repeats is not None:
+            repeated = stats.repeated_statements(max_repeats + 1)
+            assert not repeated, f"Statements repeated more than {max_repeats} times:\n{statements}"
+
+    return budget
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from app.core.database import MODEL_MODULES
+from app.core.database import Base
+from app.core.database import import_models_modules
+
+
+def test_registry_lists_every_model_module() -> None:
+    """Test that every module of the application defining ORM models is registered."""
+    import_models_modules()
+    app_dir = Path(__file__).parents[2] / "app"
+    model_modules = {
+        ".".join(path.relative_to(app_dir.parent).with_suffix("").parts)
+        for path in app_dir.rglob("*.py")
+        if "(Base)" in path.read_text()
+    }
+    mapped_modules = {mapper.class_.__module__ for mapper in Base.registry.mappers}
+
+    assert model_modules == set(MODEL_MODULES)
+    assert mapped_modules <= set(MODEL_MODULES)
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database.engine import DatabaseEngineFactory
+from app.core.database.pool import InstrumentedAsyncQueuePool
+from app.core.database.pool import get_pool_status
+from app.core.metrics import Histogram
+
+
+def test_histogram_counts_are_cumulative() -> None:
+    """Test that values are counted in the bucket of the first bound they do not exceed."""
+    histogram = Histogram(buckets=[0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.snapshot() == {"buckets": {"0.1": 2, "1": 3, "+Inf": 4}, "count": 4, "sum": 3.65}
+
+
+async def test_pool_reports_checkouts_and_timeouts(tmp_path: Path) -> None:
+    """Test that checked-out connections, checkout waits and timeouts are reported."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert get_pool_status(engine)["checked_out"] == 1
+
+            with pytest.raises(exc.TimeoutError):
+                await engine.connect().start()
+
+        status = get_pool_status(engine)
+        assert status["checked_out"] == 0
+        assert status["timeouts"] == 1
+        assert status["checkout_wait"]["count"] == 2  # noqa: PLR2004
+    finally:
+        await engine.dispose()
+
+
+def test_pool_options_follow_the_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that file databases get the configured pool and in-memory ones keep SQLAlchemy's default."""
+    monkeypatch.setattr("app.core.database.engine.app_config.DB_POOL_SIZE", 3)
+    monkeypatch.setattr("app.core.database.engine.app_config.DB_POOL_USE_LIFO", True)
+    monkeypatch.setattr("app.core.database.engine.app_config.SQLITE_TUNING", False)  # Keeps a single writer
+
+    file_engine = DatabaseEngineFactory.get_engine("sqlite+aiosqlite:///./pool.db")
+    memory_engine = DatabaseEngineFactory.get_engine("sqlite+aiosqlite:///:memory:")
+
+    assert isinstance(file_engine.pool, InstrumentedAsyncQueuePool)
+    assert file_engine.pool.size() == 3  # noqa: PLR2004
+    assert file_engine.pool._pool.use_lifo is True
+    assert get_pool_status(memory_engine) == {"pool": "StaticPool"}
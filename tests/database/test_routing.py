@@ -0,0 +1,73 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import Base
+from app.core.database import import_models_modules
+from app.core.database.routing import ReplicaSet
+from app.core.database.routing import RoutingSession
+from app.core.typedefs.exceptions import AppError
+from app.domain.user.crud import UserRepository
+from app.domain.user.model import User
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path: Path) -> AsyncGenerator[tuple[AsyncEngine, AsyncEngine], None]:
+    """Creates a primary and a replica SQLite database; each holds a user the other one lacks."""
+    import_models_modules()
+    engines = []
+    for name in ("primary", "replica"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(User(username=f"{name}-only", password="hashed"))
+            await session.commit()
+        engines.append(engine)
+    yield engines[0], engines[1]
+    for engine in engines:
+        await engine.dispose()
+
+
+def make_session(primary: AsyncEngine, replica: AsyncEngine) -> AsyncSession:
+    """Builds a session routing reads to the replica."""
+    return AsyncSession(primary, sync_session_class=RoutingSession, replicas=ReplicaSet([replica]))
+
+
+async def test_reads_go_to_the_replica(databases: tuple[AsyncEngine, AsyncEngine]) -> None:
+    """Test that read-only repository methods query the replica."""
+    async with make_session(*databases) as session:
+        repository = UserRepository(session)
+
+        assert await repository.get_by_username("replica-only") is not None
+        assert await repository.get_by_username("primary-only") is None
+        assert [user.username for user in await repository.list()] == ["replica-only"]
+
+
+async def test_writes_and_later_reads_go_to_the_primary(databases: tuple[AsyncEngine, AsyncEngine]) -> None:
+    """Test that a session reads its own writes from the primary once it has written."""
+    async with make_session(*databases) as session:
+        repository = UserRepository(session)
+        await repository.add(User(username="new", password="hashed"))
+
+        assert await repository.get_by_username("new") is not None
+        assert await repository.get_by_username("primary-only") is not None
+
+    async with make_session(*databases) as session:  # A new session reads from the replica again
+        assert await UserRepository(session).get_by_username("new") is None
+
+
+def test_replica_selection_strategies(databases: tuple[AsyncEngine, AsyncEngine]) -> None:
+    """Test that round robin alternates between the replicas and unknown strategies are rejected."""
+    first, second = databases
+    replicas = ReplicaSet([first, second])
+
+    assert [replicas.choose() for _ in range(3)] == [first, second, first]
+    assert ReplicaSet([first, second], strategy="least_connections").choose() is first
+    with pytest.raises(AppError.InvalidConfigurationError):
+        ReplicaSet([first], strategy="random")
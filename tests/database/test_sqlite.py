@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy import text
+
+from app.core.database.engine import DatabaseEngineFactory
+
+
+async def test_tuned_sqlite_has_one_writer_and_read_only_readers(tmp_path: Path) -> None:
+    """Test that the writer enables WAL through a single connection and readers refuse writes."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}"
+    writer = DatabaseEngineFactory.get_engine(url)
+    reader = DatabaseEngineFactory.get_engine(url, read_only=True)
+    try:
+        async with writer.begin() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 5000  # noqa: PLR2004
+            await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+        assert writer.pool.size() == 1  # type: ignore[attr-defined]
+
+        async with writer.begin() as write_conn, reader.connect() as read_conn:
+            await write_conn.execute(text("INSERT INTO item DEFAULT VALUES"))
+            # The open write transaction does not block readers in WAL mode; they see the last commit
+            assert (await read_conn.execute(text("SELECT count(*) FROM item"))).scalar() == 0
+            with pytest.raises(exc.OperationalError, match="readonly"):
+                await read_conn.execute(text("INSERT INTO item DEFAULT VALUES"))
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+def test_tuning_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that in-memory databases and disabled tuning keep the plain engine."""
+    assert not DatabaseEngineFactory.is_tuned_sqlite("sqlite+aiosqlite:///:memory:")
+    monkeypatch.setattr("app.core.database.engine.app_config.SQLITE_TUNING", False)
+    assert not DatabaseEngineFactory.is_tuned_sqlite("sqlite+aiosqlite:///./tuned.db")
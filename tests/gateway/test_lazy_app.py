@@ -0,0 +1,48 @@
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from starlette.types import ASGIApp
+
+from app.core.gateway.lazy import LazyASGIApp
+
+
+def make_client() -> tuple[TestClient, LazyASGIApp, list[int]]:
+    """Builds an app with a lazily built sub-application mounted at `/sub`, counting how often it is built."""
+    builds: list[int] = []
+
+    def index(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(f"sub {request.url_for('sub:index')}")
+
+    def build() -> ASGIApp:
+        builds.append(1)
+        return Starlette(routes=[Route("/", index, name="index")])
+
+    def home(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(str(request.url_for("sub", path="/")))
+
+    lazy_app = LazyASGIApp(build)
+    app = Starlette(routes=[Route("/", home), Mount("/sub", app=lazy_app, name="sub")])
+    return TestClient(app), lazy_app, builds
+
+
+def test_app_is_built_once_on_first_request() -> None:
+    """Test that the mounted app is built by the first request to it and reused afterwards."""
+    client, lazy_app, builds = make_client()
+
+    assert client.get("/").text == "http://testserver/sub/"  # Linking to the mount does not build it
+    assert not lazy_app.is_built
+
+    assert client.get("/sub/").text == "sub http://testserver/sub/"
+    assert client.get("/sub/").status_code == 200  # noqa: PLR2004
+    assert len(builds) == 1
+
+
+def test_named_routes_are_resolved_through_the_built_app() -> None:
+    """Test that `url_for` reaches the routes of the mounted app by building it."""
+    _, lazy_app, builds = make_client()
+
+    assert [getattr(route, "name", None) for route in lazy_app.routes] == ["index"]
+    assert len(builds) == 1
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import zlib
+from collections.abc import AsyncGenerator
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.applications import Starlette
+from starlette.authentication import AuthCredentials
+from starlette.authentication import AuthenticationBackend
+from starlette.authentication import BaseUser
+from starlette.exceptions import HTTPException
+from starlette.middleware.authentication import AuthenticationMiddleware
+from starlette.requests import HTTPConnection
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from app.core.gateway.middleware import BasicCSRFMiddleware
+from app.core.gateway.middleware import HtmxStateMiddleware
+from app.core.gateway.middleware import PathBypassMiddleware
+from app.core.gateway.middleware import RequestContextMiddleware
+from app.core.gateway.middleware import StreamingGZipMiddleware
+from app.core.logging.logger import format_json
+from app.services.auth.models import AuthUser
+
+
+async def state_endpoint(request: Request) -> JSONResponse:
+    """Echoes the request state set by the middlewares."""
+    return JSONResponse({"is_htmx_request": request.state.is_htmx_request, "csrf_flag": request.state.csrf_flag})
+
+
+def make_client() -> TestClient:
+    """Builds a minimal app wrapped in the middlewares under test."""
+    app = Starlette(routes=[Route("/", state_endpoint, methods=["GET", "POST"])])
+    app.add_middleware(HtmxStateMiddleware)
+    app.add_middleware(BasicCSRFMiddleware)
+    return TestClient(app)
+
+
+def test_get_sets_csrf_cookie_and_htmx_state() -> None:
+    """Test that a GET without the CSRF flag passes and receives the flag cookie."""
+    response = make_client().get("/", headers={"hx-request": "true"})
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json() == {"is_htmx_request": True, "csrf_flag": None}
+    assert response.headers["set-cookie"].startswith(f"{BasicCSRFMiddleware.CSRF_COOKIE_NAME}=1;")
+
+
+def test_post_without_csrf_flag_is_rejected() -> None:
+    """Test that non-GET requests without the CSRF flag get a 403."""
+    response = make_client().post("/", headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 403  # noqa: PLR2004
+
+
+def test_post_with_csrf_flag_passes_without_new_cookie() -> None:
+    """Test that requests carrying the CSRF flag pass and are not sent the cookie again."""
+    client = make_client()
+    client.cookies.set(BasicCSRFMiddleware.CSRF_COOKIE_NAME, "1")
+    response = client.post("/")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json() == {"is_htmx_request": False, "csrf_flag": "1"}
+    assert "set-cookie" not in response.headers
+
+
+def make_bypass_client() -> TestClient:
+    """Builds an app whose inner middleware rejects every request that is not bypassed."""
+
+    async def reject(request: Request, exc: Exception) -> JSONResponse:
+        return JSONResponse({"detail": "handled"}, status_code=404)
+
+    async def ok_endpoint(request: Request) -> JSONResponse:
+        return JSONResponse({"status": "ok"})
+
+    def rejecting_middleware(app: ASGIApp) -> ASGIApp:
+        async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] == "http":
+                await JSONResponse({"detail": "inner middleware"}, status_code=401)(scope, receive, send)
+                return
+            await app(scope, receive, send)
+
+        return middleware
+
+    app = Starlette(routes=[Route("/health", ok_endpoint), Route("/other", ok_endpoint)])
+    app.add_exception_handler(HTTPException, reject)
+    app.add_middleware(rejecting_middleware)
+    app.add_middleware(PathBypassMiddleware, prefixes=["/health", "/static/"])
+    return TestClient(app)
+
+
+def test_bypassed_paths_skip_inner_middleware() -> None:
+    """Test that only the configured prefixes skip the inner middleware."""
+    client = make_bypass_client()
+
+    assert client.get("/health").json() == {"status": "ok"}
+    assert client.get("/other").status_code == 401  # noqa: PLR2004
+    assert client.get("/healthy").status_code == 401  # noqa: PLR2004
+
+
+def test_bypassed_paths_keep_exception_handlers() -> None:
+    """Test that errors raised on bypassed paths are still handled by the app's exception handlers."""
+    response = make_bypass_client().get("/static/missing.css")
+
+    assert response.status_code == 404  # noqa: PLR2004
+    assert response.json() == {"detail": "handled"}
+
+
+def test_htmx_target_and_history_restore() -> None:
+    """Test that the HTMX target is exposed and history restore requests are treated as full page requests."""
+
+    async def target_endpoint(request: Request) -> JSONResponse:
+        return JSONResponse({"is_htmx_request": request.state.is_htmx_request, "target": request.state.htmx_target})
+
+    app = Starlette(routes=[Route("/", target_endpoint)])
+    app.add_middleware(HtmxStateMiddleware)
+    client = TestClient(app)
+
+    targeted = client.get("/", headers={"hx-request": "true", "hx-target": "load-more"})
+    restored = client.get("/", headers={"hx-request": "true", "hx-history-restore-request": "true"})
+
+    assert targeted.json() == {"is_htmx_request": True, "target": "load-more"}
+    assert restored.json() == {"is_htmx_request": False, "target": None}
+
+
+async def test_streaming_gzip_sends_every_chunk() -> None:
+    """Test that each streamed chunk is compressed and sent on its own, instead of being held back."""
+    chunks = [b"<head>" + b"a" * 2000, b"b" * 2000, b"c" * 2000]
+
+    async def stream() -> AsyncGenerator[bytes, None]:
+        for chunk in chunks:
+            yield chunk
+
+    async def endpoint(request: Request) -> StreamingResponse:
+        return StreamingResponse(stream(), media_type="text/html")
+
+    messages: list[Message] = []
+    response_complete = asyncio.Event()
+
+    async def receive() -> Message:
+        await response_complete.wait()  # The client stays connected until the whole body was sent
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    app = StreamingGZipMiddleware(Starlette(routes=[Route("/", endpoint)]), minimum_size=10)
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    await app(scope, receive, send)
+
+    bodies = [message["body"] for message in messages if message["type"] == "http.response.body"]
+    decompressor = zlib.decompressobj(wbits=31)
+    # Every streamed chunk can be decompressed as soon as it arrives
+    assert [decompressor.decompress(body) for body in bodies[: len(chunks)]] == chunks
+
+
+def test_request_context_is_attached_to_log_records() -> None:
+    """Test that records emitted during a request carry its id, route template, user and latency."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        logger.info("Reading item {}", item_id)
+        return {"item_id": item_id}
+
+    class NamedUserBackend(AuthenticationBackend):
+        async def authenticate(self, conn: HTTPConnection) -> tuple[AuthCredentials, BaseUser]:
+            return AuthCredentials(["authenticated"]), AuthUser(display_name="alice")
+
+    app.add_middleware(AuthenticationMiddleware, backend=NamedUserBackend())
+    app.add_middleware(RequestContextMiddleware)
+    lines: list[str] = []
+    handler_id = logger.add(lines.append, format=format_json, filter=lambda record: "request" in record["extra"])
+    try:
+        client = TestClient(app)
+        response = client.get("/items/7", headers={"X-Request-ID": "abc123"})
+        generated = client.get("/items/8")
+    finally:
+        logger.remove(handler_id)
+
+    assert response.headers["x-request-id"] == "abc123"
+    assert len(generated.headers["x-request-id"]) == 32  # noqa: PLR2004
+    entries = [json.loads(line) for line in lines]
+    item_entry, completed_entry = entries[0], entries[1]
+    assert item_entry["message"] == "Reading item 7"
+    assert item_entry["request"]["request_id"] == "abc123"
+    assert item_entry["request"]["route"] == "/items/{item_id}"
+    assert item_entry["request"]["path"] == "/items/7"
+    assert item_entry["request"]["user"] == "alice"
+    assert item_entry["request"]["latency_ms"] >= 0
+    assert completed_entry["message"].startswith("GET /items/7 200")
+    assert completed_entry["request"]["status_code"] == 200  # noqa: PLR2004
@@ -0,0 +1,54 @@
+import logging
+
+import pytest
+from loguru import logger
+
+from app.core.logging.logger import InterceptHandler
+from app.core.typedefs.exceptions import AppError
+
+
+@pytest.mark.parametrize("caller", ["record", "frame"])
+def test_intercepted_records_keep_their_origin_and_level(caller: str) -> None:
+    """Test that stdlib records reach Loguru with their level and the function and line that logged them."""
+    std_logger = logging.getLogger(f"tests.intercept.{caller}")
+    std_logger.handlers = [InterceptHandler(caller=caller)]
+    std_logger.propagate = False
+    std_logger.setLevel(logging.DEBUG)
+    lines: list[str] = []
+    handler_id = logger.add(lines.append, format="{level} | {function}:{line} | {message}")
+    try:
+        std_logger.warning("Disk %s is %d%% full", "/var", 91)
+        line = test_intercepted_records_keep_their_origin_and_level.__code__.co_firstlineno + 10
+        std_logger.log(25, "Custom level")  # Unknown to the stdlib: forwarded by number
+    finally:
+        logger.remove(handler_id)
+
+    assert lines == [
+        f"WARNING | test_intercepted_records_keep_their_origin_and_level:{line} | Disk /var is 91% full\n",
+        f"Level 25 | test_intercepted_records_keep_their_origin_and_level:{line + 2} | Custom level\n",
+    ]
+
+
+def test_intercepted_exceptions_are_kept() -> None:
+    """Test that the exception of a stdlib record is passed to Loguru."""
+    std_logger = logging.getLogger("tests.intercept.exception")
+    std_logger.handlers = [InterceptHandler()]
+    std_logger.propagate = False
+    lines: list[str] = []
+    handler_id = logger.add(lines.append, format="{message}\n{exception}")
+    try:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            std_logger.exception("Failed")
+    finally:
+        logger.remove(handler_id)
+
+    assert lines[0].startswith("Failed\n")
+    assert "RuntimeError: boom" in lines[0]
+
+
+def test_unknown_caller_strategy_is_rejected() -> None:
+    """Test that an unknown caller strategy is a configuration error."""
+    with pytest.raises(AppError.InvalidConfigurationError):
+        InterceptHandler(caller="guess")
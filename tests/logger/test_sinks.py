@@ -0,0 +1,78 @@
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from app.core.logging.logger import configure_loguru
+from app.core.logging.sinks import QueuedSink
+from app.core.typedefs.exceptions import AppError
+
+
+@pytest.fixture
+def restore_loguru() -> Iterator[None]:
+    """Restore Loguru's default handler after a test configures it."""
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+def test_queued_sink_writes_batches_and_flushes_on_stop() -> None:
+    """Test that queued messages are written in batches by the writer thread, and all of them on stop."""
+    writes: list[str] = []
+    sink = QueuedSink(writes.append, batch_size=10)
+    for index in range(25):
+        sink.write(f"{index}\n")
+    sink.stop()
+
+    assert "".join(writes) == "".join(f"{index}\n" for index in range(25))
+    assert all(write.count("\n") <= 10 for write in writes)  # noqa: PLR2004
+
+
+def test_queued_sink_drop_policy_counts_dropped_messages() -> None:
+    """Test that a full queue drops messages with the `drop` policy and reports how many were dropped."""
+    release = threading.Event()
+    writes: list[str] = []
+
+    def slow_write(text: str) -> None:
+        release.wait()
+        writes.append(text)
+
+    sink = QueuedSink(slow_write, max_size=2, batch_size=1, policy="drop")
+    for index in range(10):  # The writer holds at most one message, the queue two: the others are dropped
+        sink.write(f"{index}\n")
+    release.set()
+    sink.stop()
+
+    output = "".join(writes)
+    assert output.startswith("0\n")
+    assert "log messages were dropped" in output
+    assert output.count("\n") < 10  # noqa: PLR2004
+
+
+def test_queued_sink_rejects_unknown_policy() -> None:
+    """Test that an unknown queue policy is a configuration error."""
+    with pytest.raises(AppError.InvalidConfigurationError):
+        QueuedSink(print, policy="lose")
+
+
+def test_queued_logging_writes_the_log_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, restore_loguru: None
+) -> None:
+    """Test that queued logging writes formatted records to the file and discards records below the level."""
+    log_file = tmp_path / "app.log"
+    monkeypatch.setattr("app.core.logging.logger.app_config.LOG_FILE", str(log_file))
+    monkeypatch.setattr("app.core.logging.logger.app_config.LOG_LEVEL", "INFO")
+    monkeypatch.setattr("app.core.logging.logger.app_config.LOG_QUEUE", True)
+    configure_loguru()
+
+    logger.debug("Not written")
+    logger.info("Written {}", "through the queue")
+    logger.remove()  # Stops the queues, writing what is left
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert "| INFO | " in lines[0]
+    assert lines[0].endswith(":test_queued_logging_writes_the_log_file:72 - Written through the queue")
@@ -0,0 +1,140 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+from loguru import logger
+from sqlalchemy import exc
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database.pool import InstrumentedAsyncQueuePool
+from app.core.gateway.middleware import QueryProfilerMiddleware
+from app.core.gateway.middleware import RequestMetricsMiddleware
+from app.core.metrics import Histogram
+from app.core.metrics import QueryStats
+from app.core.metrics import current_query_stats
+from app.core.metrics.database import instrument_engine
+from app.core.metrics.database import statement_shape
+from app.core.metrics.prometheus import PrometheusText
+from app.core.metrics.prometheus import render_prometheus
+from app.core.metrics.requests import UNMATCHED_ROUTE
+from app.core.metrics.requests import RequestMetrics
+
+
+async def test_requests_are_recorded_by_route_template_with_db_time(tmp_path: Path) -> None:
+    """Test that requests are counted by route template and status class, with their statements."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}", poolclass=InstrumentedAsyncQueuePool)
+    instrument_engine(engine)
+    instrument_engine(engine)  # Attaching the listeners twice must not count statements twice
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+        return {"item_id": item_id}
+
+    metrics = RequestMetrics()
+    app.add_middleware(RequestMetricsMiddleware, metrics=metrics)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/items/1")
+            await client.get("/items/2")
+            await client.get("/missing")
+    finally:
+        await engine.dispose()
+
+    item_metrics = metrics.routes[("/items/{item_id}", "GET")]
+    assert item_metrics.requests == 2  # noqa: PLR2004
+    assert item_metrics.status_classes == {"2xx": 2}
+    assert item_metrics.queries == 4  # noqa: PLR2004
+    assert item_metrics.db_time.count == 2  # noqa: PLR2004
+    assert 0 < item_metrics.db_time.sum <= item_metrics.latency.sum
+    assert metrics.routes[(UNMATCHED_ROUTE, "GET")].status_classes == {"4xx": 1}
+
+    page = render_prometheus(metrics, {"primary": engine})
+    assert 'http_requests_total{route="/items/{item_id}",method="GET",status="2xx"} 2\n' in page
+    assert 'http_request_duration_seconds_count{route="/items/{item_id}",method="GET"} 2\n' in page
+    assert 'http_request_db_queries_total{route="/items/{item_id}",method="GET"} 4\n' in page
+    assert 'db_pool_checked_out_connections{database="primary"} 0\n' in page
+    assert 'db_pool_checkout_wait_seconds_count{database="primary"} 2\n' in page
+
+
+async def test_failed_statements_are_recorded(tmp_path: Path) -> None:
+    """Test that a failing statement is counted and its error reaches the caller unchanged."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}")
+    instrument_engine(engine)
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(exc.OperationalError, match="no such table"):
+                await conn.execute(text("SELECT * FROM missing"))
+            await conn.execute(text("SELECT 1"))
+    finally:
+        current_query_stats.reset(token)
+        await engine.dispose()
+
+    assert stats.queries == 2  # noqa: PLR2004
+
+
+def test_prometheus_text_format() -> None:
+    """Test the exposition format of histograms, large counters and escaped label values."""
+    histogram = Histogram(buckets=[0.1, 1.0])
+    histogram.observe(0.5)
+    page = PrometheusText()
+    page.counter("events_total", "Events.", [({"name": 'say "hi"\n'}, 1234567)])
+    page.histogram("wait_seconds", "Waits.", [({}, histogram)])
+
+    assert page.render().splitlines() == [
+        "# HELP events_total Events.",
+        "# TYPE events_total counter",
+        'events_total{name="say \\"hi\\"\\n"} 1234567',
+        "# HELP wait_seconds Waits.",
+        "# TYPE wait_seconds histogram",
+        'wait_seconds_bucket{le="0.1"} 0',
+        'wait_seconds_bucket{le="1"} 1',
+        'wait_seconds_bucket{le="+Inf"} 1',
+        "wait_seconds_sum 0.5",
+        "wait_seconds_count 1",
+    ]
+
+
+async def test_query_profiler_flags_repeated_statements(tmp_path: Path) -> None:
+    """Test that the profiler reports the statements in `Server-Timing` and logs a statement run per item."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'profiler.db'}")
+    instrument_engine(engine)
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items() -> list[int]:
+        async with engine.connect() as conn:
+            return [
+                (await conn.execute(text("SELECT :item_id"), {"item_id": item_id})).scalar_one() for item_id in range(6)
+            ]
+
+    app.add_middleware(QueryProfilerMiddleware, repeat_threshold=5)
+    lines: list[str] = []
+    handler_id = logger.add(lines.append, format="{level} | {message}", level="WARNING")
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/items")
+    finally:
+        logger.remove(handler_id)
+        await engine.dispose()
+
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="6 queries", app;dur=' in response.headers["server-timing"]
+    assert lines == ["WARNING | Possible N+1 query in GET /items: 6 executions of: SELECT ?\n"]
+
+
+def test_statement_shape_collapses_whitespace_and_parameter_lists() -> None:
+    """Test that statements differing only by layout or by the number of listed values have the same shape."""
+    assert statement_shape("SELECT *\n  FROM post\nWHERE id IN (?, ?, ?)") == "SELECT * FROM post WHERE id IN (?)"
+    assert statement_shape("SELECT * FROM post WHERE id IN (?)") == "SELECT * FROM post WHERE id IN (?)"
+    assert statement_shape("INSERT INTO tag (name, slug) VALUES (?, ?), (?, ?)") == (
+        "INSERT INTO tag (name, slug) VALUES (?)"
+    )
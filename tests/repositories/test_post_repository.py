@@ -1,8 +1,18 @@
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.typedefs.exceptions import AppError
 from app.domain.post.crud import PostRepository
+from app.domain.post.enums import PostStatus
 from app.domain.post.model import Post
+from app.domain.post.schema import PostSchema
+from app.domain.user.crud import UserRepository
+from app.domain.user.model import User
 
 
 @pytest.mark.asyncio
@@ -68,3 +78,147 @@ async def test_delete_post(test_db_session: AsyncSession) -> None:
 
     deleted = await repository.get(post.id)
     assert deleted is None
+
+
+async def test_list_page_walks_all_posts_newest_first(test_db_session: AsyncSession) -> None:
+    """Test that following `next_cursor` returns every post exactly once, newest first."""
+    repository = PostRepository(test_db_session)
+    same_date = datetime(2024, 1, 1, tzinfo=UTC)
+
+    # Posts sharing a post_date must still be ordered deterministically by id
+    for i in range(5):
+        await repository.add(Post(title=f"Post {i}", content="Content", post_date=same_date + timedelta(days=i // 2)))
+
+    seen_titles: list[str] = []
+    cursor: str | None = None
+    while True:
+        page = await repository.list_page(limit=2, cursor=cursor)
+        seen_titles.extend(post.title for post in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen_titles == ["Post 4", "Post 3", "Post 2", "Post 1", "Post 0"]
+
+
+async def test_list_page_rejects_invalid_cursor(test_db_session: AsyncSession) -> None:
+    """Test that a tampered cursor raises InvalidCursorError."""
+    repository = PostRepository(test_db_session)
+
+    with pytest.raises(AppError.InvalidCursorError):
+        await repository.list_page(limit=10, cursor="not-a-cursor")
+
+
+async def test_list_page_loads_author_only_on_request(test_db_session: AsyncSession) -> None:
+    """Test that the author is not loaded implicitly, but can be opted into with loader options."""
+    repository = PostRepository(test_db_session)
+    author = User(username="author", password="hashed")
+    test_db_session.add(author)
+    await test_db_session.commit()
+    await repository.add(Post(title="Post", content="Content", user_id=author.id))
+    test_db_session.expunge_all()  # Start from an empty identity map, as a fresh request would
+
+    page = await repository.list_page(limit=10)
+    with pytest.raises(InvalidRequestError):
+        _ = page.items[0].user
+
+    test_db_session.expunge_all()
+    page = await repository.list_page(limit=10, options=PostRepository.WITH_AUTHOR_USERNAME)
+    assert page.items[0].user.username == "author"
+
+
+async def test_list_summaries_page_projects_excerpt_and_author(test_db_session: AsyncSession) -> None:
+    """Test that summaries carry a content excerpt and the author's username instead of ORM objects."""
+    repository = PostRepository(test_db_session)
+    author = User(username="author", password="hashed")
+    test_db_session.add(author)
+    await test_db_session.commit()
+    await repository.add(Post(title="Long", content="x" * 50, user_id=author.id))
+    await repository.add(Post(title="Anonymous", content="Short"))
+
+    page = await repository.list_summaries_page(limit=10, excerpt_length=20)
+
+    assert [summary.title for summary in page.items] == ["Anonymous", "Long"]
+    assert page.items[0].author_username is None
+    assert page.items[1].author_username == "author"
+    assert page.items[1].excerpt == "x" * 20
+    assert all(isinstance(summary, PostSchema.Summary) for summary in page.items)
+
+
+async def test_stream_summaries_page_matches_list_summaries_page(test_db_session: AsyncSession) -> None:
+    """Test that streamed summaries are the listed ones, with `next_cursor` set once they are consumed."""
+    repository = PostRepository(test_db_session)
+    for i in range(3):
+        await repository.add(Post(title=f"Post {i}", content="Content"))
+
+    page = await repository.list_summaries_page(limit=2)
+    stream = repository.stream_summaries_page(limit=2)
+    assert stream.next_cursor is None
+
+    streamed = [summary async for summary in stream]
+
+    assert streamed == page.items
+    assert stream.next_cursor == page.next_cursor
+    last_stream = repository.stream_summaries_page(limit=2, cursor=stream.next_cursor)
+    assert [summary.title async for summary in last_stream] == ["Post 0"]
+    assert not last_stream.has_more
+
+
+def test_stream_summaries_page_rejects_invalid_cursor_eagerly(test_db_session: AsyncSession) -> None:
+    """Test that an invalid cursor raises before anything is streamed."""
+    with pytest.raises(AppError.InvalidCursorError):
+        PostRepository(test_db_session).stream_summaries_page(limit=10, cursor="not-a-cursor")
+
+
+async def test_stream_summaries_page_can_close_its_session(test_db_session: AsyncSession) -> None:
+    """Test that a stream owning its session closes it, even when iteration stops early."""
+    repository = PostRepository(test_db_session)
+    for i in range(3):
+        await repository.add(Post(title=f"Post {i}", content="Content"))
+
+    closed: list[bool] = []
+    original_close = test_db_session.close
+
+    async def close() -> None:
+        closed.append(True)
+        await original_close()
+
+    test_db_session.close = close  # type: ignore[method-assign]
+    summaries = aiter(repository.stream_summaries_page(limit=2, close_session=True))
+    await anext(summaries)
+    await summaries.aclose()  # e.g. rendering failed after the first post
+
+    assert closed
+
+
+async def test_add_many_inserts_in_batches(test_db_session: AsyncSession) -> None:
+    """Test that bulk inserted posts get their primary keys and column defaults."""
+    repository = PostRepository(test_db_session)
+    rows = [{"title": f"Post {index}", "content": "Bulk"} for index in range(5)]
+
+    ids = await repository.add_many(rows, batch_size=2)
+
+    posts = await repository.list()
+    assert sorted(ids) == sorted(post.id for post in posts)
+    assert len(posts) == 5  # noqa: PLR2004
+    assert all(post.post_status == PostStatus.DRAFT and post.post_date is not None for post in posts)
+
+
+async def test_upsert_many_updates_conflicting_rows(test_db_session: AsyncSession) -> None:
+    """Test that upserts insert new rows and overwrite the given columns of existing ones."""
+    test_db_session.add(User(username="existing", full_name="Old Name", password="hashed"))
+    await test_db_session.commit()
+    repository = UserRepository(test_db_session)
+    rows = [
+        {"username": "existing", "full_name": "New Name", "password": "hashed"},
+        {"username": "new", "full_name": "New User", "password": "hashed"},
+    ]
+
+    ids = await repository.upsert_many(rows, conflict_columns=["username"], update_columns=["full_name"])
+    test_db_session.expire_all()
+
+    users = {user.username: user for user in await repository.list()}
+    assert len(ids) == 2  # noqa: PLR2004
+    assert users["existing"].full_name == "New Name"
+    assert users["new"].full_name == "New User"
+    assert await repository.upsert_many(rows[:1], conflict_columns=["username"], update_columns=[]) == []
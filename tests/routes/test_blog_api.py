@@ -0,0 +1,53 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+from httpx import ASGITransport
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import QueryStats
+from app.domain.post.crud import PostRepository
+from app.domain.post.enums import PostStatus
+from app.domain.user.model import User
+from app.main import app
+from app.routes.api.blog.blog import parse_post_import
+
+
+def test_import_accepts_a_json_array() -> None:
+    """Test that a JSON array of posts is parsed and validated."""
+    body = b'[{"title": "First", "content": "A"}, {"title": "Second", "content": "B", "post_status": "PUBLISHED"}]'
+
+    posts = parse_post_import(body, "application/json")
+
+    assert [post.title for post in posts] == ["First", "Second"]
+    assert posts[1].post_status == PostStatus.PUBLISHED
+
+
+def test_import_accepts_ndjson_and_reports_invalid_lines() -> None:
+    """Test that NDJSON is parsed line by line and errors point to the offending line."""
+    body = b'{"title": "First", "content": "A"}\n\n{"title": "Second", "content": "B"}\n'
+    assert len(parse_post_import(body, "application/x-ndjson; charset=utf-8")) == 2  # noqa: PLR2004
+
+    with pytest.raises(RequestValidationError) as exc_info:
+        parse_post_import(b'{"title": "First", "content": "A"}\n{"title": "No content"}', "application/x-ndjson")
+    assert exc_info.value.errors()[0]["loc"] == ("body", 2, "content")
+
+
+async def test_listing_posts_stays_within_its_query_budget(
+    test_db_session: AsyncSession, query_budget: Callable[..., AbstractContextManager[QueryStats]]
+) -> None:
+    """Test that a page of posts by several authors is listed with a single statement."""
+    authors = [User(username=f"author_{index}", password="hashed") for index in range(3)]
+    test_db_session.add_all(authors)
+    await test_db_session.commit()
+    rows = [{"title": f"Post {index}", "content": "Content", "user_id": authors[index % 3].id} for index in range(10)]
+    await PostRepository(test_db_session).add_many(rows)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        with query_budget(1, max_repeats=1):
+            response = await client.get("/api/blog/")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert len(response.json()["items"]) == 10  # noqa: PLR2004
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+from starlette.applications import Starlette
+from starlette.authentication import AuthenticationError
+from starlette.middleware.authentication import AuthenticationMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.domain.user.exception import AuthError
+from app.services.auth.backend import BasicAuthBackend
+from app.services.auth.backend import on_auth_error
+from app.services.auth.security import create_access_token
+from app.services.auth.security import revoked_tokens
+from app.services.auth.security import verify_jwt
+
+
+def test_token_round_trip_carries_identity_and_scopes() -> None:
+    """Test that a bearer token resolves to the user's identity and scopes without the database."""
+    token = create_access_token(subject="42", name="alice", scopes=["authenticated", "admin"])
+
+    credentials, user = BasicAuthBackend.authenticate_bearer(token)
+
+    assert credentials.scopes == ["authenticated", "admin"]
+    assert user.identity == "42"
+    assert user.display_name == "alice"
+
+
+def test_expired_token_is_rejected() -> None:
+    """Test that tokens past their expiry are rejected."""
+    token = create_access_token(subject="42", name="alice", scopes=[], expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(AuthError.TokenExpiredError):
+        verify_jwt(token)
+
+
+def test_tampered_token_is_rejected() -> None:
+    """Test that a token with a modified signature is rejected."""
+    token = create_access_token(subject="42", name="alice", scopes=[])
+
+    with pytest.raises(AuthenticationError):
+        BasicAuthBackend.authenticate_bearer(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+
+
+def test_revoked_token_is_rejected() -> None:
+    """Test that a revoked token can no longer be used."""
+    token = create_access_token(subject="42", name="alice", scopes=[])
+    claims = verify_jwt(token)
+
+    revoked_tokens.revoke(claims["jti"], claims["exp"])
+
+    with pytest.raises(AuthError.InvalidTokenError):
+        verify_jwt(token)
+
+
+def test_rejected_bearer_token_gets_401_with_challenge() -> None:
+    """Test that requests with an expired token get a 401 asking for a new bearer token."""
+
+    async def endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("public")
+
+    app = Starlette(routes=[Route("/", endpoint)])
+    app.add_middleware(AuthenticationMiddleware, backend=BasicAuthBackend(), on_error=on_auth_error)
+    app.add_middleware(SessionMiddleware, secret_key="test")
+    client = TestClient(app)
+    expired = create_access_token(subject="42", name="alice", scopes=[], expires_delta=timedelta(seconds=-1))
+
+    response = client.get("/", headers={"Authorization": f"Bearer {expired}"})
+
+    assert response.status_code == 401  # noqa: PLR2004
+    assert response.headers["www-authenticate"].startswith("Bearer")
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from app.domain.user.crud import UserRepository
+from app.domain.user.model import User
+from app.domain.user.schema import UserSchema
+from app.services.admin_portal.views import UserView
+from app.services.auth.cache import AuthCache
+from app.services.auth.cache import auth_cache
+
+
+def make_user(user_id: int, username: str = "user") -> User:
+    """Builds a transient user, as the cache only keeps references to verified users."""
+    return User(id=user_id, username=username, password="hashed")
+
+
+def test_get_returns_cached_user_and_counts_hits() -> None:
+    """Test that a cached verification is returned only for the exact same credentials."""
+    cache = AuthCache(secret_key="secret", ttl=60, max_size=10)
+    user = make_user(1)
+    cache.set("user", "password", user)
+
+    assert cache.get("user", "password") is user
+    assert cache.get("user", "wrong-password") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that entries are no longer served once their TTL has passed."""
+    now = 1000.0
+    monkeypatch.setattr("app.services.auth.cache.time.monotonic", lambda: now)
+    cache = AuthCache(secret_key="secret", ttl=60, max_size=10)
+    cache.set("user", "password", make_user(1))
+
+    now += 61
+    assert cache.get("user", "password") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test that the cache never grows beyond its size bound."""
+    cache = AuthCache(secret_key="secret", ttl=60, max_size=2)
+    cache.set("a", "password", make_user(1, "a"))
+    cache.set("b", "password", make_user(2, "b"))
+    cache.get("a", "password")  # "b" is now the least recently used entry
+    cache.set("c", "password", make_user(3, "c"))
+
+    assert cache.get("b", "password") is None
+    assert cache.get("a", "password") is not None
+    assert cache.stats.evictions == 1
+
+
+async def test_repository_update_invalidates_cached_user(test_db_session: AsyncSession) -> None:
+    """Test that updating a user drops its cached verifications."""
+    repository = UserRepository(test_db_session)
+    user = User(username="cached", password="hashed")
+    await repository.add(user)
+    auth_cache.set("cached", "password", user)
+
+    await repository.update(user, full_name="Changed")
+
+    assert auth_cache.get("cached", "password") is None
+
+
+async def test_admin_edit_and_delete_invalidate_cached_user() -> None:
+    """Test that changing a user in the admin interface drops its cached verifications."""
+    view = UserView(User, pydantic_model=UserSchema.Create)
+    request = Request({"type": "http"})
+
+    auth_cache.set("edited", "password", make_user(41, "edited"))
+    await view.after_edit(request, make_user(41, "edited"))
+    auth_cache.set("deleted", "password", make_user(42, "deleted"))
+    await view.after_delete(request, make_user(42, "deleted"))
+
+    assert auth_cache.get("edited", "password") is None
+    assert auth_cache.get("deleted", "password") is None
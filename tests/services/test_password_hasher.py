@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from app.services.auth.security import PasswordHasher
+from app.services.auth.security import is_password_hash
+
+
+async def test_hash_and_verify_in_worker_pool() -> None:
+    """Test that hashing and verification round-trip through the worker pool."""
+    hasher = PasswordHasher(executor_type="thread", max_workers=1, max_concurrency=1)
+
+    hashed = await hasher.hash("Password123")
+
+    assert is_password_hash(hashed)
+    assert await hasher.verify("Password123", hashed)
+    assert not await hasher.verify("WrongPassword", hashed)
+    hasher.shutdown()
+
+
+async def test_concurrency_limit_queues_excess_jobs() -> None:
+    """Test that jobs beyond the concurrency limit wait in the queue and are all completed."""
+    hasher = PasswordHasher(executor_type="thread", max_workers=2, max_concurrency=1)
+
+    hashes = await asyncio.gather(*(hasher.hash(f"Password{i}") for i in range(3)))
+
+    assert len(set(hashes)) == 3  # noqa: PLR2004
+    assert hasher.stats.max_queued == 2  # noqa: PLR2004
+    assert hasher.stats.completed == 3  # noqa: PLR2004
+    assert hasher.stats.queued == hasher.stats.in_flight == 0
+    hasher.shutdown()
+
+
+def test_rejects_unknown_executor_type() -> None:
+    """Test that a misconfigured executor type fails fast."""
+    with pytest.raises(ValueError, match="Unsupported password hash executor"):
+        PasswordHasher(executor_type="gpu", max_workers=1, max_concurrency=1)
@@ -0,0 +1,118 @@
+import gzip
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.core.static import PrecompressedStaticFiles
+from app.core.static import StaticAssetManifest
+from app.core.static import build_static_assets
+from app.core.static.files import IMMUTABLE_CACHE_CONTROL
+
+STYLES = b"body { color: red; }\n" * 50
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    """Creates a static directory with a stylesheet and an image, and builds its assets."""
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "styles.css").write_bytes(STYLES)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG fake")
+    build_static_assets(tmp_path)
+    return tmp_path
+
+
+def make_client(static_dir: Path) -> tuple[TestClient, StaticAssetManifest]:
+    """Mounts the precompressed static files handler over a built static directory."""
+    manifest = StaticAssetManifest.load(static_dir)
+    static_files = PrecompressedStaticFiles(directory=str(static_dir), manifest=manifest)
+    app = Starlette(routes=[Mount("/static", static_files, name="static")])
+    return TestClient(app), manifest
+
+
+def test_build_fingerprints_and_precompresses(static_dir: Path) -> None:
+    """Test that assets are copied under a content hash with compressed variants only for text assets."""
+    manifest = StaticAssetManifest.load(static_dir)
+
+    hashed_css = manifest.dist_dir / manifest.assets["css/styles.css"]
+    assert hashed_css.name.startswith("styles.") and hashed_css.name != "styles.css"
+    assert hashed_css.read_bytes() == STYLES
+    assert gzip.decompress(hashed_css.with_name(f"{hashed_css.name}.gz").read_bytes()) == STYLES
+    assert not (manifest.dist_dir / f"{manifest.assets['logo.png']}.gz").exists()
+
+
+def test_build_is_deterministic(static_dir: Path) -> None:
+    """Test that rebuilding unchanged assets produces the same names and compressed bytes."""
+    first = StaticAssetManifest.load(static_dir)
+    hashed_css = first.dist_dir / first.assets["css/styles.css"]
+    gzipped = hashed_css.with_name(f"{hashed_css.name}.gz").read_bytes()
+
+    second = build_static_assets(static_dir)
+
+    assert second.assets == first.assets
+    assert hashed_css.with_name(f"{hashed_css.name}.gz").read_bytes() == gzipped
+
+
+def test_manifest_url_resolution(static_dir: Path) -> None:
+    """Test that logical paths resolve to fingerprinted URLs and unknown paths to None."""
+    manifest = StaticAssetManifest.load(static_dir)
+
+    assert manifest.url("/css/styles.css") == f"/static/dist/{manifest.assets['css/styles.css']}"
+    assert manifest.url("js/missing.js") is None
+    assert StaticAssetManifest.load(static_dir / "css").url("css/styles.css") is None
+
+
+def test_serves_precompressed_variant_with_immutable_caching(static_dir: Path) -> None:
+    """Test that the gzip variant is sent as is with a strong ETag and immutable caching."""
+    client, manifest = make_client(static_dir)
+    url = manifest.url("css/styles.css")
+    assert url is not None
+
+    response = client.get(url, headers={"accept-encoding": "gzip"})
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.content == STYLES  # httpx transparently decodes the gzip body
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["etag"].startswith('"') and response.headers["etag"].endswith('-gzip"')
+
+
+def test_identity_request_and_conditional_get(static_dir: Path) -> None:
+    """Test that clients without gzip support get the plain file and a matching ETag yields a 304."""
+    client, manifest = make_client(static_dir)
+    url = manifest.url("css/styles.css")
+    assert url is not None
+
+    response = client.get(url, headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"].endswith('-identity"')
+
+    not_modified = client.get(url, headers={"accept-encoding": "identity", "if-none-match": response.headers["etag"]})
+    assert not_modified.status_code == 304  # noqa: PLR2004
+
+
+def test_unhashed_files_are_not_immutable(static_dir: Path) -> None:
+    """Test that the original (unfingerprinted) files keep the default caching headers."""
+    client, _ = make_client(static_dir)
+
+    response = client.get("/static/css/styles.css")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert "cache-control" not in response.headers
+
+
+def test_prefers_brotli_variant(static_dir: Path) -> None:
+    """Test that brotli is preferred over gzip when the client accepts both."""
+    pytest.importorskip("brotli")
+    client, manifest = make_client(static_dir)
+    url = manifest.url("css/styles.css")
+    assert url is not None
+
+    response = client.get(url, headers={"accept-encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["etag"].endswith('-br"')
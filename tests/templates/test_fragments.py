@@ -0,0 +1,54 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.templates.templating import TemplateManager
+
+BASE = """\
+{%- if not request.state.is_htmx_request -%}
+<nav></nav>{% block main %}{% endblock %}<footer></footer>
+{%- elif fragment_block() -%}
+{{ self[fragment_block()]() }}
+{%- else -%}
+<head><title>{{ title }}</title></head>{{ self.main() }}
+{%- endif -%}
+"""
+
+PAGE = """\
+{%- set title = title | default("Page") -%}
+{%- extends "base.html" -%}
+{%- block main -%}<main><ul>{% block item_list %}<li>{{ item }}</li>{% endblock %}</ul></main>{%- endblock -%}
+"""
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> TemplateManager:
+    """Creates a template manager over a layout and a page with a nested block."""
+    (tmp_path / "base.html").write_text(BASE)
+    (tmp_path / "page.html").write_text(PAGE)
+    return TemplateManager(template_dir=str(tmp_path))
+
+
+def render(manager: TemplateManager, is_htmx_request: bool = False, htmx_target: str | None = None) -> str:
+    """Renders the page for a request with the given HTMX state."""
+    request = SimpleNamespace(state=SimpleNamespace(is_htmx_request=is_htmx_request, htmx_target=htmx_target))
+    return manager.templates.get_template("page.html").render(request=request, item="one")
+
+
+def test_full_page_renders_layout(manager: TemplateManager) -> None:
+    """Test that regular requests receive the layout around the page content."""
+    assert render(manager) == "<nav></nav><main><ul><li>one</li></ul></main><footer></footer>"
+
+
+def test_htmx_request_renders_page_content_only(manager: TemplateManager) -> None:
+    """Test that HTMX requests without a matching target skip the layout."""
+    expected = "<head><title>Page</title></head><main><ul><li>one</li></ul></main>"
+
+    assert render(manager, is_htmx_request=True) == expected
+    assert render(manager, is_htmx_request=True, htmx_target="unknown") == expected
+
+
+def test_htmx_request_renders_targeted_block_only(manager: TemplateManager) -> None:
+    """Test that an HTMX request targeting `#item-list` receives only the `item_list` block."""
+    assert render(manager, is_htmx_request=True, htmx_target="item-list") == "<li>one</li>"
@@ -0,0 +1,43 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.core.templates.streaming import TemplateStreamingResponse
+from app.core.templates.templating import TemplateManager
+
+PAGE = "<head></head>{{ stream_flush() }}<ul>{% for item in items %}<li>{{ item }}</li>{% endfor %}</ul>"
+
+
+async def numbers(count: int) -> AsyncGenerator[int, None]:
+    """Yields numbers like rows arriving from the database."""
+    for number in range(count):
+        yield number
+
+
+async def collect(response: TemplateStreamingResponse) -> list[str]:
+    """Returns the chunks a streaming response sends."""
+    return [str(chunk) async for chunk in response.body_iterator]
+
+
+async def test_streamed_page_flushes_head_then_sends_chunks(tmp_path: Path) -> None:
+    """Test that the output before `stream_flush()` is sent first and the rest in bounded chunks."""
+    (tmp_path / "page.html").write_text(PAGE)
+    manager = TemplateManager(template_dir=str(tmp_path))
+    request = SimpleNamespace(state=SimpleNamespace(is_htmx_request=False))
+
+    response = manager.stream_response(request, "page.html", {"items": numbers(100)})  # type: ignore[arg-type]
+    response.chunk_size = 100
+    chunks = await collect(response)
+
+    assert chunks[0] == "<head></head>"
+    assert len(chunks) > 3  # noqa: PLR2004
+    assert all(len(chunk) < 200 for chunk in chunks)  # noqa: PLR2004
+    assert "".join(chunks) == "<head></head><ul>" + "".join(f"<li>{i}</li>" for i in range(100)) + "</ul>"
+
+
+def test_regular_rendering_drops_flush_markers(tmp_path: Path) -> None:
+    """Test that `stream_flush()` renders nothing outside of streamed rendering."""
+    (tmp_path / "page.html").write_text(PAGE)
+    manager = TemplateManager(template_dir=str(tmp_path))
+
+    assert manager.templates.get_template("page.html").render(items=[1]) == "<head></head><ul><li>1</li></ul>"
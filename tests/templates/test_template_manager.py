@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from app.core.templates.templating import TemplateManager
+
+
+def make_template_dir(tmp_path: Path) -> Path:
+    """Creates a template directory with a page, a partial and an admin template."""
+    template_dir = tmp_path / "templates"
+    (template_dir / "admin").mkdir(parents=True)
+    (template_dir / "page.html").write_text("{% include 'partial.html' %}")
+    (template_dir / "partial.html").write_text("<p>{{ 40 + 2 }}</p>")
+    (template_dir / "admin" / "dashboard.html").write_text("{% extends 'layout.html' %}")  # Not in this loader
+    return template_dir
+
+
+def test_precompile_skips_admin_templates(tmp_path: Path) -> None:
+    """Test that all application templates are compiled and the admin ones are left to Starlette Admin."""
+    manager = TemplateManager(template_dir=str(make_template_dir(tmp_path)))
+
+    assert manager.precompile() == 2  # noqa: PLR2004
+
+
+def test_bytecode_cache_is_persisted(tmp_path: Path) -> None:
+    """Test that compiled templates are written to the bytecode cache and reused by a new manager."""
+    template_dir, cache_dir = make_template_dir(tmp_path), tmp_path / "bytecode"
+
+    TemplateManager(template_dir=str(template_dir), bytecode_cache_dir=str(cache_dir)).precompile()
+    cached_files = sorted(cache_dir.iterdir())
+
+    fresh_manager = TemplateManager(template_dir=str(template_dir), bytecode_cache_dir=str(cache_dir))
+    assert len(cached_files) == 2  # noqa: PLR2004
+    assert fresh_manager.templates.get_template("page.html").render() == "<p>42</p>"
+    assert sorted(cache_dir.iterdir()) == cached_files
+
+
+def test_auto_reload_can_be_disabled(tmp_path: Path) -> None:
+    """Test that production managers do not check template files for changes."""
+    manager = TemplateManager(template_dir=str(make_template_dir(tmp_path)), auto_reload=False)
+
+    assert manager.templates.env.auto_reload is False
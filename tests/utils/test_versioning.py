@@ -0,0 +1,65 @@
+from datetime import UTC
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+
+from app.core.templates.templating import TemplateManager
+from app.core.utils import build_info
+from app.core.utils.versioning import get_git_revision
+from app.core.utils.versioning import get_version_from_pyproject
+from app.core.utils.versioning import resolve_build_info
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+def make_git_dir(tmp_path: Path, packed: bool = False) -> Path:
+    """Creates the parts of a `.git` directory that describe the checked-out commit."""
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    if packed:
+        (git_dir / "packed-refs").write_text(f"# pack-refs with: peeled\n{COMMIT} refs/heads/main\n")
+    else:
+        (git_dir / "refs" / "heads" / "main").write_text(f"{COMMIT}\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_git_revision_is_read_from_the_working_tree(tmp_path: Path, packed: bool) -> None:
+    """Test that the checked-out commit is found in loose and packed refs."""
+    assert get_git_revision(make_git_dir(tmp_path, packed=packed)) == COMMIT
+
+
+def test_git_revision_outside_a_working_tree(tmp_path: Path) -> None:
+    """Test that a missing `.git` directory results in no revision instead of an error."""
+    assert get_git_revision(tmp_path) is None
+
+
+def test_build_info_falls_back_to_pyproject(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that the pyproject version and the configured build values are used when the package is not installed."""
+
+    def not_installed(name: str) -> str:
+        raise metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr("app.core.utils.versioning.metadata.version", not_installed)
+
+    info = resolve_build_info(revision="abc123", built_at="2024-05-01T12:00:00", repo_dir=tmp_path)
+
+    assert info.version == get_version_from_pyproject()
+    assert info.revision == "abc123"
+    assert info.built_at == datetime(2024, 5, 1, 12, tzinfo=UTC)
+    assert resolve_build_info(repo_dir=tmp_path).revision == "unknown"
+
+
+def test_version_is_not_read_from_disk_when_rendering(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that templates get the version resolved at startup."""
+
+    def read_pyproject() -> str:
+        raise AssertionError("pyproject.toml must not be read on the request path")
+
+    monkeypatch.setattr("app.core.utils.versioning.get_version_from_pyproject", read_pyproject)
+
+    assert TemplateManager.get_version("v") == f"v{build_info.version}"
+    assert TemplateManager.static("css/missing.css").endswith(f"?v={build_info.version}")